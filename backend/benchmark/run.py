@@ -15,6 +15,7 @@ from typing import Any, Literal
 
 from src.core.config import settings
 from src.services.menu import (
+    merge_grouped_context_into_dishes,
     normalize_text_bbox_dip,
     process_dip_paragraph_results,
     process_dip_results,
@@ -24,16 +25,23 @@ from src.services.menu import (
 )
 from src.services.ocr.build_paragraph import _group_with_llm, build_paragraph
 from src.services.ocr.layout_grouping_experiment import (
+    build_and_wash_layout_combined,
+    build_layout_wash_lines,
     build_paragraph_layout_experiment,
+    wash_layout_lines,
 )
 from src.services.ocr.line_grouping import build_line_features, heuristic_group_lines
 
-StrategyName = Literal["heuristic", "hybrid", "llm", "layout_llm"]
+StrategyName = Literal[
+    "heuristic", "hybrid", "llm", "layout_llm", "layout_wash", "layout_combined"
+]
 SUPPORTED_STRATEGIES: tuple[StrategyName, ...] = (
     "heuristic",
     "hybrid",
     "llm",
     "layout_llm",
+    "layout_wash",
+    "layout_combined",
 )
 SUPPORTED_REASONING_EFFORTS = ("none", "minimal", "low", "medium", "high")
 
@@ -210,6 +218,9 @@ async def _run_strategy(
     group_list: list[list[int]] = []
     paragraph_lines: list[dict] = []
     individual_lines: list[dict] = strategy_input
+    # Only the washed strategies split price lines out; final extraction attaches
+    # them to the nearest dish the same way for both.
+    price_lines: list[dict] = []
 
     status = "ok"
     error_message: str | None = None
@@ -265,6 +276,62 @@ async def _run_strategy(
                 notes.append(str(grouping_debug.get("mode", "layout_llm")))
             finally:
                 settings.MENU_GROUPING_TIMEOUT_SECONDS = previous_timeout
+        elif strategy == "layout_wash":
+            # Two-call baseline for layout_combined: grouping, then a separate wash.
+            previous_timeouts = (
+                settings.MENU_GROUPING_TIMEOUT_SECONDS,
+                settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS,
+            )
+            settings.MENU_GROUPING_TIMEOUT_SECONDS = forced_llm_timeout_seconds
+            settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS = forced_llm_timeout_seconds
+            try:
+                (
+                    grouped_paragraphs,
+                    grouped_individual_lines,
+                    grouping_debug,
+                ) = await build_paragraph_layout_experiment(strategy_input)
+                (
+                    individual_lines,
+                    price_lines,
+                    paragraph_lines,
+                    discarded_lines,
+                    wash_debug,
+                ) = await wash_layout_lines(
+                    build_layout_wash_lines(grouped_paragraphs, grouped_individual_lines)
+                )
+                group_list = [
+                    sorted({int(idx) for idx in group if isinstance(idx, int)})
+                    for group in grouping_debug.get("groupedSourceLineGroups", [])
+                    if group
+                ]
+                notes.append(str(grouping_debug.get("mode", "layout_llm")))
+                notes.append(str(wash_debug.get("mode", "wash_llm")))
+                notes.append(f"discarded={len(discarded_lines)}")
+            finally:
+                (
+                    settings.MENU_GROUPING_TIMEOUT_SECONDS,
+                    settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS,
+                ) = previous_timeouts
+        elif strategy == "layout_combined":
+            previous_timeout = settings.MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS
+            settings.MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS = forced_llm_timeout_seconds
+            try:
+                (
+                    individual_lines,
+                    price_lines,
+                    paragraph_lines,
+                    discarded_lines,
+                    grouping_debug,
+                ) = await build_and_wash_layout_combined(strategy_input)
+                group_list = [
+                    sorted({int(idx) for idx in group if isinstance(idx, int)})
+                    for group in grouping_debug.get("groupedSourceLineGroups", [])
+                    if group
+                ]
+                notes.append(str(grouping_debug.get("mode", "combined_llm")))
+                notes.append(f"discarded={len(discarded_lines)}")
+            finally:
+                settings.MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS = previous_timeout
         else:
             raise ValueError(f"Unsupported strategy: {strategy}")
     except TimeoutError:
@@ -273,12 +340,14 @@ async def _run_strategy(
         error_message = "Grouping timed out"
         paragraph_lines = []
         individual_lines = strategy_input
+        price_lines = []
         group_list = []
     except Exception as exc:  # defensive
         status = "error"
         error_message = f"{type(exc).__name__}: {exc}"
         paragraph_lines = []
         individual_lines = strategy_input
+        price_lines = []
         group_list = []
 
     latency_ms = round((time.perf_counter() - started) * 1000, 3)
@@ -306,6 +375,17 @@ async def _run_strategy(
                 dish_boxes = normalize_text_bbox_dip(
                     processed_width, processed_height, individual_lines
                 )
+                if price_lines:
+                    dish_info, dish_boxes = merge_grouped_context_into_dishes(
+                        dish_info,
+                        dish_boxes,
+                        [],
+                        [],
+                        price_lines=price_lines,
+                        price_boxes=normalize_text_bbox_dip(
+                            processed_width, processed_height, price_lines
+                        ),
+                    )
                 paragraph_boxes = normalize_text_bbox_dip(
                     processed_width, processed_height, paragraph_lines
                 )
@@ -342,6 +422,7 @@ async def _run_strategy(
         "groups": group_list,
         "paragraphCount": len(paragraph_lines),
         "individualCount": len(individual_lines),
+        "priceLineCount": len(price_lines),
         "paragraphs": [
             {"content": paragraph_lines[idx]["content"], "bbox": paragraph_bboxes[idx]}
             for idx in range(len(paragraph_lines))
@@ -580,6 +661,7 @@ async def run_benchmark(args: argparse.Namespace) -> int:
     previous_threshold = settings.MENU_GROUPING_LLM_LINE_THRESHOLD
     previous_image_max = settings.MENU_IMAGE_ENRICH_MAX_ITEMS
     previous_reasoning_effort = settings.MENU_GROUPING_LLM_REASONING_EFFORT
+    previous_dish_info_mode = settings.MENU_DISH_INFO_MODE
     selected_reasoning_effort = args.llm_reasoning_effort.strip().lower()
     settings.MENU_GROUPING_TIMEOUT_SECONDS = args.hybrid_timeout_seconds
     settings.MENU_GROUPING_LLM_LINE_THRESHOLD = args.llm_line_threshold
@@ -587,6 +669,7 @@ async def run_benchmark(args: argparse.Namespace) -> int:
     settings.MENU_GROUPING_LLM_REASONING_EFFORT = (
         "" if selected_reasoning_effort == "none" else selected_reasoning_effort
     )
+    settings.MENU_DISH_INFO_MODE = args.dish_info_mode
 
     started = time.perf_counter()
     case_reports: list[dict[str, Any]] = []
@@ -608,6 +691,7 @@ async def run_benchmark(args: argparse.Namespace) -> int:
         settings.MENU_GROUPING_LLM_LINE_THRESHOLD = previous_threshold
         settings.MENU_IMAGE_ENRICH_MAX_ITEMS = previous_image_max
         settings.MENU_GROUPING_LLM_REASONING_EFFORT = previous_reasoning_effort
+        settings.MENU_DISH_INFO_MODE = previous_dish_info_mode
 
     summary_stats = _summarize_run(case_reports, strategies)
     finished_at = datetime.now(UTC)
@@ -646,6 +730,7 @@ async def run_benchmark(args: argparse.Namespace) -> int:
             "finalMaxLines": args.final_max_lines,
             "imageEnrichMaxItems": args.image_enrich_max_items,
             "llmReasoningEffort": selected_reasoning_effort,
+            "dishInfoMode": args.dish_info_mode,
         },
     )
     _write_json(run_dir / "summary.json", summary)
@@ -715,6 +800,12 @@ def parse_args() -> argparse.Namespace:
         default=settings.MENU_IMAGE_ENRICH_MAX_ITEMS,
         help="Image enrichment max items override during benchmark",
     )
+    parser.add_argument(
+        "--dish-info-mode",
+        choices=["per_item", "batched"],
+        default=settings.MENU_DISH_INFO_MODE,
+        help="Dish info extraction mode used by --include-final-results",
+    )
     return parser.parse_args()
 
 
@@ -0,0 +1,22 @@
+-- Schema the dish image write-behind (src/services/dish_image_writer.py) expects.
+-- Safe to re-run. Remove duplicate dish_name rows before adding the constraint.
+
+alter table public.dish
+    add column if not exists refreshed_at timestamptz;
+
+do $$
+begin
+    if not exists (
+        select 1
+        from pg_constraint
+        where conname = 'dish_dish_name_key'
+          and conrelid = 'public.dish'::regclass
+    ) then
+        alter table public.dish
+            add constraint dish_dish_name_key unique (dish_name);
+    end if;
+end
+$$;
+
+-- Let PostgREST pick up the new column without a restart.
+notify pgrst, 'reload schema';
@@ -0,0 +1,60 @@
+import argparse
+import time
+
+import jwt
+
+from src.api import deps
+from src.core.config import settings
+from src.core.security import ALGORITHM
+
+
+def _token() -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "role": "authenticated",
+            "aud": "authenticated",
+            "user_metadata": {"user_role": "free"},
+            "iat": now,
+            "exp": now + 3600,
+            "sub": "benchmark-user",
+        },
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def _best_of(authorization: str, requests: int, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(requests):
+            deps.get_user(authorization)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark request auth overhead"
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    authorization = f"Bearer {_token()}"
+    per_request = 1e6 / args.requests
+
+    settings.AUTH_TOKEN_CACHE_ENABLED = False
+    uncached = _best_of(authorization, args.requests, args.repeats)
+    settings.AUTH_TOKEN_CACHE_ENABLED = True
+    cached = _best_of(authorization, args.requests, args.repeats)
+
+    print("variant,us_per_request")
+    print(f"verify_every_request,{uncached * per_request:.2f}")
+    print(f"verified_token_cache,{cached * per_request:.2f}")
+    print(f"hit_rate,{deps.get_verified_user_cache().stats()['hitRate']}")
+
+
+if __name__ == "__main__":
+    main()
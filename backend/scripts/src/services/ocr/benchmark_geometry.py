@@ -0,0 +1,109 @@
+import argparse
+import random
+import time
+
+from src.services.menu import normalize_text_bbox_dip
+from src.services.ocr.layout_grouping_experiment import (
+    _build_layout_line_wash_payload,
+    build_layout_segments,
+)
+from src.services.ocr.geometry import polygon_bounds
+from src.services.ocr.line_grouping import build_line_features
+
+IMG_WIDTH = 2000
+IMG_HEIGHT = 2800
+
+
+def _synthetic_lines(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    lines = []
+    for idx in range(count):
+        column = idx % 2
+        x = 40 + column * 980 + rng.uniform(0, 20)
+        y = 30 + (idx // 2) * (IMG_HEIGHT / max(1, count // 2)) + rng.uniform(0, 3)
+        width = rng.uniform(120, 860)
+        height = rng.uniform(18, 32)
+        lines.append(
+            {
+                "content": f"Dish {idx} - {rng.randint(3, 40)}.{rng.randint(0, 99):02d}",
+                "polygon": {
+                    "x_coords": [x, x + width, x + width, x],
+                    "y_coords": [y, y, y + height, y + height],
+                },
+            }
+        )
+    return lines
+
+
+def _legacy_geometry(lines: list[dict]) -> list[tuple[float, float, float, float]]:
+    # Pre-vectorization shape of each consumer: a max scan, then per-line float
+    # conversion and min/max before normalizing.
+    max_x = 1.0
+    max_y = 1.0
+    for line in lines:
+        polygon = line["polygon"]
+        max_x = max(max_x, float(max(polygon["x_coords"])))
+        max_y = max(max_y, float(max(polygon["y_coords"])))
+
+    normalized = []
+    for line in lines:
+        raw_x = [float(value) for value in line["polygon"]["x_coords"]]
+        raw_y = [float(value) for value in line["polygon"]["y_coords"]]
+        normalized.append(
+            (
+                min(raw_x) / max_x,
+                max(raw_x) / max_x,
+                min(raw_y) / max_y,
+                max(raw_y) / max_y,
+            )
+        )
+    return normalized
+
+
+def _vectorized_geometry(lines: list[dict]) -> tuple[list[float], ...]:
+    bounds = polygon_bounds(lines)
+    bounds = bounds.scaled(*bounds.page_extent())
+    return (
+        bounds.x_min.tolist(),
+        bounds.x_max.tolist(),
+        bounds.y_min.tolist(),
+        bounds.y_max.tolist(),
+    )
+
+
+def _consumers(lines: list[dict]) -> None:
+    build_line_features(lines)
+    normalize_text_bbox_dip(IMG_WIDTH, IMG_HEIGHT, lines)
+    build_layout_segments(lines)
+    _build_layout_line_wash_payload(lines)
+
+
+def _best_of(fn, lines: list[dict], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(lines)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark OCR line geometry")
+    parser.add_argument("--sizes", default="50,200,500,1000,2000")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    print("lines,legacy_geometry_ms,vectorized_geometry_ms,speedup,all_consumers_ms")
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        lines = _synthetic_lines(size, seed=size)
+        legacy = _best_of(_legacy_geometry, lines, args.repeats)
+        vectorized = _best_of(_vectorized_geometry, lines, args.repeats)
+        consumers = _best_of(_consumers, lines, args.repeats)
+        print(
+            f"{size},{legacy * 1000:.3f},{vectorized * 1000:.3f},"
+            f"{legacy / vectorized:.1f}x,{consumers * 1000:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
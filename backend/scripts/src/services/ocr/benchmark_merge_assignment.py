@@ -0,0 +1,116 @@
+import argparse
+import random
+import time
+
+from src.core.config import settings
+from src.services.menu import merge_grouped_context_into_dishes
+
+
+def _synthetic_menu(dish_count: int, columns: int, seed: int) -> tuple[list, ...]:
+    rng = random.Random(seed)
+    rows = max(1, dish_count // columns)
+    row_height = 0.95 / rows
+    dish_info, dish_boxes = [], []
+    paragraph_info, paragraph_boxes = [], []
+    price_lines, price_boxes = [], []
+    for idx in range(dish_count):
+        column, row = idx % columns, idx // columns
+        x = column / columns + rng.uniform(0, 0.01)
+        y = row * row_height + rng.uniform(0, row_height * 0.05)
+        width = 0.6 / columns
+        dish_info.append({"text": f"Dish {idx}"})
+        dish_boxes.append({"x": x, "y": y, "w": width, "h": row_height * 0.3})
+        paragraph_info.append({"description": f"Description for dish {idx}"})
+        paragraph_boxes.append(
+            {
+                "x": x,
+                "y": y + row_height * 0.35,
+                "w": width * 1.2,
+                "h": row_height * 0.3,
+            }
+        )
+        price_lines.append(
+            {"content": f"${rng.randint(3, 40)}.{rng.randint(0, 99):02d}"}
+        )
+        price_boxes.append(
+            {"x": x + width * 1.3, "y": y, "w": 0.15 / columns, "h": row_height * 0.3}
+        )
+    return (
+        dish_info,
+        dish_boxes,
+        paragraph_info,
+        paragraph_boxes,
+        price_lines,
+        price_boxes,
+    )
+
+
+def _legacy_scan(dish_boxes: list, paragraph_boxes: list, price_boxes: list) -> None:
+    # Pre-index shape of the merge: every context box scored against every dish box.
+    for context_box in [*paragraph_boxes, *price_boxes]:
+        context_cx = context_box["x"] + context_box["w"] / 2.0
+        context_cy = context_box["y"] + context_box["h"] / 2.0
+        best = float("inf")
+        for dish_box in dish_boxes:
+            dish_cx = dish_box["x"] + dish_box["w"] / 2.0
+            dish_cy = dish_box["y"] + dish_box["h"] / 2.0
+            overlap = max(
+                0.0,
+                min(dish_box["x"] + dish_box["w"], context_box["x"] + context_box["w"])
+                - max(dish_box["x"], context_box["x"]),
+            )
+            ratio = overlap / max(1e-6, min(dish_box["w"], context_box["w"]))
+            score = (
+                abs(context_cy - dish_cy) * 1.8
+                + abs(context_cx - dish_cx) * 0.9
+                + (1.0 - ratio) * 0.6
+            )
+            best = min(best, score)
+
+
+def _best_of(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark grouped context merge"
+    )
+    parser.add_argument("--sizes", default="20,100,300,600")
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print("dishes,legacy_scan_ms,greedy_ms,optimal_ms")
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        info, boxes, par_info, par_boxes, prices, price_boxes = _synthetic_menu(
+            size, args.columns, seed=size
+        )
+
+        def merge() -> None:
+            merge_grouped_context_into_dishes(
+                info,
+                boxes,
+                par_info,
+                par_boxes,
+                price_lines=prices,
+                price_boxes=price_boxes,
+            )
+
+        legacy = _best_of(
+            lambda: _legacy_scan(boxes, par_boxes, price_boxes), args.repeats
+        )
+        settings.MENU_MERGE_ASSIGNMENT_MODE = "greedy"
+        greedy = _best_of(merge, args.repeats)
+        settings.MENU_MERGE_ASSIGNMENT_MODE = "optimal"
+        optimal = _best_of(merge, args.repeats)
+        print(f"{size},{legacy * 1000:.3f},{greedy * 1000:.3f},{optimal * 1000:.3f}")
+
+
+if __name__ == "__main__":
+    main()
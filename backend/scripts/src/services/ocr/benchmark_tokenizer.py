@@ -0,0 +1,142 @@
+import argparse
+import random
+import re
+import time
+
+from src.services.ocr.tokenizer import (
+    PRICE_NUMBER_PATTERN,
+    PRICE_TOKEN_PATTERN,
+    SEGMENT_DELIMITER_PATTERN,
+    tokenize_line,
+)
+
+# Pre-tokenizer shape of the call sites: each stage compiled its own patterns and
+# re-scanned the line for the piece it needed.
+_LEGACY_PRICE_ONLY = re.compile(rf"^\s*{PRICE_TOKEN_PATTERN}\s*$", re.IGNORECASE)
+_LEGACY_TRAILING_CAPTURE = re.compile(
+    rf"(?:[-–—:]\s*)?({PRICE_TOKEN_PATTERN})\s*$", re.IGNORECASE
+)
+_LEGACY_GROUPING_TRAILING = re.compile(
+    rf"[-–—]\s*(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?円)?\s*$"
+)
+_LEGACY_NUMERIC_TOKEN = re.compile(PRICE_NUMBER_PATTERN)
+_LEGACY_STRICT_TRAILING = re.compile(
+    rf"[-–—:]\s*{PRICE_TOKEN_PATTERN}\s*$", re.IGNORECASE
+)
+_LEGACY_LOOSE_TRAILING = re.compile(rf"\s+({PRICE_TOKEN_PATTERN})\s*$", re.IGNORECASE)
+_LEGACY_PRICE_TOKEN = re.compile(PRICE_TOKEN_PATTERN, re.IGNORECASE)
+_LEGACY_DELIMITER = re.compile(SEGMENT_DELIMITER_PATTERN)
+
+WORDS = [
+    "Pad",
+    "Thai",
+    "Green",
+    "Curry",
+    "with",
+    "jasmine",
+    "rice",
+    "served",
+    "fresh",
+    "(vg)",
+]
+PRICES = ["12.50", "$8", "1,200円", "9 usd", "€ 14,90"]
+
+
+def _synthetic_lines(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+        shape = rng.random()
+        if shape < 0.3:
+            lines.append(words)
+        elif shape < 0.6:
+            lines.append(f"{words} - {rng.choice(PRICES)}")
+        elif shape < 0.75:
+            lines.append(rng.choice(PRICES))
+        elif shape < 0.9:
+            lines.append(f"{words} {rng.choice(PRICES)} | {words} {rng.choice(PRICES)}")
+        else:
+            lines.append(f"{words}; {words}")
+    return lines
+
+
+def _legacy_line(text: str) -> None:
+    stripped = text.strip()
+    # menu price token + clean_dish_name
+    if not _LEGACY_PRICE_ONLY.fullmatch(stripped):
+        _LEGACY_TRAILING_CAPTURE.search(stripped)
+    cleaned = re.sub(
+        r"[-–—:]\s*(?:[$€£¥]\s*)?\d+(?:[.,]\d+)?(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?",
+        "",
+        text,
+        flags=re.IGNORECASE,
+    )
+    cleaned = re.sub(r"\(\s*vg\s*\)", "", cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(
+        r"\s*(?:[$€£¥]\s*\d+(?:[.,]\d+)?|\d+[.,]\d+|\d+\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))",
+        "",
+        cleaned,
+        flags=re.IGNORECASE,
+    )
+    re.sub(r"\s+", " ", cleaned).strip()
+    # line grouping features
+    re.sub(r"[\s$€£¥.,\-–—:]", "", stripped).lower()
+    if not _LEGACY_PRICE_ONLY.fullmatch(
+        stripped
+    ) and not _LEGACY_GROUPING_TRAILING.search(stripped):
+        _LEGACY_NUMERIC_TOKEN.findall(stripped)
+    # layout segments
+    for chunk in _LEGACY_DELIMITER.split(stripped):
+        if len(_LEGACY_PRICE_TOKEN.findall(chunk)) < 2:
+            if not _LEGACY_STRICT_TRAILING.search(chunk):
+                _LEGACY_LOOSE_TRAILING.search(chunk)
+        _LEGACY_PRICE_ONLY.fullmatch(chunk)
+
+
+def _legacy(lines: list[str]) -> None:
+    for line in lines:
+        _legacy_line(line)
+
+
+def _tokenizer_cold(lines: list[str]) -> None:
+    tokenize_line.cache_clear()
+    for line in lines:
+        tokenize_line(line)
+
+
+def _tokenizer_warm(lines: list[str]) -> None:
+    for line in lines:
+        tokenize_line(line)
+
+
+def _best_of(fn, lines: list[str], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(lines)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark menu line tokenization"
+    )
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    lines = _synthetic_lines(args.lines, seed=args.lines)
+    per_line = 1e6 / len(lines)
+    legacy = _best_of(_legacy, lines, args.repeats)
+    cold = _best_of(_tokenizer_cold, lines, args.repeats)
+    warm = _best_of(_tokenizer_warm, lines, args.repeats)
+    print("variant,us_per_line")
+    print(f"legacy_call_sites,{legacy * per_line:.2f}")
+    print(f"tokenizer_first_scan,{cold * per_line:.2f}")
+    print(f"tokenizer_repeat_line,{warm * per_line:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,11 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse
 
-from src.api.deps import get_user
+from src.api.deps import get_user, get_verified_user_cache
 from src.core.config import settings
+from src.core.metrics import metrics
 from src.models import User
+from src.services.menu import get_dip_result_cache, get_dish_info_cache
 
 router = APIRouter(prefix="/debug", tags=["debug"])
 
@@ -126,3 +128,16 @@ async def get_benchmark_case_image(
         raise HTTPException(status_code=404, detail="Image artifact not found")
 
     return FileResponse(path=image_path)
+
+
+@router.get("/metrics")
+async def get_runtime_metrics(_user: User = Depends(get_user)):
+    _ensure_debug_tools_enabled()
+    return {
+        "caches": [
+            get_dip_result_cache().stats(),
+            get_dish_info_cache().stats(),
+            get_verified_user_cache().stats(),
+        ],
+        **metrics.snapshot(),
+    }
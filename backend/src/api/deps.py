@@ -1,23 +1,83 @@
+import hashlib
 import http
+import time
 from functools import lru_cache
+from typing import Any
 
 from fastapi import Header, HTTPException
 
 from src.core.config import settings
+from src.core.metrics import metrics
 from src.core.security import verify_jwt
 from src.menu_engine.analysis import (
     DipAutoGroupAnalysisFlow,
+    DipLayoutCombinedFlow,
     DipLayoutGroupingExperimentFlow,
     DipLinesOnlyAnalysisFlow,
     MenuAnalysisService,
     MenuFlowRegistry,
 )
+from src.menu_engine.contracts import MenuAnalyzeResponseContract
+from src.menu_engine.near_duplicates import NearDuplicateIndex
 from src.menu_engine.recommendations import (
     LLMRecommendationGenerator,
     MenuRecommendationService,
     SupabaseAccessPolicyRepository,
 )
 from src.models import User
+from src.services.cache import LRUCache
+
+
+class VerifiedUserCache:
+    """Users already built from verified bearer tokens, keyed by token digest.
+
+    An entry never outlives the token's `exp`, so a cached token stops being
+    accepted when signature verification would start rejecting it.
+    """
+
+    def __init__(self, max_entries: int, max_ttl_seconds: float):
+        self._max_ttl_seconds = max_ttl_seconds
+        self._entries = LRUCache(max_entries, max_ttl_seconds)
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> User | None:
+        user = self._entries.get(self._digest(token))
+        metrics.increment("auth.token_cache.hits" if user else "auth.token_cache.misses")
+        return user
+
+    def put(self, token: str, user: User) -> None:
+        ttl = min(self._max_ttl_seconds, user.exp - time.time())
+        if ttl > 0:
+            self._entries.set(self._digest(token), user, ttl)
+
+    def stats(self) -> dict[str, Any]:
+        hits = metrics.counter("auth.token_cache.hits")
+        misses = metrics.counter("auth.token_cache.misses")
+        lookups = hits + misses
+        return {
+            "name": "auth_token",
+            "entries": len(self._entries),
+            "memoryHits": hits,
+            "persistentHits": 0,
+            "misses": misses,
+            "hitRate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+_verified_user_cache: VerifiedUserCache | None = None
+
+
+def get_verified_user_cache() -> VerifiedUserCache:
+    global _verified_user_cache
+    if _verified_user_cache is None:
+        _verified_user_cache = VerifiedUserCache(
+            settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+            settings.AUTH_TOKEN_CACHE_MAX_TTL_SECONDS,
+        )
+    return _verified_user_cache
 
 
 def get_user(authorization: str = Header(..., alias="Authorization")) -> User:
@@ -26,8 +86,15 @@ def get_user(authorization: str = Header(..., alias="Authorization")) -> User:
         if not authorization.startswith(prefix):
             raise ValueError("Invalid authorization header")
         token = authorization[len(prefix):]
-        payload = verify_jwt(token)
-        return User(**payload)
+        if not settings.AUTH_TOKEN_CACHE_ENABLED:
+            return User(**verify_jwt(token))
+
+        user_cache = get_verified_user_cache()
+        if (user := user_cache.get(token)) is not None:
+            return user
+        user = User(**verify_jwt(token))
+        user_cache.put(token, user)
+        return user
     except Exception:
         raise HTTPException(status_code=http.HTTPStatus.UNAUTHORIZED)
 
@@ -55,6 +122,7 @@ def get_menu_flow_registry() -> MenuFlowRegistry:
         DipAutoGroupAnalysisFlow.descriptor.id: DipAutoGroupAnalysisFlow(),
         DipLinesOnlyAnalysisFlow.descriptor.id: DipLinesOnlyAnalysisFlow(),
         DipLayoutGroupingExperimentFlow.descriptor.id: DipLayoutGroupingExperimentFlow(),
+        DipLayoutCombinedFlow.descriptor.id: DipLayoutCombinedFlow(),
     }
 
     enabled_flow_ids = _parse_csv(settings.MENU_ENABLED_FLOW_IDS)
@@ -78,8 +146,24 @@ def get_menu_flow_registry() -> MenuFlowRegistry:
     )
 
 
+@lru_cache
+def get_near_duplicate_index() -> NearDuplicateIndex[MenuAnalyzeResponseContract]:
+    return NearDuplicateIndex(
+        max_entries=settings.MENU_NEAR_DUPLICATE_MAX_ENTRIES,
+        max_distance=settings.MENU_NEAR_DUPLICATE_MAX_DISTANCE,
+        ttl_seconds=settings.MENU_NEAR_DUPLICATE_TTL_SECONDS,
+    )
+
+
 def get_menu_analysis_service() -> MenuAnalysisService:
-    return MenuAnalysisService(flow_registry=get_menu_flow_registry())
+    return MenuAnalysisService(
+        flow_registry=get_menu_flow_registry(),
+        near_duplicate_index=get_near_duplicate_index()
+        if settings.MENU_NEAR_DUPLICATE_ENABLED
+        else None,
+        deadline_seconds=settings.MENU_ANALYZE_DEADLINE_SECONDS,
+        max_deadline_seconds=settings.MENU_ANALYZE_MAX_DEADLINE_SECONDS,
+    )
 
 
 @lru_cache
@@ -2,6 +2,7 @@ import http
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 
 from src.api.deps import (
     get_menu_analysis_service,
@@ -17,9 +18,56 @@ from src.menu_engine.contracts import (
 )
 from src.menu_engine.recommendations import MenuRecommendationService
 from src.models import User
+from src.services.deadline import parse_deadline_header
+from src.services.exceptions import PreprocessingBusyError
+from src.services.image_pool import ImagePreprocessPool
 
 router = APIRouter(prefix="/menu", tags=["menu"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    if not file or not file.filename:
+        raise HTTPException(
+            status_code=http.HTTPStatus.BAD_REQUEST, detail="No file uploaded"
+        )
+
+    image = await file.read()
+    if not image:
+        raise HTTPException(
+            status_code=http.HTTPStatus.BAD_REQUEST, detail="Uploaded file is empty"
+        )
+    return image
+
+
+def _preprocessing_busy_error() -> HTTPException:
+    return HTTPException(
+        status_code=http.HTTPStatus.SERVICE_UNAVAILABLE,
+        detail="Image preprocessing is busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _parse_deadline(raw_value: str | None) -> float | None:
+    try:
+        return parse_deadline_header(raw_value)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=http.HTTPStatus.BAD_REQUEST,
+            detail="X-Request-Deadline must be a positive number of seconds",
+        ) from exc
+
+
+def _unknown_flow_error(exc: FlowNotFoundError) -> HTTPException:
+    return HTTPException(
+        status_code=http.HTTPStatus.BAD_REQUEST,
+        detail={
+            "message": f"Unknown flow '{exc.requested_flow}'",
+            "availableFlows": exc.available_flow_ids,
+        },
+    )
+
 
 @router.post(
     "/analyze",
@@ -32,33 +80,60 @@ async def analyze_menu(
     accept_language: Annotated[str | None, Header(alias="Accept-Language")] = None,
     flow_id_query: Annotated[str | None, Query(alias="flowId")] = None,
     flow_id_header: Annotated[str | None, Header(alias="X-Menu-Flow")] = None,
+    deadline_header: Annotated[str | None, Header(alias="X-Request-Deadline")] = None,
     menu_analysis_service: MenuAnalysisService = Depends(get_menu_analysis_service),
 ):
-    if not file or not file.filename:
-        raise HTTPException(
-            status_code=http.HTTPStatus.BAD_REQUEST, detail="No file uploaded"
-        )
+    deadline_seconds = _parse_deadline(deadline_header)
+    image = await _read_upload(file)
 
-    image = await file.read()
-    if not image:
-        raise HTTPException(
-            status_code=http.HTTPStatus.BAD_REQUEST, detail="Uploaded file is empty"
+    try:
+        return await menu_analysis_service.analyze(
+            image=image,
+            accept_language=accept_language,
+            flow_hint=flow_id_query or flow_id_header,
+            deadline_seconds=deadline_seconds,
         )
+    except FlowNotFoundError as exc:
+        raise _unknown_flow_error(exc) from exc
+    except PreprocessingBusyError as exc:
+        raise _preprocessing_busy_error() from exc
+
+
+@router.post(
+    "/analyze/stream",
+    status_code=http.HTTPStatus.OK,
+    response_class=StreamingResponse,
+)
+async def analyze_menu_stream(
+    file: UploadFile,
+    _user: User = Depends(get_user),
+    accept_language: Annotated[str | None, Header(alias="Accept-Language")] = None,
+    flow_id_query: Annotated[str | None, Query(alias="flowId")] = None,
+    flow_id_header: Annotated[str | None, Header(alias="X-Menu-Flow")] = None,
+    deadline_header: Annotated[str | None, Header(alias="X-Request-Deadline")] = None,
+    menu_analysis_service: MenuAnalysisService = Depends(get_menu_analysis_service),
+):
+    deadline_seconds = _parse_deadline(deadline_header)
+    image = await _read_upload(file)
+    if not ImagePreprocessPool.has_capacity():
+        # Reject before the stream starts; once it has, failures become error events.
+        raise _preprocessing_busy_error()
 
     try:
-        return await menu_analysis_service.analyze(
+        events = menu_analysis_service.analyze_stream(
             image=image,
             accept_language=accept_language,
             flow_hint=flow_id_query or flow_id_header,
+            deadline_seconds=deadline_seconds,
         )
     except FlowNotFoundError as exc:
-        raise HTTPException(
-            status_code=http.HTTPStatus.BAD_REQUEST,
-            detail={
-                "message": f"Unknown flow '{exc.requested_flow}'",
-                "availableFlows": exc.available_flow_ids,
-            },
-        ) from exc
+        raise _unknown_flow_error(exc) from exc
+
+    async def _ndjson_lines():
+        async for event in events:
+            yield event.model_dump_json(by_alias=True) + "\n"
+
+    return StreamingResponse(_ndjson_lines(), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.get(
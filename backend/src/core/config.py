@@ -25,6 +25,13 @@ class Settings(BaseSettings):
     OPENAI_REASONING_EFFORT: str = "minimal"
     AZURE_DIP_API_KEY: str
     AZURE_DIP_BASE_URL: str
+    DIP_RESULT_TIMEOUT_SECONDS: float = 30
+    DIP_POLL_INITIAL_ESTIMATE_SECONDS: float = 1.5
+    DIP_POLL_FIRST_POLL_RATIO: float = 0.7
+    DIP_POLL_MIN_INTERVAL_SECONDS: float = 0.2
+    DIP_POLL_MAX_INTERVAL_SECONDS: float = 2.0
+    DIP_POLL_BACKOFF_FACTOR: float = 1.6
+    DIP_POLL_HONOR_RETRY_AFTER: bool = True
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = []
@@ -38,26 +45,114 @@ class Settings(BaseSettings):
     FATSECRET_CLIENT_ID: str
     FATSECRET_CLIENT_SECRET: str
     FATSECRET_BASE_URL: str
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 60
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 10
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 50
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30
+    HTTP_CLIENT_HTTP2: bool = True
+    HTTP_CLIENT_VENDOR_LIMITS: str = "azure_dip=20,google_search=30,fatsecret=10"
+    LLM_TIMEOUT_SECONDS: float = 60
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 10
+    LLM_MAX_RETRIES: int = 2
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60
+    LLM_HTTP2: bool = True
+    AUTH_TOKEN_CACHE_ENABLED: bool = True
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_TOKEN_CACHE_MAX_TTL_SECONDS: int = 300
+    USER_ACCESS_USAGE_MODE: str = "records"
+    USER_ACCESS_POLICY_CACHE_TTL_SECONDS: int = 60
+    USER_ACCESS_USAGE_CACHE_TTL_SECONDS: int = 30
+    USER_ACCESS_CACHE_MAX_ENTRIES: int = 10000
     MENU_DEFAULT_FLOW_ID: str = "dip.auto_group.v1"
     MENU_ENABLED_FLOW_IDS: str = (
-        "dip.auto_group.v1,dip.lines_only.v1,dip.layout_segments_llm.v1"
+        "dip.auto_group.v1,dip.lines_only.v1,dip.layout_segments_llm.v1,"
+        "dip.layout_segments_combined_llm.v1"
     )
     MENU_FLOW_ALIASES: str = (
         "default=dip.auto_group.v1,legacy=dip.auto_group.v1,fast=dip.lines_only.v1,"
-        "layoutexp=dip.layout_segments_llm.v1"
+        "layoutexp=dip.layout_segments_llm.v1,"
+        "layoutcombined=dip.layout_segments_combined_llm.v1"
     )
     MENU_GROUPING_TIMEOUT_SECONDS: int = 8
+    MENU_ANALYZE_DEADLINE_SECONDS: float = 45
+    MENU_ANALYZE_MAX_DEADLINE_SECONDS: float = 120
     MENU_GROUPING_LLM_LINE_THRESHOLD: int = 40
     MENU_GROUPING_LLM_REASONING_EFFORT: str = "minimal"
+    MENU_GROUPING_MEMO_ENABLED: bool = True
+    MENU_GROUPING_MEMO_MAX_ENTRIES: int = 1000
+    MENU_GROUPING_MEMO_TTL_SECONDS: int = 7 * 24 * 3600
+    MENU_GROUPING_MEMO_BACKEND: str = "memory"
+    MENU_GROUPING_MEMO_PATH: str = "cache/grouping_memo.sqlite3"
+    MENU_GROUPING_MEMO_TABLE: str = "grouping_memo_cache"
+    MENU_GROUPING_MEMO_BBOX_PRECISION: int = 3
     MENU_LAYOUT_GROUPING_LLM_MODEL: str = "gpt-5-mini"
     MENU_LAYOUT_WASH_TIMEOUT_SECONDS: int = 25
+    MENU_LAYOUT_WASH_OVERLAP: bool = False
+    MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS: int = 25
     MENU_LAYOUT_ENABLE_HEURISTIC_FALLBACK: bool = False
+    MENU_MERGE_ASSIGNMENT_MODE: str = "greedy"
     MENU_DISH_INFO_LLM_MODEL: str = "gpt-5-mini"
     MENU_DISH_INFO_LLM_TEMPERATURE: float = 0
+    MENU_DISH_INFO_MODE: str = "per_item"
+    MENU_DISH_INFO_BATCH_TOKEN_BUDGET: int = 2400
+    MENU_DISH_INFO_BATCH_MAX_ITEMS: int = 25
+    MENU_DISH_INFO_CACHE_ENABLED: bool = True
+    MENU_DISH_INFO_CACHE_MAX_ENTRIES: int = 5000
+    MENU_DISH_INFO_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    MENU_DISH_INFO_CACHE_NEGATIVE_TTL_SECONDS: int = 24 * 3600
+    MENU_DISH_INFO_CACHE_BACKEND: str = "memory"
+    MENU_DISH_INFO_CACHE_PATH: str = "cache/dish_info.sqlite3"
+    MENU_DISH_INFO_CACHE_TABLE: str = "dish_info_cache"
+    MENU_TRANSLATION_MODE: str = "per_item"
+    MENU_TRANSLATION_BATCH_MAX_ITEMS: int = 40
+    MENU_TRANSLATION_CACHE_ENABLED: bool = True
+    MENU_TRANSLATION_CACHE_MAX_ENTRIES: int = 5000
+    MENU_TRANSLATION_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    MENU_TRANSLATION_CACHE_BACKEND: str = "memory"
+    MENU_TRANSLATION_CACHE_PATH: str = "cache/translation.sqlite3"
+    MENU_TRANSLATION_CACHE_TABLE: str = "translation_cache"
     MENU_DISH_FANOUT_CONCURRENCY: int = 50
     MENU_DISH_FANOUT_ADAPTIVE: bool = True
     MENU_DISH_FANOUT_MAX_CONCURRENCY: int = 100
+    MENU_DISH_FANOUT_SPECULATIVE: bool = False
+    LLM_LIMITER_MIN_CONCURRENCY: int = 4
+    LLM_LIMITER_DECREASE_FACTOR: float = 0.5
+    LLM_LIMITER_LATENCY_SPIKE_FACTOR: float = 3.0
+    LLM_LIMITER_MAX_RETRIES: int = 3
+    LLM_LIMITER_BACKOFF_BASE_SECONDS: float = 0.5
+    LLM_LIMITER_BACKOFF_MAX_SECONDS: float = 8.0
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGE_PERCENTILE: float = 0.95
+    LLM_HEDGE_WINDOW: int = 200
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 1.0
+    LLM_HEDGE_MAX_RATIO: float = 0.05
     MENU_IMAGE_ENRICH_MAX_ITEMS: int = 30
+    MENU_DISH_IMAGE_CACHE_MAX_ENTRIES: int = 5000
+    MENU_DISH_IMAGE_CACHE_TTL_SECONDS: int = 3600
+    MENU_DISH_IMAGE_CACHE_NEGATIVE_TTL_SECONDS: int = 600
+    MENU_DISH_IMAGE_PREFETCH_CHUNK_SIZE: int = 100
+    MENU_DISH_IMAGE_REFRESH_AFTER_SECONDS: int = 3 * 24 * 3600
+    MENU_DISH_IMAGE_MAX_CONCURRENT_REFRESHES: int = 8
+    MENU_DISH_IMAGE_WRITE_QUEUE_MAX: int = 1000
+    MENU_DISH_IMAGE_WRITE_BATCH_SIZE: int = 100
+    MENU_DISH_IMAGE_WRITE_FLUSH_SECONDS: float = 2.0
+    MENU_DISH_IMAGE_WRITE_DRAIN_TIMEOUT_SECONDS: float = 5.0
+    MENU_NEAR_DUPLICATE_ENABLED: bool = False
+    MENU_NEAR_DUPLICATE_MAX_DISTANCE: int = 6
+    MENU_NEAR_DUPLICATE_MAX_ENTRIES: int = 500
+    MENU_NEAR_DUPLICATE_TTL_SECONDS: int = 24 * 3600
+    IMAGE_PREPROCESS_WORKERS: int = 2
+    IMAGE_PREPROCESS_MAX_QUEUE: int = 8
+    MENU_DIP_CACHE_ENABLED: bool = True
+    MENU_DIP_CACHE_MAX_ENTRIES: int = 256
+    MENU_DIP_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    MENU_DIP_CACHE_BACKEND: str = "memory"
+    MENU_DIP_CACHE_DIR: str = "cache/dip"
+    MENU_DIP_CACHE_TABLE: str = "dip_ocr_cache"
     DEBUG_TOOLS_ENABLED: bool = True
     BENCHMARK_OUTPUT_DIR: str = "benchmark/output"
 
@@ -1,7 +1,7 @@
-import httpx
 from httpx import AsyncClient
 
 from src.core.config import settings
+from src.core.vendors.http.client import HttpClientRegistry, HttpVendor
 from src.core.vendors.fatsecret.oauth import FatSecretOAuth
 from src.core.vendors.utilities.client import logger
 
@@ -30,15 +30,15 @@ class FatSecretClient:
 
     async def search_food(self, query: str):
         access_token = await self.oauth_client.get_access_token()
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                settings.FATSECRET_BASE_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-                data={
-                    "method": "foods.search",
-                    "search_expression": query,
-                    "format": "json",
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        client = HttpClientRegistry.get_client(HttpVendor.FATSECRET)
+        response = await client.post(
+            settings.FATSECRET_BASE_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+            data={
+                "method": "foods.search",
+                "search_expression": query,
+                "format": "json",
+            },
+        )
+        response.raise_for_status()
+        return response.json()
@@ -1,5 +1,5 @@
-import httpx
 from src.core.config import settings
+from src.core.vendors.http.client import HttpClientRegistry, HttpVendor
 from src.core.vendors.fatsecret.token_storage import TokenStorage
 
 
@@ -22,18 +22,18 @@ class FatSecretOAuth:
         return token
 
     async def request_new_token(self) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "scope": "basic",
-                },
-                auth=(self.client_id, self.client_secret),
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            response.raise_for_status()
-            return response.json()["access_token"]
+        client = HttpClientRegistry.get_client(HttpVendor.FATSECRET)
+        response = await client.post(
+            self.token_url,
+            data={
+                "grant_type": "client_credentials",
+                "scope": "basic",
+            },
+            auth=(self.client_id, self.client_secret),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
 
 
 fat_secret_oauth_client = FatSecretOAuth()
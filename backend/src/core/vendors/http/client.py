@@ -0,0 +1,92 @@
+import importlib.util
+from enum import Enum
+
+import httpx
+from httpx import AsyncClient
+from loguru import logger
+
+from src.core.config import settings
+
+
+class HttpVendor(str, Enum):
+    AZURE_DIP = "azure_dip"
+    GOOGLE_SEARCH = "google_search"
+    FATSECRET = "fatsecret"
+
+
+def parse_vendor_limits(raw_value: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for pair in raw_value.split(","):
+        if "=" not in pair:
+            continue
+        vendor, raw_limit = pair.split("=", 1)
+        cleaned_vendor = vendor.strip().lower()
+        try:
+            limit = int(raw_limit.strip())
+        except ValueError:
+            continue
+        if cleaned_vendor and limit > 0:
+            limits[cleaned_vendor] = limit
+    return limits
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """Process-wide pooled httpx clients, one per outbound vendor."""
+
+    _clients: dict[HttpVendor, AsyncClient] = {}
+
+    @classmethod
+    def _build_client(cls, vendor: HttpVendor) -> AsyncClient:
+        vendor_limits = parse_vendor_limits(settings.HTTP_CLIENT_VENDOR_LIMITS)
+        max_connections = vendor_limits.get(
+            vendor.value, settings.HTTP_CLIENT_MAX_CONNECTIONS
+        )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections, settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        timeout = httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+        )
+        http2 = settings.HTTP_CLIENT_HTTP2 and http2_available()
+        if settings.HTTP_CLIENT_HTTP2 and not http2:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+
+        logger.info(
+            "HTTP client initialized vendor={} max_connections={} http2={}",
+            vendor.value,
+            max_connections,
+            http2,
+        )
+        return AsyncClient(limits=limits, timeout=timeout, http2=http2)
+
+    @classmethod
+    async def initialize(cls):
+        for vendor in HttpVendor:
+            cls.get_client(vendor)
+
+    @classmethod
+    def get_client(cls, vendor: HttpVendor) -> AsyncClient:
+        client = cls._clients.get(vendor)
+        if client is None or client.is_closed:
+            client = cls._build_client(vendor)
+            cls._clients[vendor] = client
+        return client
+
+    @classmethod
+    async def close(cls):
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+        if clients:
+            logger.info("HTTP clients closed count={}", len(clients))
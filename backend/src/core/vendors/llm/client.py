@@ -0,0 +1,90 @@
+import httpx
+from httpx import AsyncClient
+from loguru import logger
+from openai import AsyncOpenAI
+
+from src.core.config import settings
+from src.core.vendors.http.client import http2_available
+
+
+class LLMTransport:
+    """Process-wide OpenAI transport shared by every LLM call site.
+
+    The raw `AsyncOpenAI` client and the LangChain chat models all send through
+    one pooled `httpx` client, so the dish fan-out reuses warm connections (and
+    HTTP/2 streams) instead of each caller opening its own pool. Timeouts and
+    retries come from one place. The pool lives for the whole process: the
+    LangChain chains are built at import time and keep a reference to it, so it
+    is not closed in the app lifespan.
+    """
+
+    _http_client: AsyncClient | None = None
+    _openai_client: AsyncOpenAI | None = None
+
+    @classmethod
+    def _build_http_client(cls) -> AsyncClient:
+        max_connections = max(1, settings.LLM_HTTP_MAX_CONNECTIONS)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections, settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        http2 = settings.LLM_HTTP2 and http2_available()
+        if settings.LLM_HTTP2 and not http2:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+
+        logger.info(
+            "LLM HTTP client initialized max_connections={} http2={}",
+            max_connections,
+            http2,
+        )
+        return AsyncClient(limits=limits, timeout=cls.timeout(), http2=http2)
+
+    @classmethod
+    def timeout(cls) -> httpx.Timeout:
+        return httpx.Timeout(
+            settings.LLM_TIMEOUT_SECONDS,
+            connect=settings.LLM_CONNECT_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    def get_http_client(cls) -> AsyncClient:
+        client = cls._http_client
+        if client is None or client.is_closed:
+            client = cls._build_http_client()
+            cls._http_client = client
+            cls._openai_client = None
+        return client
+
+    @classmethod
+    def get_openai_client(cls) -> AsyncOpenAI:
+        http_client = cls.get_http_client()
+        if cls._openai_client is None:
+            cls._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_BASE_URL,
+                http_client=http_client,
+                timeout=cls.timeout(),
+                max_retries=settings.LLM_MAX_RETRIES,
+            )
+        return cls._openai_client
+
+    @classmethod
+    def chat_model_kwargs(cls) -> dict:
+        """Transport options for `ChatOpenAI` so LangChain shares the same pool."""
+        return {
+            "http_async_client": cls.get_http_client(),
+            "timeout": cls.timeout(),
+            "max_retries": settings.LLM_MAX_RETRIES,
+        }
+
+    @classmethod
+    async def close(cls):
+        client = cls._http_client
+        cls._http_client = None
+        cls._openai_client = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.info("LLM HTTP client closed")
@@ -1,7 +1,12 @@
 from loguru import logger
 
-from src.services.utils import build_recommendation_chain, build_search_chain
+from src.services.utils import (
+    build_batch_search_chain,
+    build_recommendation_chain,
+    build_search_chain,
+)
 
 logger = logger
 chain = build_search_chain()
+batch_chain = build_batch_search_chain()
 recommendation_chain = build_recommendation_chain()
@@ -5,14 +5,22 @@ from contextlib import asynccontextmanager
 from src.api import api_router
 from src.core.config import settings
 from src.core.vendors.fatsecret.client import FatSecretClient
+from src.core.vendors.http.client import HttpClientRegistry
 from src.core.vendors.supabase.client import SupabaseClient
+from src.services.dish_image_writer import DishImageWriteBehind
+from src.services.image_pool import ImagePreprocessPool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await SupabaseClient.initialize()
+    await HttpClientRegistry.initialize()
     FatSecretClient()
+    DishImageWriteBehind.start()
     yield
+    await DishImageWriteBehind.close()
+    await HttpClientRegistry.close()
+    ImagePreprocessPool.close()
 
 
 app = FastAPI(lifespan=lifespan)
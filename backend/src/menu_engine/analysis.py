@@ -1,13 +1,23 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, AsyncIterator, Mapping, Protocol, Sequence
 
+from src.core.metrics import metrics
+from src.core.vendors.utilities.client import logger
 from src.menu_engine.contracts import (
     MenuAnalyzeMetaContract,
     MenuAnalyzeResponseContract,
+    MenuAnalyzeStreamEventContract,
     MenuFlowCatalogContract,
     MenuFlowDescriptorContract,
 )
+from src.menu_engine.near_duplicates import NearDuplicateIndex
+from src.menu_engine.streaming import MenuAnalysisStreamRecorder
 from src.services import menu as legacy_menu_service
+from src.services.image_pool import ImagePreprocessPool
+from src.services.deadline import RequestDeadline, request_deadline
+from src.services.image_preprocessing import perceptual_hash
+from src.services.menu import MenuAnalysisListener
 
 
 @dataclass(frozen=True)
@@ -28,6 +38,20 @@ class MenuAnalysisFlow(Protocol):
         ...
 
 
+class StreamingMenuAnalysisFlow(MenuAnalysisFlow, Protocol):
+    """A flow that can report partial results while it runs."""
+
+    supports_streaming: bool
+
+    async def run(
+        self,
+        image: bytes,
+        accept_language: str | None,
+        listener: MenuAnalysisListener | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        ...
+
+
 def resolve_accept_language(accept_language: str | None) -> str:
     if not accept_language:
         return "en"
@@ -45,12 +69,17 @@ class DipAutoGroupAnalysisFlow:
         ),
     )
 
+    supports_streaming = True
+
     async def run(
         self,
         image: bytes,
         accept_language: str | None,
+        listener: MenuAnalysisListener | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        return await legacy_menu_service.analyze_menu_image(image, accept_language)
+        return await legacy_menu_service.analyze_menu_image(
+            image, accept_language, listener=listener
+        )
 
 
 class DipLinesOnlyAnalysisFlow:
@@ -63,25 +92,43 @@ class DipLinesOnlyAnalysisFlow:
         ),
     )
 
+    supports_streaming = True
+
     async def run(
         self,
         image: bytes,
         accept_language: str | None,
+        listener: MenuAnalysisListener | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        processed_image, img_height, img_width = legacy_menu_service.process_image(image)
+        processed_image, img_height, img_width = await legacy_menu_service.preprocess_image(
+            image
+        )
         language = resolve_accept_language(accept_language)
 
         dip_lines = await legacy_menu_service.run_dip(processed_image)
-        dish_info = await legacy_menu_service.process_dip_results(dip_lines, language)
         dish_bounding_boxes = legacy_menu_service.normalize_text_bbox_dip(
             img_width, img_height, dip_lines
         )
-
-        return {
-            "results": legacy_menu_service.serialize_dish_data_filtered(
-                dish_info, dish_bounding_boxes
-            )
-        }
+        if listener is None:
+            dish_info = await legacy_menu_service.process_dip_results(dip_lines, language)
+            return {
+                "results": legacy_menu_service.serialize_dish_data_filtered(
+                    dish_info, dish_bounding_boxes
+                )
+            }
+
+        listener.on_ocr_boxes(dish_bounding_boxes)
+        dish_info = await legacy_menu_service.process_dip_results(
+            dip_lines,
+            language,
+            on_resolved=lambda line_index, dish: listener.on_dish(
+                line_index, dish, dish_bounding_boxes[line_index]
+            ),
+        )
+        # Lines still pending at the deadline were never resolved; emit them too.
+        return legacy_menu_service._finalize_results(
+            listener, dish_info, dish_bounding_boxes
+        )
 
 
 class DipLayoutGroupingExperimentFlow:
@@ -94,13 +141,39 @@ class DipLayoutGroupingExperimentFlow:
         ),
     )
 
+    supports_streaming = True
+
     async def run(
         self,
         image: bytes,
         accept_language: str | None,
+        listener: MenuAnalysisListener | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         return await legacy_menu_service.analyze_menu_image_layout_grouping_experiment(
-            image, accept_language
+            image, accept_language, listener=listener
+        )
+
+
+class DipLayoutCombinedFlow:
+    descriptor = MenuFlowDescriptor(
+        id="dip.layout_segments_combined_llm.v1",
+        label="DIP Layout Segments Combined LLM (Experimental)",
+        description=(
+            "Experimental layout-segments flow that groups and labels segments in a "
+            "single structured LLM call instead of separate grouping and wash calls."
+        ),
+    )
+
+    supports_streaming = True
+
+    async def run(
+        self,
+        image: bytes,
+        accept_language: str | None,
+        listener: MenuAnalysisListener | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        return await legacy_menu_service.analyze_menu_image_layout_combined(
+            image, accept_language, listener=listener
         )
 
 
@@ -174,9 +247,61 @@ class MenuFlowRegistry:
         return self._flows[resolved_key]
 
 
+def _pending_item_ids(results: list[dict[str, Any]]) -> list[int]:
+    return [item["id"] for item in results if item.get("info", {}).get("pending")]
+
+
 class MenuAnalysisService:
-    def __init__(self, flow_registry: MenuFlowRegistry):
+    """Runs one flow per upload under a request deadline.
+
+    The deadline comes from the caller (`X-Request-Deadline`), or from
+    `deadline_seconds`, and is capped at `max_deadline_seconds`. Every stage
+    shrinks its timeout to what is left. Items still unresolved when it runs out
+    are returned as pending and listed in the meta.
+    """
+
+    def __init__(
+        self,
+        flow_registry: MenuFlowRegistry,
+        near_duplicate_index: NearDuplicateIndex[MenuAnalyzeResponseContract] | None = None,
+        *,
+        deadline_seconds: float | None = None,
+        max_deadline_seconds: float | None = None,
+    ):
         self._flow_registry = flow_registry
+        self._near_duplicate_index = near_duplicate_index
+        self._deadline_seconds = deadline_seconds
+        self._max_deadline_seconds = max_deadline_seconds
+
+    def _deadline_budget(self, requested_seconds: float | None) -> float | None:
+        budget = self._deadline_seconds if requested_seconds is None else requested_seconds
+        if budget and self._max_deadline_seconds:
+            return min(budget, self._max_deadline_seconds)
+        return budget
+
+    @staticmethod
+    def _build_meta(
+        flow: MenuAnalysisFlow,
+        language: str,
+        total_items: int,
+        pending_item_ids: list[int],
+        deadline: RequestDeadline | None,
+    ) -> MenuAnalyzeMetaContract:
+        if pending_item_ids:
+            metrics.increment("deadline.partial_responses")
+        return MenuAnalyzeMetaContract(
+            flow_id=flow.descriptor.id,
+            flow_label=flow.descriptor.label,
+            language=language,
+            total_items=total_items,
+            deadline_exceeded=deadline is not None and deadline.exceeded,
+            pending_item_ids=pending_item_ids,
+        )
+
+    async def _perceptual_hash(self, image: bytes) -> int | None:
+        if self._near_duplicate_index is None:
+            return None
+        return await ImagePreprocessPool.run(perceptual_hash, image)
 
     async def analyze(
         self,
@@ -184,20 +309,116 @@ class MenuAnalysisService:
         image: bytes,
         accept_language: str | None,
         flow_hint: str | None = None,
+        deadline_seconds: float | None = None,
     ) -> MenuAnalyzeResponseContract:
         flow = self._flow_registry.resolve(flow_hint)
+        with request_deadline(self._deadline_budget(deadline_seconds)) as deadline:
+            return await self._analyze(flow, image, accept_language, deadline)
+
+    async def _analyze(
+        self,
+        flow: MenuAnalysisFlow,
+        image: bytes,
+        accept_language: str | None,
+        deadline: RequestDeadline | None,
+    ) -> MenuAnalyzeResponseContract:
+        language = resolve_accept_language(accept_language)
+        namespace = f"{flow.descriptor.id}\x1f{language}"
+        image_hash = await self._perceptual_hash(image)
+        if image_hash is not None:
+            match = self._near_duplicate_index.get(namespace, image_hash)
+            if match is not None:
+                metrics.increment("near_duplicate.hits")
+                logger.info(
+                    "Near-duplicate upload served from index flow={} distance={}",
+                    flow.descriptor.id,
+                    match.distance,
+                )
+                return match.value.model_copy(deep=True)
+            metrics.increment("near_duplicate.misses")
+
         payload = await flow.run(image=image, accept_language=accept_language)
         results = payload.get("results", [])
 
-        return MenuAnalyzeResponseContract(
+        response = MenuAnalyzeResponseContract(
             results=results,
-            meta=MenuAnalyzeMetaContract(
-                flow_id=flow.descriptor.id,
-                flow_label=flow.descriptor.label,
-                language=resolve_accept_language(accept_language),
-                total_items=len(results),
+            meta=self._build_meta(
+                flow, language, len(results), _pending_item_ids(results), deadline
             ),
         )
+        # Partial answers are never reused for later uploads.
+        if (
+            image_hash is not None
+            and not response.meta.deadline_exceeded
+            and not response.meta.pending_item_ids
+        ):
+            self._near_duplicate_index.put(
+                namespace, image_hash, response.model_copy(deep=True)
+            )
+        return response
+
+    def analyze_stream(
+        self,
+        *,
+        image: bytes,
+        accept_language: str | None,
+        flow_hint: str | None = None,
+        deadline_seconds: float | None = None,
+    ) -> AsyncIterator[MenuAnalyzeStreamEventContract]:
+        """Resolve the flow eagerly, then stream `ocr`/`item`/`patch` events and a final `meta`.
+
+        Flows without streaming support emit all their items once they finish.
+        """
+        flow = self._flow_registry.resolve(flow_hint)
+        return self._stream_events(
+            flow, image, accept_language, self._deadline_budget(deadline_seconds)
+        )
+
+    async def _stream_events(
+        self,
+        flow: MenuAnalysisFlow,
+        image: bytes,
+        accept_language: str | None,
+        deadline_budget: float | None,
+    ) -> AsyncIterator[MenuAnalyzeStreamEventContract]:
+        queue: asyncio.Queue[MenuAnalyzeStreamEventContract | None] = asyncio.Queue()
+        recorder = MenuAnalysisStreamRecorder(queue.put_nowait)
+
+        async def _run_flow() -> None:
+            try:
+                with request_deadline(deadline_budget) as deadline:
+                    if getattr(flow, "supports_streaming", False):
+                        payload = await flow.run(
+                            image=image,
+                            accept_language=accept_language,
+                            listener=recorder,
+                        )
+                    else:
+                        payload = await flow.run(image=image, accept_language=accept_language)
+                recorder.complete(payload.get("results", []))
+                # Streamed ids follow emission order, so the meta is built from them.
+                recorder.emit_meta(
+                    self._build_meta(
+                        flow,
+                        resolve_accept_language(accept_language),
+                        recorder.total_items,
+                        recorder.pending_item_ids,
+                        deadline,
+                    )
+                )
+            except Exception as exc:  # surface failures as a terminal stream event
+                logger.exception("Streaming menu analysis failed flow={}", flow.descriptor.id)
+                recorder.emit_error(type(exc).__name__)
+            finally:
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(_run_flow())
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
 
     def flow_catalog(self) -> MenuFlowCatalogContract:
         return MenuFlowCatalogContract(
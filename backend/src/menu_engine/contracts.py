@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -25,6 +25,13 @@ class MenuAnalyzeMetaContract(BaseModel):
     flow_label: str = Field(serialization_alias="flowLabel")
     language: str
     total_items: int = Field(serialization_alias="totalItems")
+    deadline_exceeded: bool = Field(
+        default=False, serialization_alias="deadlineExceeded"
+    )
+    pending_item_ids: list[int] = Field(
+        default_factory=list,
+        serialization_alias="pendingItemIds",
+    )
     contract_version: str = Field(
         default=API_CONTRACT_VERSION,
         serialization_alias="contractVersion",
@@ -36,6 +43,27 @@ class MenuAnalyzeResponseContract(BaseModel):
     meta: MenuAnalyzeMetaContract
 
 
+class MenuAnalyzeStreamErrorContract(BaseModel):
+    message: str
+
+
+class MenuAnalyzeStreamEventContract(BaseModel):
+    """One NDJSON line of `/menu/analyze/stream`.
+
+    `ocr` carries the OCR line boxes, `item` a newly resolved result, `patch` a
+    replacement for an already emitted item id, `meta` closes a successful stream
+    and `error` a failed one.
+    """
+
+    event: Literal["ocr", "item", "patch", "meta", "error"]
+    data: (
+        list[BoundingBoxContract]
+        | MenuAnalyzeResultItemContract
+        | MenuAnalyzeMetaContract
+        | MenuAnalyzeStreamErrorContract
+    )
+
+
 class MenuFlowDescriptorContract(BaseModel):
     id: str
     label: str
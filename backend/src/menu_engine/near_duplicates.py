@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes under Hamming distance.
+
+    Each node keeps children keyed by their distance to it, so a radius query only
+    descends into children whose edge lies within `distance ± radius`.
+    """
+
+    def __init__(self):
+        self._root: tuple[int, dict[int, tuple]] | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int) -> None:
+        if self._root is None:
+            self._root = (value, {})
+            self._size = 1
+            return
+
+        node_value, children = self._root
+        while True:
+            distance = hamming_distance(value, node_value)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (value, {})
+                self._size += 1
+                return
+            node_value, children = child
+
+    def search(self, value: int, radius: int) -> list[tuple[int, int]]:
+        """Return `(distance, hash)` pairs within `radius`, closest first."""
+        if self._root is None:
+            return []
+
+        matches: list[tuple[int, int]] = []
+        pending = [self._root]
+        while pending:
+            node_value, children = pending.pop()
+            distance = hamming_distance(value, node_value)
+            if distance <= radius:
+                matches.append((distance, node_value))
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    pending.append(child)
+        return sorted(matches)
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch(Generic[T]):
+    distance: int
+    value: T
+
+
+class NearDuplicateIndex(Generic[T]):
+    """Bounded perceptual-hash index returning the latest value of the nearest hash.
+
+    Entries live in an LRU keyed by `(namespace, hash)`; BK-trees are per namespace
+    and rebuilt lazily once evicted hashes make up half of a tree.
+    """
+
+    def __init__(self, *, max_entries: int, max_distance: int, ttl_seconds: float):
+        self._max_entries = max(1, max_entries)
+        self._max_distance = max(0, max_distance)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, int], tuple[float, T]] = OrderedDict()
+        self._trees: dict[str, BKTree] = {}
+        self._live_counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, entry_key: tuple[str, int]) -> None:
+        del self._entries[entry_key]
+        self._live_counts[entry_key[0]] -= 1
+
+    def _tree(self, namespace: str) -> BKTree:
+        tree = self._trees.setdefault(namespace, BKTree())
+        live_count = self._live_counts.get(namespace, 0)
+        if len(tree) > 2 * max(1, live_count):
+            tree = BKTree()
+            for entry_namespace, live_hash in self._entries:
+                if entry_namespace == namespace:
+                    tree.add(live_hash)
+            self._trees[namespace] = tree
+        return tree
+
+    def get(self, namespace: str, image_hash: int) -> NearDuplicateMatch[T] | None:
+        now = time.monotonic()
+        for distance, candidate_hash in self._tree(namespace).search(
+            image_hash, self._max_distance
+        ):
+            entry_key = (namespace, candidate_hash)
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                continue
+            expires_at, value = entry
+            if expires_at <= now:
+                self._evict(entry_key)
+                continue
+            self._entries.move_to_end(entry_key)
+            return NearDuplicateMatch(distance=distance, value=value)
+        return None
+
+    def put(self, namespace: str, image_hash: int, value: T) -> None:
+        entry_key = (namespace, image_hash)
+        if entry_key not in self._entries:
+            self._live_counts[namespace] = self._live_counts.get(namespace, 0) + 1
+            self._tree(namespace).add(image_hash)
+        self._entries[entry_key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self._max_entries:
+            self._evict(next(iter(self._entries)))
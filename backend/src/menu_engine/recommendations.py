@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Protocol
+from typing import Protocol
 
 from src.menu_engine.contracts import (
     MenuRecommendationMetaContract,
@@ -7,7 +7,7 @@ from src.menu_engine.contracts import (
 )
 from src.models import User
 from src.services.menu import recommend_dishes
-from src.services.user import get_access_limits, record_access
+from src.services.access_policy import AccessDecision, get_access_policy_engine
 
 LIMIT_REACHED_MESSAGE = (
     "Sorry, you have exceeded your daily limit, please try again tomorrow."
@@ -15,10 +15,13 @@ LIMIT_REACHED_MESSAGE = (
 
 
 class AccessPolicyRepository(Protocol):
-    async def get_access_limits(self, user: User) -> Mapping[str, Any]:
+    async def try_consume(self, user: User) -> AccessDecision:
         ...
 
-    async def record_access(self, user: User) -> None:
+    async def commit(self, user: User) -> None:
+        ...
+
+    async def release(self, user: User) -> None:
         ...
 
 
@@ -28,11 +31,14 @@ class RecommendationGenerator(Protocol):
 
 
 class SupabaseAccessPolicyRepository:
-    async def get_access_limits(self, user: User) -> Mapping[str, Any]:
-        return await get_access_limits(user)
+    async def try_consume(self, user: User) -> AccessDecision:
+        return await get_access_policy_engine().try_consume(user)
 
-    async def record_access(self, user: User) -> None:
-        await record_access(user)
+    async def commit(self, user: User) -> None:
+        await get_access_policy_engine().commit(user)
+
+    async def release(self, user: User) -> None:
+        await get_access_policy_engine().release(user)
 
 
 class LLMRecommendationGenerator:
@@ -56,15 +62,8 @@ class MenuRecommendationService:
         request: MenuRecommendationRequestContract,
         user: User,
     ) -> MenuRecommendationResponseContract:
-        limits = await self._access_policy_repository.get_access_limits(user)
-
-        raw_remaining = limits.get("remaining_accesses", 0)
-        try:
-            remaining_accesses = max(0, int(raw_remaining))
-        except (TypeError, ValueError):
-            remaining_accesses = 0
-
-        if remaining_accesses == 0:
+        decision = await self._access_policy_repository.try_consume(user)
+        if not decision.allowed:
             return MenuRecommendationResponseContract(
                 suggestions=LIMIT_REACHED_MESSAGE,
                 meta=MenuRecommendationMetaContract(
@@ -73,13 +72,17 @@ class MenuRecommendationService:
                 ),
             )
 
-        suggestions = await self._recommendation_generator.recommend(request)
-        await self._access_policy_repository.record_access(user)
+        try:
+            suggestions = await self._recommendation_generator.recommend(request)
+        except Exception:
+            await self._access_policy_repository.release(user)
+            raise
+        await self._access_policy_repository.commit(user)
 
         return MenuRecommendationResponseContract(
             suggestions=suggestions,
             meta=MenuRecommendationMetaContract(
                 limit_reached=False,
-                remaining_accesses=max(remaining_accesses - 1, 0),
+                remaining_accesses=decision.remaining_accesses,
             ),
         )
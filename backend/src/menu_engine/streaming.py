@@ -0,0 +1,90 @@
+from typing import Any, Callable
+
+from src.menu_engine.contracts import (
+    BoundingBoxContract,
+    MenuAnalyzeMetaContract,
+    MenuAnalyzeResultItemContract,
+    MenuAnalyzeStreamErrorContract,
+    MenuAnalyzeStreamEventContract,
+)
+
+StreamEventSink = Callable[[MenuAnalyzeStreamEventContract], None]
+
+
+def _is_unknown(dish: dict[str, Any]) -> bool:
+    return str(dish.get("text", "")).strip().lower() == "unknown"
+
+
+class MenuAnalysisStreamRecorder:
+    """Turns pipeline listener callbacks into stream events.
+
+    Item ids are assigned in emission order, so they stay stable across patches
+    but differ from the line-ordered ids of the non-streaming response.
+    """
+
+    def __init__(self, sink: StreamEventSink):
+        self._sink = sink
+        self._ids_by_line: dict[int, int] = {}
+        self._emitted: dict[int, MenuAnalyzeResultItemContract] = {}
+
+    @property
+    def total_items(self) -> int:
+        return len(self._emitted)
+
+    @property
+    def pending_item_ids(self) -> list[int]:
+        """Streamed ids whose latest emission is still pending at the deadline."""
+        return [
+            item_id
+            for item_id, item in self._emitted.items()
+            if item.info.get("pending")
+        ]
+
+    def on_ocr_boxes(self, boxes: list[dict[str, float]]) -> None:
+        self._sink(
+            MenuAnalyzeStreamEventContract(
+                event="ocr",
+                data=[BoundingBoxContract(**box) for box in boxes],
+            )
+        )
+
+    def on_dish(
+        self, line_index: int, dish: dict[str, Any], box: dict[str, float]
+    ) -> None:
+        if _is_unknown(dish):
+            return
+        item_id = self._ids_by_line.get(line_index)
+        if item_id is None:
+            item_id = len(self._ids_by_line)
+            self._ids_by_line[line_index] = item_id
+            event = "item"
+        else:
+            event = "patch"
+
+        item = MenuAnalyzeResultItemContract(
+            id=item_id,
+            info=dict(dish),
+            boundingBox=BoundingBoxContract(**box),
+        )
+        if self._emitted.get(item_id) == item:
+            return
+        self._emitted[item_id] = item
+        self._sink(MenuAnalyzeStreamEventContract(event=event, data=item))
+
+    def complete(self, results: list[dict[str, Any]]) -> None:
+        """Emit the final results of a flow that reported nothing while running."""
+        if self._ids_by_line:
+            return
+        for line_index, result in enumerate(results):
+            self.on_dish(line_index, result["info"], result["boundingBox"])
+
+    def emit_meta(self, meta: MenuAnalyzeMetaContract) -> None:
+        self._sink(MenuAnalyzeStreamEventContract(event="meta", data=meta))
+
+    def emit_error(self, message: str) -> None:
+        self._sink(
+            MenuAnalyzeStreamEventContract(
+                event="error",
+                data=MenuAnalyzeStreamErrorContract(message=message),
+            )
+        )
@@ -40,5 +40,18 @@ class Dish(BaseModel):
         description="A brief introduction to the dish based on its name such as common ingredients, history and etc.",
     )
 
+
+class IndexedDish(Dish):
+    """Dish information for one OCR item of a batched request."""
+
+    index: int = Field(description="Index of the OCR item this entry answers.")
+
+
+class DishBatch(BaseModel):
+    """Dish information for a batch of OCR items, one entry per input index."""
+
+    dishes: list[IndexedDish]
+
+
 if __name__ == "__main__":
     print(Dish(dish_name="just me").dish_name)
\ No newline at end of file
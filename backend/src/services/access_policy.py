@@ -0,0 +1,248 @@
+import asyncio
+import datetime
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException
+from postgrest.types import CountMethod
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.supabase.client import SupabaseClient
+from src.models import User
+from src.services.cache import LRUCache
+
+ACCESS_USAGE_MODE_RECORDS = "records"
+ACCESS_USAGE_MODE_COUNTER = "counter"
+SUBSCRIPTION_ROLES = ("trial", "pro")
+_LOCK_STRIPES = 64
+
+
+@dataclass(frozen=True, slots=True)
+class AccessPolicy:
+    role: str
+    daily_limit: int
+    expires_at: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AccessDecision:
+    allowed: bool
+    remaining_accesses: int
+
+
+def _today_bounds() -> tuple[str, str]:
+    today = datetime.datetime.now(datetime.UTC)
+    start_of_today = datetime.datetime.combine(today, datetime.datetime.min.time())
+    end_of_today = start_of_today + datetime.timedelta(days=1)
+    return start_of_today.isoformat(), end_of_today.isoformat()
+
+
+class AccessPolicyEngine:
+    """Daily quota checks backed by short-lived per-user policy and usage caches.
+
+    A warm check costs no round trip. `try_consume` reserves one access atomically:
+    - `records` mode (default): the check and increment happen under a per-user
+      lock against the cached count, and `commit` inserts the access record after
+      the work succeeds.
+    - `counter` mode: one `consume_daily_access` RPC checks and increments a
+      counter row in the database, so the quota holds across instances.
+    `release` returns a reservation whose work failed.
+    """
+
+    def __init__(self, *, usage_mode: str = ACCESS_USAGE_MODE_RECORDS):
+        self._usage_mode = usage_mode
+        self._policies = LRUCache(
+            settings.USER_ACCESS_CACHE_MAX_ENTRIES,
+            settings.USER_ACCESS_POLICY_CACHE_TTL_SECONDS,
+        )
+        self._usage = LRUCache(
+            settings.USER_ACCESS_CACHE_MAX_ENTRIES,
+            settings.USER_ACCESS_USAGE_CACHE_TTL_SECONDS,
+        )
+        self._limits_by_role = LRUCache(
+            1, settings.USER_ACCESS_POLICY_CACHE_TTL_SECONDS
+        )
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+
+    def _lock_for(self, user_id: str) -> asyncio.Lock:
+        return self._locks[zlib.crc32(user_id.encode("utf-8")) % _LOCK_STRIPES]
+
+    @staticmethod
+    def _usage_key(user_id: str) -> str:
+        return f"{user_id}:{_today_bounds()[0]}"
+
+    async def _load_daily_limits(self) -> dict[str, int]:
+        limits = self._limits_by_role.get("all")
+        if limits is not None:
+            return limits
+        supabase = await SupabaseClient.get_client()
+        response = (
+            await supabase.table("access_limits").select("role,daily_limit").execute()
+        )
+        limits = {row["role"]: row["daily_limit"] for row in response.data or []}
+        self._limits_by_role.set("all", limits)
+        return limits
+
+    async def _load_policy(self, user_id: str) -> AccessPolicy:
+        supabase = await SupabaseClient.get_client()
+        response = (
+            await supabase.table("user_roles")
+            .select("role")
+            .eq("user_id", user_id)
+            .execute()
+        )
+        role = response.data[0]["role"] if response.data else "free"
+
+        daily_limits = await self._load_daily_limits()
+        if role not in daily_limits:
+            raise HTTPException(status_code=404, detail="Access limit not found")
+
+        expires_at = None
+        if role in SUBSCRIPTION_ROLES:
+            response = (
+                await supabase.table("user_subscriptions")
+                .select("expires_at")
+                .eq("user_id", user_id)
+                .execute()
+            )
+            if not response.data:
+                raise HTTPException(
+                    status_code=404, detail="User subscription not found"
+                )
+            expires_at = response.data[0]["expires_at"]
+            if datetime.datetime.fromisoformat(expires_at) < datetime.datetime.now(
+                datetime.UTC
+            ):
+                await (
+                    supabase.table("user_roles")
+                    .upsert({"role": "free", "user_id": user_id}, on_conflict="user_id")
+                    .execute()
+                )
+        return AccessPolicy(
+            role=role, daily_limit=daily_limits[role], expires_at=expires_at
+        )
+
+    async def get_policy(self, user: User) -> AccessPolicy:
+        policy = self._policies.get(user.sub)
+        if policy is not None:
+            metrics.increment("access_policy.policy.hits")
+            return policy
+        metrics.increment("access_policy.policy.misses")
+        policy = await self._load_policy(user.sub)
+        self._policies.set(user.sub, policy)
+        return policy
+
+    async def _count_today(self, user_id: str) -> int:
+        start_of_today, end_of_today = _today_bounds()
+        supabase = await SupabaseClient.get_client()
+        if self._usage_mode == ACCESS_USAGE_MODE_COUNTER:
+            response = (
+                await supabase.table("user_daily_access")
+                .select("access_count")
+                .eq("user_id", user_id)
+                .eq("access_day", start_of_today[:10])
+                .execute()
+            )
+            return int(response.data[0]["access_count"]) if response.data else 0
+        response = (
+            await supabase.table("user_access_records")
+            .select("user_id", count=CountMethod.exact, head=True)
+            .eq("user_id", user_id)
+            .gte("accessed_at", start_of_today)
+            .lt("accessed_at", end_of_today)
+            .execute()
+        )
+        return response.count or 0
+
+    async def _usage_today(self, user_id: str) -> int:
+        used = self._usage.get(self._usage_key(user_id))
+        if used is not None:
+            metrics.increment("access_policy.usage.hits")
+            return used
+        metrics.increment("access_policy.usage.misses")
+        used = await self._count_today(user_id)
+        self._usage.set(self._usage_key(user_id), used)
+        return used
+
+    async def get_access_limits(self, user: User) -> dict[str, Any]:
+        policy = await self.get_policy(user)
+        used = await self._usage_today(user.sub)
+        return {
+            "role": policy.role,
+            "daily_limit": policy.daily_limit,
+            "remaining_accesses": max(0, policy.daily_limit - used),
+            "expires_at": policy.expires_at,
+        }
+
+    async def try_consume(self, user: User) -> AccessDecision:
+        policy = await self.get_policy(user)
+        async with self._lock_for(user.sub):
+            cached_used = self._usage.get(self._usage_key(user.sub))
+            if cached_used is not None and cached_used >= policy.daily_limit:
+                metrics.increment("access_policy.denied")
+                return AccessDecision(allowed=False, remaining_accesses=0)
+
+            if self._usage_mode == ACCESS_USAGE_MODE_COUNTER:
+                used = await self._consume_counter(user.sub, policy.daily_limit)
+                if used is None:
+                    self._usage.set(self._usage_key(user.sub), policy.daily_limit)
+                    metrics.increment("access_policy.denied")
+                    return AccessDecision(allowed=False, remaining_accesses=0)
+            else:
+                used = await self._usage_today(user.sub) + 1
+                if used > policy.daily_limit:
+                    metrics.increment("access_policy.denied")
+                    return AccessDecision(allowed=False, remaining_accesses=0)
+
+            self._usage.set(self._usage_key(user.sub), used)
+            metrics.increment("access_policy.consumed")
+            return AccessDecision(
+                allowed=True,
+                remaining_accesses=max(0, policy.daily_limit - used),
+            )
+
+    async def _consume_counter(self, user_id: str, daily_limit: int) -> int | None:
+        """New count for today, or None when the limit was already reached."""
+        supabase = await SupabaseClient.get_client()
+        response = await supabase.rpc(
+            "consume_daily_access",
+            {"p_user_id": user_id, "p_daily_limit": daily_limit},
+        ).execute()
+        return None if response.data is None else int(response.data)
+
+    async def commit(self, user: User) -> None:
+        if self._usage_mode == ACCESS_USAGE_MODE_COUNTER:
+            return
+        supabase = await SupabaseClient.get_client()
+        data = {
+            "user_id": user.sub,
+            "accessed_at": datetime.datetime.now(datetime.UTC).isoformat(),
+        }
+        await supabase.table("user_access_records").insert(data).execute()
+
+    async def release(self, user: User) -> None:
+        async with self._lock_for(user.sub):
+            key = self._usage_key(user.sub)
+            used = self._usage.get(key)
+            if used:
+                self._usage.set(key, used - 1)
+            if self._usage_mode == ACCESS_USAGE_MODE_COUNTER:
+                supabase = await SupabaseClient.get_client()
+                await supabase.rpc(
+                    "release_daily_access", {"p_user_id": user.sub}
+                ).execute()
+        metrics.increment("access_policy.released")
+
+
+_access_policy_engine: AccessPolicyEngine | None = None
+
+
+def get_access_policy_engine() -> AccessPolicyEngine:
+    global _access_policy_engine
+    if _access_policy_engine is None:
+        _access_policy_engine = AccessPolicyEngine(
+            usage_mode=settings.USER_ACCESS_USAGE_MODE
+        )
+    return _access_policy_engine
@@ -0,0 +1,288 @@
+import asyncio
+import datetime
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Protocol
+
+from postgrest import APIError
+
+from src.core.metrics import metrics
+from src.core.vendors.supabase.client import SupabaseClient
+from src.core.vendors.utilities.client import logger
+
+CACHE_BACKEND_MEMORY = "memory"
+CACHE_BACKEND_DISK = "disk"
+CACHE_BACKEND_SQLITE = "sqlite"
+CACHE_BACKEND_SUPABASE = "supabase"
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None: ...
+
+
+class LRUCache:
+    """Bounded in-memory LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCacheBackend:
+    def __init__(self, directory: str | Path):
+        self._directory = Path(directory)
+
+    def _path_for(self, key: str) -> Path:
+        safe_key = "".join(char if char.isalnum() else "_" for char in key)
+        return self._directory / f"{safe_key}.json"
+
+    def _read(self, key: str) -> Any | None:
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        entry = json.loads(path.read_text())
+        if entry.get("expiresAt", 0) <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry.get("value")
+
+    def _write(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"expiresAt": time.time() + ttl_seconds, "value": value},
+                ensure_ascii=False,
+            )
+        )
+        tmp_path.replace(path)
+
+    async def get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl_seconds)
+
+
+class SqliteCacheBackend:
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=5)
+        if not self._initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "cache_key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._initialized = True
+        return connection
+
+    def _read(self, key: str) -> Any | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT payload, expires_at FROM cache_entries WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def _write(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (cache_key, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time() + ttl_seconds),
+            )
+
+    async def get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl_seconds)
+
+
+class SupabaseCacheBackend:
+    """Key/value rows in a table with `cache_key`, `payload` and `expires_at` columns."""
+
+    def __init__(self, table: str):
+        self._table = table
+
+    async def get(self, key: str) -> Any | None:
+        supabase = await SupabaseClient.get_client()
+        response = (
+            await supabase.table(self._table)
+            .select("payload,expires_at")
+            .eq("cache_key", key)
+            .execute()
+        )
+        if not response.data:
+            return None
+        row = response.data[0]
+        expires_at = datetime.datetime.fromisoformat(row["expires_at"])
+        if expires_at <= datetime.datetime.now(datetime.UTC):
+            return None
+        return row["payload"]
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        supabase = await SupabaseClient.get_client()
+        expires_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+            seconds=ttl_seconds
+        )
+        await (
+            supabase.table(self._table)
+            .upsert(
+                {
+                    "cache_key": key,
+                    "payload": value,
+                    "expires_at": expires_at.isoformat(),
+                },
+                on_conflict="cache_key",
+            )
+            .execute()
+        )
+
+
+def build_cache_backend(
+    kind: str,
+    *,
+    directory: str | Path | None = None,
+    path: str | Path | None = None,
+    table: str | None = None,
+) -> CacheBackend | None:
+    normalized_kind = (kind or "").strip().lower()
+    if normalized_kind in {"", CACHE_BACKEND_MEMORY}:
+        return None
+    if normalized_kind == CACHE_BACKEND_DISK and directory:
+        return DiskCacheBackend(directory)
+    if normalized_kind == CACHE_BACKEND_SQLITE and path:
+        return SqliteCacheBackend(path)
+    if normalized_kind == CACHE_BACKEND_SUPABASE and table:
+        return SupabaseCacheBackend(table)
+    logger.warning("Unsupported cache backend '{}'; using memory only", kind)
+    return None
+
+
+class TieredCache:
+    """In-memory LRU in front of an optional persistent backend.
+
+    Persistent tier failures are logged and treated as misses so a broken cache
+    never fails the request that consulted it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        backend: CacheBackend | None = None,
+    ):
+        self.name = name
+        self._ttl_seconds = ttl_seconds
+        self._memory = LRUCache(max_entries, ttl_seconds)
+        self._backend = backend
+
+    def _count(self, event: str) -> None:
+        metrics.increment(f"cache.{self.name}.{event}")
+
+    async def get(self, key: str) -> Any | None:
+        value = self._memory.get(key)
+        if value is not None:
+            self._count("hits.memory")
+            return value
+
+        if self._backend is not None:
+            try:
+                value = await self._backend.get(key)
+            except (APIError, OSError, ValueError, sqlite3.Error) as exc:
+                self._count("errors")
+                logger.error("Cache '{}' backend read failed: {}", self.name, exc)
+                value = None
+            if value is not None:
+                self._memory.set(key, value)
+                self._count("hits.persistent")
+                return value
+
+        self._count("misses")
+        return None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        unique_keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*[self.get(key) for key in unique_keys])
+        return {
+            key: value
+            for key, value in zip(unique_keys, values, strict=True)
+            if value is not None
+        }
+
+    async def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._memory.set(key, value, ttl)
+        self._count("writes")
+        if self._backend is None:
+            return
+        try:
+            await self._backend.set(key, value, ttl)
+        except (APIError, OSError, ValueError, TypeError, sqlite3.Error) as exc:
+            self._count("errors")
+            logger.error("Cache '{}' backend write failed: {}", self.name, exc)
+
+    def stats(self) -> dict[str, Any]:
+        prefix = f"cache.{self.name}."
+        memory_hits = metrics.counter(f"{prefix}hits.memory")
+        persistent_hits = metrics.counter(f"{prefix}hits.persistent")
+        misses = metrics.counter(f"{prefix}misses")
+        lookups = memory_hits + persistent_hits + misses
+        return {
+            "name": self.name,
+            "entries": len(self._memory),
+            "memoryHits": memory_hits,
+            "persistentHits": persistent_hits,
+            "misses": misses,
+            "hitRate": round((memory_hits + persistent_hits) / lookups, 4)
+            if lookups
+            else None,
+        }
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Iterator
+
+from src.core.metrics import metrics
+from src.core.vendors.utilities.client import logger
+
+
+class RequestDeadline:
+    """Monotonic end time shared by every stage of one request."""
+
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+        self.exceeded = False
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+_current_deadline: ContextVar[RequestDeadline | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+def parse_deadline_header(raw_value: str | None) -> float | None:
+    """Seconds from an `X-Request-Deadline` header; raises ValueError when malformed."""
+    if raw_value is None or not raw_value.strip():
+        return None
+    budget_seconds = float(raw_value)
+    if budget_seconds <= 0 or budget_seconds != budget_seconds:
+        raise ValueError(f"Invalid request deadline '{raw_value}'")
+    return budget_seconds
+
+
+@contextmanager
+def request_deadline(budget_seconds: float | None) -> Iterator[RequestDeadline | None]:
+    """Binds a deadline to the current context; tasks started inside inherit it.
+
+    A budget of None or <= 0 runs without a deadline.
+    """
+    deadline = (
+        RequestDeadline(budget_seconds)
+        if budget_seconds and budget_seconds > 0
+        else None
+    )
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> RequestDeadline | None:
+    return _current_deadline.get()
+
+
+def stage_timeout(default_seconds: float) -> float:
+    """A stage's own timeout, shrunk to what is left of the request deadline."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default_seconds
+    return min(default_seconds, deadline.remaining())
+
+
+async def gather_until_deadline(
+    coroutines: list[Awaitable[Any]], *, stage: str
+) -> list[Any | None]:
+    """Like `asyncio.gather`, but stops at the request deadline.
+
+    Coroutines still running at the deadline are cancelled and yield None in
+    their slot. Errors raised by finished ones propagate as with `gather`.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return list(await asyncio.gather(*coroutines))
+    if not coroutines:
+        return []
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    _, pending = await asyncio.wait(tasks, timeout=deadline.remaining())
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        deadline.exceeded = True
+        metrics.increment(f"deadline.{stage}.cancelled", len(pending))
+        logger.warning(
+            "Request deadline reached stage={} unfinished={}/{}",
+            stage,
+            len(pending),
+            len(tasks),
+        )
+    return [None if task in pending else task.result() for task in tasks]
@@ -0,0 +1,232 @@
+import asyncio
+import datetime
+from typing import Awaitable, Callable
+
+from postgrest import APIError
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.supabase.client import SupabaseClient
+from src.core.vendors.utilities.client import logger
+
+DISH_IMAGE_TABLE = "dish"
+DISH_IMAGE_SCHEMA_SCRIPT = "backend/scripts/sql/dish_image_write_behind.sql"
+
+# PostgREST/Postgres codes for a missing `refreshed_at` column and for an upsert
+# target without a unique constraint on `dish_name`.
+_MISSING_COLUMN_CODES = frozenset({"42703", "PGRST204"})
+_MISSING_CONFLICT_TARGET_CODE = "42P10"
+
+ImageFetcher = Callable[[str], Awaitable[list[str] | None]]
+
+
+def is_dish_image_row_stale(row: dict) -> bool:
+    """True when a `dish` row was last written longer ago than the refresh window."""
+    written_at = row.get("refreshed_at") or row.get("created_at")
+    if not written_at:
+        return False
+    age = datetime.datetime.now(datetime.UTC) - datetime.datetime.fromisoformat(
+        written_at
+    )
+    return age > datetime.timedelta(
+        seconds=settings.MENU_DISH_IMAGE_REFRESH_AFTER_SECONDS
+    )
+
+
+def dish_image_columns(*columns: str) -> str:
+    """Select list for `dish` rows; leaves out `refreshed_at` if the table lacks it."""
+    columns = (*columns, "img_urls", "created_at")
+    if DishImageWriteBehind.has_refreshed_at:
+        columns = (*columns, "refreshed_at")
+    return ",".join(columns)
+
+
+class DishImageWriteBehind:
+    """Write-behind buffer for the dish image table.
+
+    Lookups enqueue rows and return immediately. A worker started in the app
+    lifespan coalesces them by dish name and flushes them as batched upserts that
+    stamp `refreshed_at`. The buffer is capped, and anything past the cap is dropped
+    and counted. Stale rows are served as-is while a bounded background refresh
+    re-fetches them. `close()` drains pending writes before shutdown.
+
+    If the table predates the schema in `DISH_IMAGE_SCHEMA_SCRIPT`, the first
+    failure is logged once and writes fall back to rows without `refreshed_at`.
+    """
+
+    has_refreshed_at: bool = True
+    _schema_errors_logged: set[str] = set()
+
+    _pending: dict[str, list[str]] = {}
+    _refreshing: set[str] = set()
+    _refresh_tasks: set[asyncio.Task] = set()
+    _worker: asyncio.Task | None = None
+    _wakeup: asyncio.Event | None = None
+    _stopping: bool = False
+
+    @classmethod
+    def _batch_size(cls) -> int:
+        return max(1, settings.MENU_DISH_IMAGE_WRITE_BATCH_SIZE)
+
+    @classmethod
+    def _publish_depth(cls) -> None:
+        metrics.set_gauge("dish_image.write_behind.pending", len(cls._pending))
+
+    @classmethod
+    def _drop(cls, count: int, reason: str) -> None:
+        if count:
+            metrics.increment("dish_image.write_behind.dropped", count)
+            logger.warning(
+                "Dish image write-behind dropped {} entries ({})", count, reason
+            )
+
+    @classmethod
+    def note_schema_error(cls, exc: Exception) -> bool:
+        """Logs a `dish` schema mismatch once; True when the caller should retry."""
+        code = exc.code if isinstance(exc, APIError) else None
+        if code in _MISSING_COLUMN_CODES and cls.has_refreshed_at:
+            cls.has_refreshed_at = False
+            problem, retry = "no refreshed_at column; writing rows without it", True
+        elif code == _MISSING_CONFLICT_TARGET_CODE:
+            problem, retry = "no unique constraint on dish_name; upserts fail", False
+        else:
+            return False
+        if problem not in cls._schema_errors_logged:
+            cls._schema_errors_logged.add(problem)
+            logger.error(
+                "Dish image table {} has {}. Apply {}",
+                DISH_IMAGE_TABLE,
+                problem,
+                DISH_IMAGE_SCHEMA_SCRIPT,
+            )
+        return retry
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._worker is not None and not cls._worker.done():
+            return
+        cls._stopping = False
+        cls._wakeup = asyncio.Event()
+        cls._worker = asyncio.create_task(cls._run(), name="dish-image-write-behind")
+
+    @classmethod
+    def enqueue(cls, dish_name: str, image_links: list[str]) -> bool:
+        if dish_name not in cls._pending and len(cls._pending) >= max(
+            1, settings.MENU_DISH_IMAGE_WRITE_QUEUE_MAX
+        ):
+            cls._drop(1, "queue full")
+            return False
+        cls._pending[dish_name] = list(image_links)
+        cls._publish_depth()
+        if len(cls._pending) >= cls._batch_size() and cls._wakeup is not None:
+            cls._wakeup.set()
+        return True
+
+    @classmethod
+    def schedule_refresh(cls, dish_name: str, fetch: ImageFetcher) -> None:
+        if cls._stopping or dish_name in cls._refreshing or dish_name in cls._pending:
+            return
+        if len(cls._refreshing) >= max(
+            1, settings.MENU_DISH_IMAGE_MAX_CONCURRENT_REFRESHES
+        ):
+            metrics.increment("dish_image.write_behind.refresh_skipped")
+            return
+        cls._refreshing.add(dish_name)
+        task = asyncio.create_task(cls._refresh(dish_name, fetch))
+        cls._refresh_tasks.add(task)
+        task.add_done_callback(cls._refresh_tasks.discard)
+
+    @classmethod
+    async def _refresh(cls, dish_name: str, fetch: ImageFetcher) -> None:
+        try:
+            image_links = await fetch(dish_name)
+        except Exception as exc:  # any fetch failure just skips this refresh
+            metrics.increment("dish_image.write_behind.refresh_errors")
+            logger.error("Dish image refresh failed for {}: {}", dish_name, exc)
+            return
+        finally:
+            cls._refreshing.discard(dish_name)
+        metrics.increment("dish_image.write_behind.refreshes")
+        if image_links:
+            cls.enqueue(dish_name, image_links)
+
+    @classmethod
+    async def flush(cls) -> int:
+        """Upserts pending rows batch by batch; a failed batch is dropped and stops the pass."""
+        flushed = 0
+        while cls._pending:
+            names = list(cls._pending)[: cls._batch_size()]
+            rows = [
+                {"dish_name": name, "img_urls": cls._pending.pop(name)}
+                for name in names
+            ]
+            cls._publish_depth()
+            try:
+                try:
+                    await cls._upsert(rows)
+                except APIError as exc:
+                    if not cls.note_schema_error(exc):
+                        raise
+                    await cls._upsert(rows)
+            except Exception as exc:  # API or transport failure; keep the worker alive
+                metrics.increment("dish_image.write_behind.errors")
+                logger.error("Dish image write-behind upsert failed: {}", exc)
+                cls._drop(len(rows), "upsert failed")
+                break
+            flushed += len(rows)
+            metrics.increment("dish_image.write_behind.flushed", len(rows))
+        return flushed
+
+    @classmethod
+    async def _upsert(cls, rows: list[dict]) -> None:
+        if cls.has_refreshed_at:
+            refreshed_at = datetime.datetime.now(datetime.UTC).isoformat()
+            rows = [{**row, "refreshed_at": refreshed_at} for row in rows]
+        supabase = await SupabaseClient.get_client()
+        await (
+            supabase.table(DISH_IMAGE_TABLE)
+            .upsert(rows, on_conflict="dish_name")
+            .execute()
+        )
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    cls._wakeup.wait(),
+                    timeout=settings.MENU_DISH_IMAGE_WRITE_FLUSH_SECONDS,
+                )
+            except TimeoutError:
+                pass
+            cls._wakeup.clear()
+            await cls.flush()
+            if cls._stopping:
+                cls._drop(len(cls._pending), "shutdown")
+                cls._pending.clear()
+                cls._publish_depth()
+                return
+
+    @classmethod
+    async def close(cls) -> None:
+        """Lets in-flight refreshes finish, then flushes what is pending and stops the worker."""
+        cls._stopping = True
+        timeout = settings.MENU_DISH_IMAGE_WRITE_DRAIN_TIMEOUT_SECONDS
+        if cls._refresh_tasks:
+            await asyncio.wait(set(cls._refresh_tasks), timeout=timeout)
+        if cls._worker is None:
+            await cls.flush()
+            cls._drop(len(cls._pending), "shutdown")
+            cls._pending.clear()
+            cls._publish_depth()
+            return
+
+        cls._wakeup.set()
+        try:
+            await asyncio.wait_for(cls._worker, timeout=timeout)
+        except TimeoutError:
+            cls._drop(len(cls._pending), "drain timeout")
+            cls._pending.clear()
+            cls._publish_depth()
+        cls._worker = None
+        cls._wakeup = None
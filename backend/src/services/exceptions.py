@@ -4,3 +4,7 @@ class OCRError(Exception):
 
 class SearchError(Exception):
     pass
+
+
+class PreprocessingBusyError(Exception):
+    pass
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.utilities.client import logger
+from src.services.exceptions import PreprocessingBusyError
+
+T = TypeVar("T")
+
+
+class ImagePreprocessPool:
+    """Bounded worker pool that keeps CPU-heavy image work off the event loop.
+
+    OpenCV releases the GIL in decode/resize/encode, so threads give real
+    parallelism without pickling uploads across processes. Admission is capped
+    at workers + queue slots; beyond that callers get `PreprocessingBusyError`.
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _in_flight: int = 0
+
+    @classmethod
+    def _workers(cls) -> int:
+        return max(1, settings.IMAGE_PREPROCESS_WORKERS)
+
+    @classmethod
+    def _capacity(cls) -> int:
+        return cls._workers() + max(0, settings.IMAGE_PREPROCESS_MAX_QUEUE)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls._workers(),
+                thread_name_prefix="image-preprocess",
+            )
+        return cls._executor
+
+    @classmethod
+    def _publish_depth(cls) -> None:
+        metrics.set_gauge("image_preprocess.in_flight", cls._in_flight)
+        metrics.set_gauge(
+            "image_preprocess.queue_depth", max(0, cls._in_flight - cls._workers())
+        )
+
+    @classmethod
+    def has_capacity(cls) -> bool:
+        return cls._in_flight < cls._capacity()
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args) -> T:
+        if not cls.has_capacity():
+            metrics.increment("image_preprocess.rejected")
+            logger.warning(
+                "Image preprocessing saturated in_flight={} capacity={}",
+                cls._in_flight,
+                cls._capacity(),
+            )
+            raise PreprocessingBusyError("Image preprocessing is saturated")
+
+        cls._in_flight += 1
+        cls._publish_depth()
+        submitted_at = time.perf_counter()
+
+        def _timed_call() -> T:
+            metrics.observe(
+                "image_preprocess.queue_wait_seconds",
+                time.perf_counter() - submitted_at,
+            )
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = cls._get_executor().submit(_timed_call)
+        except RuntimeError:
+            cls._release()
+            raise
+        # A cancelled caller does not stop the worker thread, so the slot is freed
+        # when the work itself ends, not when the awaiting coroutine does.
+        future.add_done_callback(lambda _future: cls._release_from(loop))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    @classmethod
+    def _release(cls) -> None:
+        cls._in_flight -= 1
+        cls._publish_depth()
+
+    @classmethod
+    def _release_from(cls, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(cls._release)
+        except RuntimeError:  # the loop closed while the work was running
+            cls._release()
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from src.core.metrics import metrics
+from src.services.exceptions import OCRError
+
+JPEG_DEFAULT_QUALITY = 80
+# Candidate qualities for the size-limited re-encode, searched by bisection.
+JPEG_FALLBACK_QUALITIES = tuple(range(10, JPEG_DEFAULT_QUALITY, 5))
+EXIF_ORIENTATION_TAG = 0x0112
+# SOFn markers carrying frame dimensions (excludes DHT/JPG/DAC at C4/C8/CC).
+JPEG_SOF_MARKERS = frozenset(
+    {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+)
+REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+@dataclass(frozen=True)
+class JpegHeader:
+    """Frame size as stored in the file plus the EXIF orientation (1 = upright)."""
+
+    width: int
+    height: int
+    orientation: int = 1
+
+    @property
+    def oriented_size(self) -> tuple[int, int]:
+        if self.orientation in (5, 6, 7, 8):
+            return self.height, self.width
+        return self.width, self.height
+
+
+def _read_exif_orientation(tiff: bytes) -> int | None:
+    if len(tiff) < 8:
+        return None
+    byte_order = {b"II": "little", b"MM": "big"}.get(tiff[:2])
+    if byte_order is None:
+        return None
+
+    ifd_offset = int.from_bytes(tiff[4:8], byte_order)
+    if ifd_offset + 2 > len(tiff):
+        return None
+    entry_count = int.from_bytes(tiff[ifd_offset : ifd_offset + 2], byte_order)
+    for entry_idx in range(entry_count):
+        entry = ifd_offset + 2 + entry_idx * 12
+        if entry + 12 > len(tiff):
+            return None
+        if int.from_bytes(tiff[entry : entry + 2], byte_order) == EXIF_ORIENTATION_TAG:
+            orientation = int.from_bytes(tiff[entry + 8 : entry + 10], byte_order)
+            return orientation if 1 <= orientation <= 8 else None
+    return None
+
+
+def read_jpeg_header(data: bytes) -> JpegHeader | None:
+    """Walk JPEG marker segments up to the frame header without decoding pixels."""
+    if len(data) < 4 or data[:2] != b"\xff\xd8":
+        return None
+
+    orientation = 1
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+
+        segment_length = int.from_bytes(data[offset + 2 : offset + 4], "big")
+        segment = data[offset + 4 : offset + 2 + segment_length]
+        if marker == 0xE1 and segment.startswith(b"Exif\x00\x00"):
+            orientation = _read_exif_orientation(segment[6:]) or orientation
+        elif marker in JPEG_SOF_MARKERS:
+            if len(segment) < 5:
+                return None
+            height = int.from_bytes(segment[1:3], "big")
+            width = int.from_bytes(segment[3:5], "big")
+            if not width or not height:
+                return None
+            return JpegHeader(width=width, height=height, orientation=orientation)
+        offset += 2 + segment_length
+    return None
+
+
+def _select_decode_flag(width: int, max_width: int) -> tuple[int, int]:
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        if width // factor >= max_width:
+            return factor, flag
+    return 1, cv2.IMREAD_COLOR
+
+
+def _encode_jpeg(img: np.ndarray, quality: int) -> np.ndarray:
+    _, encoded_image = cv2.imencode(
+        ".jpeg", img, [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+    )
+    return encoded_image
+
+
+def encode_jpeg_within_limit(img: np.ndarray, max_bytes: int) -> bytes:
+    """Encode at the default quality, else bisect for the highest quality that fits.
+
+    Encoded size is monotonic in quality, so bisection needs ~4 encodes instead of
+    stepping down one quality level at a time. Returns the smallest encode when
+    nothing fits.
+    """
+    encoded_image = _encode_jpeg(img, JPEG_DEFAULT_QUALITY)
+    if encoded_image.nbytes <= max_bytes:
+        return encoded_image.tobytes()
+
+    best_fit: np.ndarray | None = None
+    smallest = encoded_image
+    low, high = 0, len(JPEG_FALLBACK_QUALITIES) - 1
+    while low <= high:
+        middle = (low + high) // 2
+        candidate = _encode_jpeg(img, JPEG_FALLBACK_QUALITIES[middle])
+        if candidate.nbytes <= max_bytes:
+            best_fit = candidate
+            low = middle + 1
+        else:
+            if candidate.nbytes < smallest.nbytes:
+                smallest = candidate
+            high = middle - 1
+
+    return (best_fit if best_fit is not None else smallest).tobytes()
+
+
+def preprocess_upload(
+    image: bytes, *, max_width: int, max_bytes: int
+) -> tuple[bytes, int, int]:
+    """Return `(jpeg_bytes, height, width)` no wider than `max_width` and within `max_bytes`.
+
+    Upright JPEGs already within limits are passed through untouched. Larger JPEGs
+    are decoded at 1/2, 1/4 or 1/8 scale when that still covers `max_width`, and
+    OpenCV applies EXIF orientation while decoding.
+    """
+    header = read_jpeg_header(image)
+    factor, decode_flag = 1, cv2.IMREAD_COLOR
+    if header is not None:
+        oriented_width, oriented_height = header.oriented_size
+        if (
+            header.orientation == 1
+            and oriented_width <= max_width
+            and len(image) <= max_bytes
+        ):
+            metrics.increment("image_preprocess.passthrough")
+            return image, oriented_height, oriented_width
+        factor, decode_flag = _select_decode_flag(oriented_width, max_width)
+
+    img = cv2.imdecode(np.frombuffer(image, np.uint8), decode_flag)
+    if img is None:
+        raise OCRError("Invalid image")
+    if factor > 1:
+        metrics.increment(f"image_preprocess.reduced_decode.x{factor}")
+
+    img_height, img_width = img.shape[:2]
+    if img_width > max_width:
+        scale_ratio = max_width / img_width
+        img_width = int(img_width * scale_ratio)
+        img_height = int(img_height * scale_ratio)
+        img = cv2.resize(img, (img_width, img_height), interpolation=cv2.INTER_AREA)
+
+    return encode_jpeg_within_limit(img, max_bytes), img_height, img_width
+
+
+PHASH_SAMPLE_SIZE = 32
+PHASH_LOW_FREQUENCY_SIZE = 8
+
+
+def perceptual_hash(image: bytes) -> int | None:
+    """64-bit DCT perceptual hash of an upload, or None when it cannot be decoded.
+
+    Decodes at 1/8 scale in grayscale since the hash only looks at a 32x32
+    thumbnail; re-encodes, rescales and small crops land within a few bits.
+    """
+    img = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if img is None or min(img.shape[:2]) < PHASH_LOW_FREQUENCY_SIZE:
+        img = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+
+    thumbnail = cv2.resize(
+        img, (PHASH_SAMPLE_SIZE, PHASH_SAMPLE_SIZE), interpolation=cv2.INTER_AREA
+    ).astype(np.float32)
+    low_frequencies = cv2.dct(thumbnail)[
+        :PHASH_LOW_FREQUENCY_SIZE, :PHASH_LOW_FREQUENCY_SIZE
+    ]
+    coefficients = low_frequencies.flatten()
+    # The DC term only tracks overall brightness, so keep it out of the median.
+    bits = coefficients > np.median(coefficients[1:])
+    return int("".join("1" if bit else "0" for bit in bits), 2)
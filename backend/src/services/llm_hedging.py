@@ -0,0 +1,136 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.utilities.client import logger
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """Duplicates LLM calls that run past a rolling latency percentile.
+
+    Once `min_samples` latencies are known, a call still running after the
+    `percentile` latency (at least `min_delay_seconds`) gets a second copy. The
+    first copy to succeed wins and the other is cancelled. At most `max_ratio`
+    of calls are hedged, which bounds the extra cost.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        percentile: float,
+        window: int,
+        min_samples: int,
+        min_delay_seconds: float,
+        max_ratio: float,
+    ):
+        self.name = name
+        self._percentile = min(1.0, max(0.0, percentile))
+        self._latencies: deque[float] = deque(maxlen=max(1, window))
+        self._min_samples = max(1, min_samples)
+        self._min_delay_seconds = min_delay_seconds
+        self._max_ratio = max_ratio
+        self._calls = 0
+        self._hedges = 0
+
+    def _metric(self, event: str) -> str:
+        return f"llm.hedge.{self.name}.{event}"
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while too few latencies are known."""
+        if len(self._latencies) < self._min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(self._percentile * len(ordered)))
+        return max(self._min_delay_seconds, ordered[rank - 1])
+
+    def _may_hedge(self) -> bool:
+        return self._hedges + 1 <= self._max_ratio * self._calls
+
+    def _record(self, started: float) -> None:
+        self._latencies.append(time.monotonic() - started)
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        self._calls += 1
+        delay = self.hedge_delay()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        tasks = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._may_hedge():
+                    self._hedges += 1
+                    metrics.increment(self._metric("fired"))
+                    hedge_started = time.monotonic()
+                    hedge = asyncio.ensure_future(call())
+                    tasks.add(hedge)
+                    winner = await self._first_success(tasks, primary)
+                    if winner is hedge:
+                        metrics.increment(self._metric("won"))
+                        self._record(hedge_started)
+                    else:
+                        self._record(started)
+                    logger.info(
+                        "LLM hedge {} fired after {}s, {} won",
+                        self.name,
+                        round(delay, 3),
+                        "hedge" if winner is hedge else "primary",
+                    )
+                    return winner.result()
+            result = await primary
+            self._record(started)
+            return result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _first_success(
+        tasks: set[asyncio.Future], primary: asyncio.Future
+    ) -> asyncio.Future:
+        # A copy that fails early must not beat one that is still running, so only
+        # give up once both have failed, and then raise the primary's error.
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task
+        raise primary.exception()
+
+
+_llm_hedgers: dict[str, RequestHedger] = {}
+
+
+def get_llm_hedger(operation: str, model: str) -> RequestHedger:
+    """Process-wide hedger for one kind of call to `model`; latencies differ per kind."""
+    name = f"{operation}.{model}"
+    hedger = _llm_hedgers.get(name)
+    if hedger is None:
+        hedger = RequestHedger(
+            name,
+            percentile=settings.LLM_HEDGE_PERCENTILE,
+            window=settings.LLM_HEDGE_WINDOW,
+            min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+            min_delay_seconds=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+            max_ratio=settings.LLM_HEDGE_MAX_RATIO,
+        )
+        _llm_hedgers[name] = hedger
+    return hedger
+
+
+async def run_hedged(operation: str, model: str, call: Callable[[], Awaitable[T]]) -> T:
+    """Runs `call`, hedged when `LLM_HEDGING_ENABLED` is set."""
+    if not settings.LLM_HEDGING_ENABLED:
+        return await call()
+    return await get_llm_hedger(operation, model).run(call)
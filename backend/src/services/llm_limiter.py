@@ -0,0 +1,201 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.utilities.client import logger
+
+T = TypeVar("T")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for provider throttling: an OpenAI `RateLimitError` or any HTTP 429."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return status_code == 429
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after = float(headers.get("retry-after", ""))
+    except ValueError:
+        return None
+    return retry_after if retry_after >= 0 else None
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency window for calls to one LLM model.
+
+    Each success grows the window by about one slot per full window of calls. A
+    429 or a latency spike shrinks it by `decrease_factor`, at most once per
+    smoothed latency so a burst of failures counts as one congestion signal.
+    Throttled calls are retried with full-jitter exponential backoff (or the
+    provider's `Retry-After`) and release their slot while they sleep.
+    With `adaptive=False` the window stays at its initial size.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        adaptive: bool = True,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        latency_smoothing: float = 0.2,
+    ):
+        self.name = name
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._window = float(min(self._maximum, max(self._minimum, initial)))
+        self._adaptive = adaptive
+        self._decrease_factor = decrease_factor
+        self._latency_spike_factor = latency_spike_factor
+        self._latency_smoothing = latency_smoothing
+        self._latency_estimate: float | None = None
+        self._last_decrease_at = 0.0
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        return max(self._minimum, int(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _metric(self, event: str) -> str:
+        return f"llm.limiter.{self.name}.{event}"
+
+    def _publish(self) -> None:
+        metrics.set_gauge(self._metric("window"), self.limit)
+        metrics.set_gauge(self._metric("in_flight"), self._in_flight)
+
+    def _wake_waiters(self) -> None:
+        free_slots = self.limit - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    async def _acquire(self) -> None:
+        started = time.monotonic()
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken and cancelled in the same tick: pass the wakeup on.
+                    self._wake_waiters()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        self._in_flight += 1
+        metrics.observe(self._metric("queue_wait_seconds"), time.monotonic() - started)
+        self._publish()
+
+    def _release(self) -> None:
+        # Synchronous so a cancelled call can give its slot back from `finally`.
+        self._in_flight -= 1
+        self._wake_waiters()
+        self._publish()
+
+    def _increase(self) -> None:
+        if self._adaptive:
+            self._window = min(self._maximum, self._window + 1 / self._window)
+
+    def _decrease(self, reason: str) -> None:
+        metrics.increment(self._metric(reason))
+        if not self._adaptive:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease_at < (self._latency_estimate or 0.0):
+            return
+        self._last_decrease_at = now
+        self._window = max(self._minimum, self._window * self._decrease_factor)
+        logger.warning(
+            "LLM limiter {} shrank window to {} ({})", self.name, self.limit, reason
+        )
+
+    def _record_latency(self, latency: float) -> None:
+        estimate = self._latency_estimate
+        if estimate is None:
+            self._latency_estimate = latency
+            self._increase()
+            return
+        self._latency_estimate = estimate + self._latency_smoothing * (
+            latency - estimate
+        )
+        if latency > estimate * self._latency_spike_factor:
+            self._decrease("latency_spikes")
+        else:
+            self._increase()
+
+    def _backoff_delay(self, attempt: int, exc: BaseException) -> float:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(settings.LLM_LIMITER_BACKOFF_MAX_SECONDS, retry_after)
+        ceiling = min(
+            settings.LLM_LIMITER_BACKOFF_MAX_SECONDS,
+            settings.LLM_LIMITER_BACKOFF_BASE_SECONDS * 2**attempt,
+        )
+        return random.uniform(0, ceiling)
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Runs `call` inside the window, retrying it while the provider throttles."""
+        attempt = 0
+        while True:
+            await self._acquire()
+            started = time.monotonic()
+            try:
+                result = await call()
+            except Exception as exc:
+                if not is_rate_limit_error(exc):
+                    raise
+                self._decrease("throttled")
+                if attempt >= settings.LLM_LIMITER_MAX_RETRIES:
+                    metrics.increment(self._metric("gave_up"))
+                    raise
+                delay = self._backoff_delay(attempt, exc)
+            else:
+                self._record_latency(time.monotonic() - started)
+                return result
+            finally:
+                self._release()
+            attempt += 1
+            metrics.increment(self._metric("retries"))
+            await asyncio.sleep(delay)
+
+
+_llm_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_llm_limiter(model: str) -> AdaptiveConcurrencyLimiter:
+    """Process-wide limiter for `model`, shared by every request that calls it."""
+    limiter = _llm_limiters.get(model)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            model,
+            initial=settings.MENU_DISH_FANOUT_CONCURRENCY,
+            minimum=settings.LLM_LIMITER_MIN_CONCURRENCY,
+            maximum=settings.MENU_DISH_FANOUT_MAX_CONCURRENCY,
+            adaptive=settings.MENU_DISH_FANOUT_ADAPTIVE,
+            decrease_factor=settings.LLM_LIMITER_DECREASE_FACTOR,
+            latency_spike_factor=settings.LLM_LIMITER_LATENCY_SPIKE_FACTOR,
+        )
+        _llm_limiters[model] = limiter
+    return limiter
@@ -1,43 +1,216 @@
 import asyncio
 import base64
-import datetime
-import re
+import copy
+import hashlib
+import json
 import time
-from dataclasses import asdict
-from typing import Any, Awaitable
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Protocol
 
-import cv2
-import numpy as np
-from httpx import AsyncClient, HTTPStatusError
+from httpx import HTTPStatusError
 from postgrest import APIError
 
 from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.vendors.http.client import HttpClientRegistry, HttpVendor
 from src.core.vendors.supabase.client import SupabaseClient
-from src.core.vendors.utilities.client import chain, logger, recommendation_chain
-from src.models import Dish
+from src.core.vendors.utilities.client import (
+    batch_chain,
+    chain,
+    logger,
+    recommendation_chain,
+)
+from src.models import Dish, DishBatch
+from src.services.cache import LRUCache, TieredCache, build_cache_backend
+from src.services.deadline import gather_until_deadline, stage_timeout
+from src.services.dish_image_writer import (
+    DISH_IMAGE_TABLE,
+    DishImageWriteBehind,
+    dish_image_columns,
+    is_dish_image_row_stale,
+)
 from src.services.exceptions import OCRError
+from src.services.image_pool import ImagePreprocessPool
+from src.services.image_preprocessing import preprocess_upload
+from src.services.llm_hedging import run_hedged
+from src.services.llm_limiter import AdaptiveConcurrencyLimiter, get_llm_limiter
 from src.services.ocr.layout_grouping_experiment import (
+    build_and_wash_layout_combined,
+    build_layout_wash_lines,
     build_paragraph_layout_experiment,
     wash_layout_lines,
 )
-from src.services.ocr.build_paragraph import build_paragraph, translate
-from src.services.utils import BoundingBox, clean_dish_name, duration
+from src.services.ocr.build_paragraph import (
+    BATCH_TRANSLATION_PROMPT_VERSION,
+    TRANSLATION_PROMPT_VERSION,
+    build_paragraph,
+    speculative_title_lines,
+    translate,
+    translate_batch,
+)
+from src.services.ocr.assignment import (
+    PARAGRAPH_SCORE_LIMIT,
+    PRICE_SCORE_LIMIT,
+    DishBoxIndex,
+    paragraph_candidates,
+    price_candidates,
+    score_matrix,
+    score_paragraph,
+    score_price,
+    select_best,
+    solve_min_cost_assignment,
+)
+from src.services.ocr.geometry import polygon_bounds
+from src.services.ocr.tokenizer import tokenize_line
+from src.services.utils import (
+    BATCH_DISH_INFO_PROMPT_VERSION,
+    DISH_INFO_PROMPT_VERSION,
+    BoundingBox,
+    clean_dish_name,
+    duration,
+)
 
 MAX_IMAGE_WIDTH = 2000
 MAX_IMAGE_SIZE = 4 * 1024 * 1024 - 100  # 4MB
-HTTP_TIMEOUT_SECONDS = 60
-DIP_RESULT_POLL_INTERVAL_SECONDS = 0.5
-DIP_RESULT_TIMEOUT_SECONDS = 6
-
-PRICE_NUMBER_PATTERN = r"(?:\d{1,3}(?:[.,]\d{3})+|\d{1,4})(?:[.,]\d{1,2})?"
-PRICE_ONLY_PATTERN = re.compile(
-    rf"^\s*(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?\s*$",
-    re.IGNORECASE,
-)
-TRAILING_PRICE_CAPTURE_PATTERN = re.compile(
-    rf"(?:[-–—:]\s*)?((?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?)\s*$",
-    re.IGNORECASE,
-)
+
+DISH_INFO_MODE_PER_ITEM = "per_item"
+DISH_INFO_MODE_BATCHED = "batched"
+TRANSLATION_MODE_PER_ITEM = "per_item"
+TRANSLATION_MODE_BATCHED = "batched"
+MERGE_ASSIGNMENT_MODE_GREEDY = "greedy"
+MERGE_ASSIGNMENT_MODE_OPTIMAL = "optimal"
+# Rough structured-output cost of one dish entry (name, translation, one sentence).
+DISH_INFO_OUTPUT_TOKENS_PER_ITEM = 80
+
+_dip_result_cache: TieredCache | None = None
+
+
+def get_dip_result_cache() -> TieredCache:
+    global _dip_result_cache
+    if _dip_result_cache is None:
+        _dip_result_cache = TieredCache(
+            "dip_ocr",
+            max_entries=settings.MENU_DIP_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.MENU_DIP_CACHE_TTL_SECONDS,
+            backend=build_cache_backend(
+                settings.MENU_DIP_CACHE_BACKEND,
+                directory=settings.MENU_DIP_CACHE_DIR,
+                table=settings.MENU_DIP_CACHE_TABLE,
+            ),
+        )
+    return _dip_result_cache
+
+
+_dish_info_cache: TieredCache | None = None
+
+
+def get_dish_info_cache() -> TieredCache:
+    global _dish_info_cache
+    if _dish_info_cache is None:
+        _dish_info_cache = TieredCache(
+            "dish_info",
+            max_entries=settings.MENU_DISH_INFO_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.MENU_DISH_INFO_CACHE_TTL_SECONDS,
+            backend=build_cache_backend(
+                settings.MENU_DISH_INFO_CACHE_BACKEND,
+                path=settings.MENU_DISH_INFO_CACHE_PATH,
+                table=settings.MENU_DISH_INFO_CACHE_TABLE,
+            ),
+        )
+    return _dish_info_cache
+
+
+_translation_cache: TieredCache | None = None
+
+
+def get_translation_cache() -> TieredCache:
+    """Translation memory for paragraph text, shared across requests."""
+    global _translation_cache
+    if _translation_cache is None:
+        _translation_cache = TieredCache(
+            "translation",
+            max_entries=settings.MENU_TRANSLATION_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.MENU_TRANSLATION_CACHE_TTL_SECONDS,
+            backend=build_cache_backend(
+                settings.MENU_TRANSLATION_CACHE_BACKEND,
+                path=settings.MENU_TRANSLATION_CACHE_PATH,
+                table=settings.MENU_TRANSLATION_CACHE_TABLE,
+            ),
+        )
+    return _translation_cache
+
+
+_dish_image_lookup_cache: LRUCache | None = None
+
+
+def get_dish_image_lookup_cache() -> LRUCache:
+    """Image URLs by normalized dish name; an empty tuple records a dish with no images."""
+    global _dish_image_lookup_cache
+    if _dish_image_lookup_cache is None:
+        _dish_image_lookup_cache = LRUCache(
+            settings.MENU_DISH_IMAGE_CACHE_MAX_ENTRIES,
+            settings.MENU_DISH_IMAGE_CACHE_TTL_SECONDS,
+        )
+    return _dish_image_lookup_cache
+
+
+def _resolve_dish_info_model() -> str:
+    return settings.MENU_DISH_INFO_LLM_MODEL or settings.OPENAI_MODEL
+
+
+def dish_info_cache_key(
+    cleaned_name: str,
+    accept_language: str,
+    prompt_version: str = DISH_INFO_PROMPT_VERSION,
+) -> str:
+    """Key for one dish-info answer; `prompt_version` names the prompt that produced it."""
+    raw_key = "\x1f".join(
+        (
+            cleaned_name.casefold(),
+            accept_language,
+            _resolve_dish_info_model(),
+            prompt_version,
+        )
+    )
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def _normalize_paragraph_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def translation_cache_key(
+    text: str,
+    accept_language: str,
+    prompt_version: str = TRANSLATION_PROMPT_VERSION,
+) -> str:
+    """Key for one translation; `prompt_version` names the prompt that produced it."""
+    raw_key = "\x1f".join(
+        (
+            _normalize_paragraph_text(text),
+            accept_language,
+            settings.OPENAI_MODEL,
+            prompt_version,
+        )
+    )
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def _dip_cache_key(image: bytes, preserve_raw_lines: bool) -> str:
+    digest = hashlib.sha256(image).hexdigest()
+    return f"{digest}-{'raw' if preserve_raw_lines else 'filtered'}"
+
+
+class MenuAnalysisListener(Protocol):
+    """Receives partial pipeline output while an analysis is still running."""
+
+    def on_ocr_boxes(self, boxes: list[dict[str, float]]) -> None:
+        ...
+
+    def on_dish(self, line_index: int, dish: dict[str, Any], box: dict[str, float]) -> None:
+        ...
+
+
+DishResolvedCallback = Callable[[int, dict[str, Any]], None]
 
 
 def _resolve_language(accept_language: str | None) -> str:
@@ -56,21 +229,19 @@ def _unknown_dish_result() -> dict[str, Any]:
     }
 
 
-def _extract_price_token(text: str) -> str | None:
-    stripped = text.strip()
-    if not stripped:
-        return None
-    if PRICE_ONLY_PATTERN.fullmatch(stripped):
-        return stripped
-    trailing = TRAILING_PRICE_CAPTURE_PATTERN.search(stripped)
-    if trailing is None:
-        return None
-    token = trailing.group(1).strip()
-    return token or None
+def _pending_dish_result(text: str) -> dict[str, Any]:
+    # Still unresolved when the request deadline ran out; keeps the OCR text.
+    return {
+        "description": None,
+        "text": text,
+        "text_translation": None,
+        "img_src": None,
+        "pending": True,
+    }
 
 
-def _bbox_center(box: dict[str, float]) -> tuple[float, float]:
-    return box["x"] + box["w"] / 2.0, box["y"] + box["h"] / 2.0
+def _extract_price_token(text: str) -> str | None:
+    return tokenize_line(text).price_token
 
 
 def _bbox_union(a: dict[str, float], b: dict[str, float]) -> dict[str, float]:
@@ -86,69 +257,35 @@ def _bbox_union(a: dict[str, float], b: dict[str, float]) -> dict[str, float]:
     }
 
 
-def _horizontal_overlap_ratio(a: dict[str, float], b: dict[str, float]) -> float:
-    overlap_left = max(a["x"], b["x"])
-    overlap_right = min(a["x"] + a["w"], b["x"] + b["w"])
-    overlap = max(0.0, overlap_right - overlap_left)
-    base = max(1e-6, min(a["w"], b["w"]))
-    return overlap / base
-
-
 def _select_best_dish_index_for_paragraph(
-    dish_boxes: list[dict[str, float]],
+    dish_index: DishBoxIndex,
     paragraph_box: dict[str, float],
 ) -> int | None:
-    if not dish_boxes:
-        return None
-
-    paragraph_center_x, paragraph_center_y = _bbox_center(paragraph_box)
-    best_idx: int | None = None
-    best_score = float("inf")
-    for idx, dish_box in enumerate(dish_boxes):
-        dish_center_x, dish_center_y = _bbox_center(dish_box)
-        vertical_delta = paragraph_center_y - dish_center_y
-        horizontal_distance = abs(paragraph_center_x - dish_center_x)
-        overlap_ratio = _horizontal_overlap_ratio(dish_box, paragraph_box)
-        score = (
-            abs(vertical_delta) * 1.8
-            + horizontal_distance * 0.9
-            + (1.0 - overlap_ratio) * 0.6
-        )
-        if vertical_delta < -0.04:
-            score += 0.7
-        if vertical_delta > 0.35:
-            score += 0.9
-        if score < best_score:
-            best_score = score
-            best_idx = idx
-
-    return best_idx if best_score < 2.0 else None
+    candidates = paragraph_candidates(dish_index, paragraph_box)
+    scores = score_paragraph(dish_index, candidates, paragraph_box)
+    return select_best(candidates, scores, PARAGRAPH_SCORE_LIMIT)
 
 
 def _select_best_dish_index_for_price(
-    dish_boxes: list[dict[str, float]],
+    dish_index: DishBoxIndex,
     price_box: dict[str, float],
 ) -> int | None:
-    if not dish_boxes:
-        return None
+    candidates = price_candidates(dish_index, price_box)
+    scores = score_price(dish_index, candidates, price_box)
+    return select_best(candidates, scores, PRICE_SCORE_LIMIT)
 
-    price_center_x, price_center_y = _bbox_center(price_box)
-    best_idx: int | None = None
-    best_score = float("inf")
-    for idx, dish_box in enumerate(dish_boxes):
-        dish_center_x, dish_center_y = _bbox_center(dish_box)
-        vertical_distance = abs(price_center_y - dish_center_y)
-        horizontal_distance = abs(price_center_x - dish_center_x)
-        score = vertical_distance * 3.0 + horizontal_distance * 0.8
-        if price_center_x < dish_center_x:
-            score += 0.4
-        if vertical_distance > 0.18:
-            score += 1.0
-        if score < best_score:
-            best_score = score
-            best_idx = idx
-
-    return best_idx if best_score < 1.6 else None
+
+def _plan_context_assignments(
+    dish_index: DishBoxIndex,
+    context_boxes: list[dict[str, float]],
+    *,
+    kind: str,
+) -> dict[int, int]:
+    """One-to-one context->dish matches minimising total score, for `optimal` mode."""
+    if settings.MENU_MERGE_ASSIGNMENT_MODE != MERGE_ASSIGNMENT_MODE_OPTIMAL or not context_boxes:
+        return {}
+    limit = PARAGRAPH_SCORE_LIMIT if kind == "paragraph" else PRICE_SCORE_LIMIT
+    return solve_min_cost_assignment(score_matrix(dish_index, context_boxes, kind=kind), limit)
 
 
 def merge_grouped_context_into_dishes(
@@ -176,18 +313,30 @@ def merge_grouped_context_into_dishes(
     if not merged_info:
         return merged_info, merged_boxes
 
-    paragraph_assignments = 0
+    dish_index = DishBoxIndex(merged_boxes)
+    paragraphs = []
     for paragraph_meta, paragraph_box in zip(paragraph_info, paragraph_boxes, strict=False):
+        if paragraph_meta.get("pending"):
+            continue
         paragraph_text = str(
             paragraph_meta.get("description")
             or paragraph_meta.get("text_translation")
             or paragraph_meta.get("text")
             or ""
         ).strip()
-        if not paragraph_text:
-            continue
+        if paragraph_text:
+            paragraphs.append((paragraph_text, paragraph_box))
+    planned_paragraphs = _plan_context_assignments(
+        dish_index,
+        [paragraph_box for _, paragraph_box in paragraphs],
+        kind="paragraph",
+    )
 
-        best_dish_idx = _select_best_dish_index_for_paragraph(merged_boxes, paragraph_box)
+    paragraph_assignments = 0
+    for paragraph_pos, (paragraph_text, paragraph_box) in enumerate(paragraphs):
+        best_dish_idx = planned_paragraphs.get(paragraph_pos)
+        if best_dish_idx is None:
+            best_dish_idx = _select_best_dish_index_for_paragraph(dish_index, paragraph_box)
         if best_dish_idx is None:
             continue
 
@@ -200,16 +349,26 @@ def merge_grouped_context_into_dishes(
             else:
                 merged_info[best_dish_idx]["description"] = paragraph_text
         merged_boxes[best_dish_idx] = _bbox_union(merged_boxes[best_dish_idx], paragraph_box)
+        dish_index.update(best_dish_idx, merged_boxes[best_dish_idx])
         paragraph_assignments += 1
 
     price_assignments = 0
     if price_lines and price_boxes:
+        prices = []
         for line, price_box in zip(price_lines, price_boxes, strict=False):
             price_token = _extract_price_token(str(line.get("content", "")))
-            if not price_token:
-                continue
+            if price_token:
+                prices.append((price_token, price_box))
+        planned_prices = _plan_context_assignments(
+            dish_index,
+            [price_box for _, price_box in prices],
+            kind="price",
+        )
 
-            best_dish_idx = _select_best_dish_index_for_price(merged_boxes, price_box)
+        for price_pos, (price_token, price_box) in enumerate(prices):
+            best_dish_idx = planned_prices.get(price_pos)
+            if best_dish_idx is None:
+                best_dish_idx = _select_best_dish_index_for_price(dish_index, price_box)
             if best_dish_idx is None:
                 continue
 
@@ -219,6 +378,7 @@ def merge_grouped_context_into_dishes(
             elif price_token.casefold() not in existing_price.casefold():
                 merged_info[best_dish_idx]["price"] = f"{existing_price} / {price_token}"
             merged_boxes[best_dish_idx] = _bbox_union(merged_boxes[best_dish_idx], price_box)
+            dish_index.update(best_dish_idx, merged_boxes[best_dish_idx])
             price_assignments += 1
 
     logger.info(
@@ -231,61 +391,20 @@ def merge_grouped_context_into_dishes(
     return merged_info, merged_boxes
 
 
-async def _gather_with_limit(
-    coroutines: list[Awaitable[Any]],
-    concurrency_limit: int,
-) -> list[Any]:
-    if not coroutines:
-        return []
-
-    semaphore = asyncio.Semaphore(max(1, concurrency_limit))
-
-    async def _run(coroutine: Awaitable[Any]) -> Any:
-        async with semaphore:
-            return await coroutine
-
-    return await asyncio.gather(*[_run(coroutine) for coroutine in coroutines])
-
-
-def _resolve_fanout_concurrency(task_count: int) -> int:
-    base_limit = max(1, settings.MENU_DISH_FANOUT_CONCURRENCY)
-    max_limit = max(base_limit, settings.MENU_DISH_FANOUT_MAX_CONCURRENCY)
-
-    if task_count <= 0:
-        return base_limit
-    if not settings.MENU_DISH_FANOUT_ADAPTIVE:
-        return base_limit
-
-    return min(max_limit, max(base_limit, task_count))
+def _dish_info_limiter() -> AdaptiveConcurrencyLimiter:
+    # Dish and paragraph fan-out gate each LLM call, not the whole task, so image
+    # lookups never hold a slot and throttled calls can be retried on their own.
+    return get_llm_limiter(_resolve_dish_info_model())
 
 
 @duration
 def process_image(image: bytes) -> tuple[bytes, int, int]:
-    data = np.frombuffer(image, np.uint8)
-    img = cv2.imdecode(data, cv2.IMREAD_COLOR)
-    if img is None:
-        raise OCRError("Invalid image")
-
-    img_height, img_width, _ = img.shape
-
-    if img_width > MAX_IMAGE_WIDTH:
-        scale_ratio = MAX_IMAGE_WIDTH / img_width
-        img_width = int(img_width * scale_ratio)
-        img_height = int(img_height * scale_ratio)
-        img = cv2.resize(img, (img_width, img_height), interpolation=cv2.INTER_AREA)
+    return preprocess_upload(image, max_width=MAX_IMAGE_WIDTH, max_bytes=MAX_IMAGE_SIZE)
 
-    quality = 80
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-    _, encoded_image = cv2.imencode(".jpeg", img, encode_param)
 
-    while encoded_image.nbytes > MAX_IMAGE_SIZE:
-        quality -= 15
-        if quality <= 5:
-            break
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-        _, encoded_image = cv2.imencode(".jpeg", img, encode_param)
-
-    return encoded_image.tobytes(), img_height, img_width
+async def preprocess_image(image: bytes) -> tuple[bytes, int, int]:
+    """Run `process_image` on the bounded preprocessing pool."""
+    return await ImagePreprocessPool.run(process_image, image)
 
 
 @duration
@@ -300,8 +419,8 @@ async def post_dip_request(image: bytes) -> str:
     )
     payload = {"base64Source": base64.b64encode(image).decode("utf-8")}
 
-    async with AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.post(url, json=payload, headers=headers)
+    client = HttpClientRegistry.get_client(HttpVendor.AZURE_DIP)
+    response = await client.post(url, json=payload, headers=headers)
 
     response.raise_for_status()
     operation_location = response.headers.get("Operation-Location")
@@ -310,55 +429,302 @@ async def post_dip_request(image: bytes) -> str:
     return operation_location
 
 
+class DipLatencyEstimator:
+    """Per-process moving estimate of how long DIP jobs take to complete."""
+
+    def __init__(self, initial_estimate_seconds: float, smoothing: float = 0.2):
+        self._estimate_seconds = initial_estimate_seconds
+        self._smoothing = smoothing
+
+    @property
+    def estimate_seconds(self) -> float:
+        return self._estimate_seconds
+
+    def first_poll_delay(self) -> float:
+        delay = self._estimate_seconds * settings.DIP_POLL_FIRST_POLL_RATIO
+        return min(
+            settings.DIP_POLL_MAX_INTERVAL_SECONDS,
+            max(settings.DIP_POLL_MIN_INTERVAL_SECONDS, delay),
+        )
+
+    def record(self, completion_seconds: float) -> None:
+        self._estimate_seconds += self._smoothing * (
+            completion_seconds - self._estimate_seconds
+        )
+
+
+dip_latency_estimator = DipLatencyEstimator(settings.DIP_POLL_INITIAL_ESTIMATE_SECONDS)
+
+
+def _parse_retry_after(raw_value: str | None) -> float | None:
+    if not raw_value:
+        return None
+    try:
+        retry_after = float(raw_value)
+    except ValueError:
+        return None
+    return retry_after if retry_after >= 0 else None
+
+
+def _next_poll_delay(previous_delay: float) -> float:
+    return min(
+        settings.DIP_POLL_MAX_INTERVAL_SECONDS,
+        max(
+            settings.DIP_POLL_MIN_INTERVAL_SECONDS,
+            previous_delay * settings.DIP_POLL_BACKOFF_FACTOR,
+        ),
+    )
+
+
+def _record_dip_poll_metrics(polls: int, waited_seconds: float, outcome: str) -> None:
+    metrics.increment(f"dip.poll.outcome.{outcome}")
+    metrics.observe("dip.poll.count", polls)
+    metrics.observe("dip.poll.wait_seconds", waited_seconds)
+    metrics.set_gauge("dip.poll.estimate_seconds", dip_latency_estimator.estimate_seconds)
+    logger.info(
+        "DIP polling outcome={} polls={} waited={}s estimate={}s",
+        outcome,
+        polls,
+        round(waited_seconds, 3),
+        round(dip_latency_estimator.estimate_seconds, 3),
+    )
+
+
 async def retrieve_dip_results(
-    retrieve_url: str, timeout: int = DIP_RESULT_TIMEOUT_SECONDS
+    retrieve_url: str, timeout: float | None = None
 ) -> dict[str, Any] | None:
     headers = {
         "Ocp-Apim-Subscription-Key": settings.AZURE_DIP_API_KEY,
         "content-type": "application/json",
     }
+    budget_seconds = (
+        stage_timeout(settings.DIP_RESULT_TIMEOUT_SECONDS) if timeout is None else timeout
+    )
 
+    client = HttpClientRegistry.get_client(HttpVendor.AZURE_DIP)
     start_time = time.monotonic()
-    async with AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
-        while True:
-            response = await client.get(retrieve_url, headers=headers)
-            response.raise_for_status()
-            result = response.json()
+    deadline = start_time + budget_seconds
+    delay = dip_latency_estimator.first_poll_delay()
+    backoff_delay = delay
+    polls = 0
+    waited_seconds = 0.0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _record_dip_poll_metrics(polls, waited_seconds, "timeout")
+            return None
+        sleep_for = min(delay, remaining)
+        await asyncio.sleep(sleep_for)
+        waited_seconds += sleep_for
+
+        response = await client.get(retrieve_url, headers=headers)
+        polls += 1
+        retry_after = (
+            _parse_retry_after(response.headers.get("Retry-After"))
+            if settings.DIP_POLL_HONOR_RETRY_AFTER
+            else None
+        )
+        if response.status_code == 429:
+            backoff_delay = _next_poll_delay(backoff_delay)
+            delay = retry_after if retry_after is not None else backoff_delay
+            continue
+        response.raise_for_status()
+        result = response.json()
 
-            status = str(result.get("status", "")).lower()
-            if status == "succeeded":
-                return result
-            if status not in {"running", "notstarted"}:
-                return None
-            if time.monotonic() - start_time > timeout:
-                return None
+        status = str(result.get("status", "")).lower()
+        if status == "succeeded":
+            dip_latency_estimator.record(time.monotonic() - start_time)
+            _record_dip_poll_metrics(polls, waited_seconds, "succeeded")
+            return result
+        if status not in {"running", "notstarted"}:
+            _record_dip_poll_metrics(polls, waited_seconds, "failed")
+            return None
 
-            await asyncio.sleep(DIP_RESULT_POLL_INTERVAL_SECONDS)
+        backoff_delay = _next_poll_delay(backoff_delay)
+        delay = retry_after if retry_after is not None else backoff_delay
+
+
+def _dish_info_payload(dish: Dish) -> dict[str, Any]:
+    return {
+        "description": dish.dish_description,
+        "text": dish.dish_name,
+        "text_translation": dish.dish_translation,
+    }
 
 
 @duration
 async def get_dish_info_via_openai(dish_name: str, accept_language: str) -> dict[str, Any]:
     try:
-        dish: Dish = await chain.ainvoke(
-            {"dish_name": dish_name, "accept_language": accept_language}
+        # Each hedge copy queues in the limiter like any other call.
+        dish: Dish = await run_hedged(
+            "dish_info",
+            _resolve_dish_info_model(),
+            lambda: _dish_info_limiter().run(
+                lambda: chain.ainvoke(
+                    {"dish_name": dish_name, "accept_language": accept_language}
+                )
+            ),
         )
     except Exception as exc:  # defensive catch for LLM/provider failures
         logger.error(exc)
-        dish = Dish(dish_name="Unknown")
+        # Provider failures are transient; only cache answers the model actually gave.
+        return _dish_info_payload(Dish(dish_name="Unknown"))
+
+    dish_info = _dish_info_payload(dish)
+    await _store_dish_info(dish_name, accept_language, dish_info)
+    return dish_info
+
+
+async def _store_dish_info(
+    cleaned_name: str,
+    accept_language: str,
+    dish_info: dict[str, Any],
+    prompt_version: str = DISH_INFO_PROMPT_VERSION,
+) -> None:
+    if not settings.MENU_DISH_INFO_CACHE_ENABLED:
+        return
+    is_unknown = dish_info["text"] == "Unknown"
+    metrics.increment(
+        "dish_info.cache.store_negative" if is_unknown else "dish_info.cache.store"
+    )
+    await get_dish_info_cache().set(
+        dish_info_cache_key(cleaned_name, accept_language, prompt_version),
+        dish_info,
+        ttl_seconds=settings.MENU_DISH_INFO_CACHE_NEGATIVE_TTL_SECONDS
+        if is_unknown
+        else None,
+    )
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def plan_dish_info_batches(
+    cleaned_names: list[str],
+    *,
+    token_budget: int,
+    max_items: int,
+) -> list[list[int]]:
+    """Split names into index batches whose estimated prompt+output tokens fit the budget."""
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for idx, name in enumerate(cleaned_names):
+        item_tokens = _estimate_tokens(name) + DISH_INFO_OUTPUT_TOKENS_PER_ITEM
+        if current and (
+            current_tokens + item_tokens > token_budget or len(current) >= max_items
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(idx)
+        current_tokens += item_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _align_dish_batch(
+    dish_batch: DishBatch,
+    total_items: int,
+) -> list[dict[str, Any] | None]:
+    aligned: list[dict[str, Any] | None] = [None] * total_items
+    for entry in dish_batch.dishes:
+        if entry.index < 0 or entry.index >= total_items:
+            logger.warning("Skipping out-of-range index {} in dish batch output", entry.index)
+            continue
+        if aligned[entry.index] is not None:
+            logger.warning("Skipping duplicated index {} in dish batch output", entry.index)
+            continue
+        aligned[entry.index] = _dish_info_payload(entry)
+    return aligned
+
+
+@duration
+async def get_dish_info_batch_via_openai(
+    cleaned_names: list[str],
+    accept_language: str,
+) -> list[dict[str, Any] | None]:
+    dish_items = [{"index": idx, "text": name} for idx, name in enumerate(cleaned_names)]
+    try:
+        dish_batch: DishBatch = await _dish_info_limiter().run(
+            lambda: batch_chain.ainvoke(
+                {
+                    "dish_items": json.dumps(dish_items, ensure_ascii=False),
+                    "accept_language": accept_language,
+                }
+            )
+        )
+    except Exception as exc:  # defensive catch for LLM/provider/parse failures
+        logger.error("Dish batch LLM call failed size={}: {}", len(cleaned_names), exc)
+        return [None] * len(cleaned_names)
+    return _align_dish_batch(dish_batch, len(cleaned_names))
 
-    return {
-        "description": dish.dish_description,
-        "text": dish.dish_name,
-        "text_translation": dish.dish_translation,
-    }
+
+async def resolve_dish_info_batched(
+    cleaned_names: list[str],
+    accept_language: str,
+) -> list[dict[str, Any]]:
+    batches = plan_dish_info_batches(
+        cleaned_names,
+        token_budget=settings.MENU_DISH_INFO_BATCH_TOKEN_BUDGET,
+        max_items=settings.MENU_DISH_INFO_BATCH_MAX_ITEMS,
+    )
+
+    async def _run_batch(indices: list[int]) -> list[tuple[int, dict[str, Any] | None]]:
+        batch_names = [cleaned_names[idx] for idx in indices]
+        aligned = await get_dish_info_batch_via_openai(batch_names, accept_language)
+        return list(zip(indices, aligned, strict=True))
+
+    batch_results = await asyncio.gather(*[_run_batch(indices) for indices in batches])
+    resolved: list[dict[str, Any] | None] = [None] * len(cleaned_names)
+    for pairs in batch_results:
+        for idx, dish_info in pairs:
+            resolved[idx] = dish_info
+
+    missing_indices = [idx for idx, dish_info in enumerate(resolved) if dish_info is None]
+    await asyncio.gather(
+        *[
+            _store_dish_info(
+                cleaned_names[idx],
+                accept_language,
+                dish_info,
+                BATCH_DISH_INFO_PROMPT_VERSION,
+            )
+            for idx, dish_info in enumerate(resolved)
+            if dish_info is not None
+        ]
+    )
+    if missing_indices:
+        # Per-item fallback for entries the batch call dropped or failed to parse.
+        fallback_results = await asyncio.gather(
+            *[
+                get_dish_info_via_openai(cleaned_names[idx], accept_language)
+                for idx in missing_indices
+            ]
+        )
+        for idx, dish_info in zip(missing_indices, fallback_results, strict=True):
+            resolved[idx] = dish_info
+
+    metrics.increment("dish_info.batch.calls", len(batches))
+    metrics.increment("dish_info.batch.items", len(cleaned_names))
+    metrics.increment("dish_info.batch.fallback_items", len(missing_indices))
+    logger.info(
+        "Dish batch stats items={} batches={} fallback_items={}",
+        len(cleaned_names),
+        len(batches),
+        len(missing_indices),
+    )
+    return [dish_info or _unknown_dish_result() for dish_info in resolved]
 
 
 async def retrieve_dish_image(dish_name: str, num_img: int = 10) -> list[str] | None:
     supabase = await SupabaseClient.get_client()
 
     response = (
-        await supabase.table("dish")
-        .select("img_urls")
+        await supabase.table(DISH_IMAGE_TABLE)
+        .select(dish_image_columns())
         .eq("dish_name", dish_name)
         .execute()
     )
@@ -366,34 +732,76 @@ async def retrieve_dish_image(dish_name: str, num_img: int = 10) -> list[str] |
     if not response.data or not response.data[0].get("img_urls"):
         return None
 
+    _refresh_if_stale(dish_name, response.data[0])
     urls = response.data[0]["img_urls"]
     return urls[:num_img]
 
 
-async def cache_dish_image(dish_name: str, image_links: list[str]):
-    data = {"dish_name": dish_name, "img_urls": image_links}
-    supabase = await SupabaseClient.get_client()
+def _refresh_if_stale(dish_name: str, row: dict) -> None:
+    # Stale-while-revalidate: the caller still gets the stored URLs.
+    if is_dish_image_row_stale(row):
+        metrics.increment("dish_image.stale_served")
+        DishImageWriteBehind.schedule_refresh(dish_name, query_dish_image_via_google)
 
-    existing_record = (
-        await supabase.table("dish").select("*").eq("dish_name", dish_name).execute()
-    )
 
-    if not existing_record.data:
-        await supabase.table("dish").insert(data).execute()
-        return "build cache"
+def _normalize_dish_image_name(dish_name: str) -> str:
+    return dish_name.lower().replace(" ", "_")
 
-    now = datetime.datetime.now(datetime.UTC)
-    created_at = datetime.datetime.fromisoformat(existing_record.data[0]["created_at"])
-    if (now - created_at) > datetime.timedelta(days=3):
-        await (
-            supabase.table("dish")
-            .update({"img_urls": image_links})
-            .eq("dish_name", dish_name)
-            .execute()
-        )
-        return "update cache"
 
-    return "no cache"
+async def prefetch_dish_images(dish_names: Iterable[str]) -> dict[str, tuple[str, ...]]:
+    """Look up stored images for many dishes with one `in_` query per chunk.
+
+    Names already in the in-process cache are skipped. Every queried name is in the
+    result, mapped to an empty tuple when the table has no images for it, so
+    per-dish lookups can go straight to image search.
+    """
+    lookup_cache = get_dish_image_lookup_cache()
+    pending = [
+        name
+        for name in dict.fromkeys(_normalize_dish_image_name(name) for name in dish_names)
+        if lookup_cache.get(name) is None
+    ]
+    if not pending:
+        return {}
+
+    chunk_size = max(1, settings.MENU_DISH_IMAGE_PREFETCH_CHUNK_SIZE)
+    chunks = [pending[start : start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    try:
+        supabase = await SupabaseClient.get_client()
+        responses = await asyncio.gather(
+            *[
+                supabase.table(DISH_IMAGE_TABLE)
+                .select(dish_image_columns("dish_name"))
+                .in_("dish_name", chunk)
+                .execute()
+                for chunk in chunks
+            ]
+        )
+    except APIError as exc:
+        DishImageWriteBehind.note_schema_error(exc)
+        logger.error("Error prefetching dish image cache from Supabase")
+        return {}
+
+    prefetched: dict[str, tuple[str, ...]] = {}
+    for response in responses:
+        for row in response.data or []:
+            name = row.get("dish_name")
+            if name in prefetched or name not in pending:
+                continue
+            prefetched[name] = tuple(row.get("img_urls") or ())
+            if prefetched[name]:
+                lookup_cache.set(name, prefetched[name])
+                _refresh_if_stale(name, row)
+    for name in pending:
+        prefetched.setdefault(name, ())
+
+    metrics.increment("dish_image.prefetch.queries", len(chunks))
+    metrics.increment("dish_image.prefetch.names", len(pending))
+    metrics.increment(
+        "dish_image.prefetch.found",
+        sum(1 for urls in prefetched.values() if urls),
+    )
+    return prefetched
 
 
 async def query_dish_image_via_google(dish_name: str | None) -> list[str] | None:
@@ -407,8 +815,8 @@ async def query_dish_image_via_google(dish_name: str | None) -> list[str] | None
         "key": settings.GOOGLE_IMG_SEARCH_KEY,
     }
 
-    async with AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
-        response = await client.get(settings.GOOGLE_IMG_SEARCH_URL, params=querystring)
+    client = HttpClientRegistry.get_client(HttpVendor.GOOGLE_SEARCH)
+    response = await client.get(settings.GOOGLE_IMG_SEARCH_URL, params=querystring)
 
     response.raise_for_status()
     result = response.json()
@@ -424,26 +832,45 @@ async def get_dish_image(
     num_img: int = 10,
     *,
     enable_cache: bool = False,
+    prefetched: Mapping[str, tuple[str, ...]] | None = None,
 ) -> list[str] | None:
     if dish_name is None:
         return None
 
-    normalized_dish_name = dish_name.lower().replace(" ", "_")
+    normalized_dish_name = _normalize_dish_image_name(dish_name)
 
     if enable_cache:
-        try:
-            if cached_results := await retrieve_dish_image(normalized_dish_name, num_img):
-                return cached_results
-        except APIError:
-            logger.error("Error fetching dish image cache from Supabase")
+        lookup_cache = get_dish_image_lookup_cache()
+        if (cached_urls := lookup_cache.get(normalized_dish_name)) is not None:
+            metrics.increment("dish_image.memory_hits")
+            return list(cached_urls[:num_img]) or None
+        if prefetched is not None and normalized_dish_name in prefetched:
+            # The prefetch already read the table; only its misses go on to image search.
+            if prefetched_urls := prefetched[normalized_dish_name]:
+                metrics.increment("dish_image.prefetch.served")
+                lookup_cache.set(normalized_dish_name, prefetched_urls)
+                return list(prefetched_urls[:num_img])
+        else:
+            try:
+                if cached_results := await retrieve_dish_image(normalized_dish_name, num_img):
+                    lookup_cache.set(normalized_dish_name, tuple(cached_results))
+                    return cached_results
+            except APIError as exc:
+                DishImageWriteBehind.note_schema_error(exc)
+                logger.error("Error fetching dish image cache from Supabase")
 
     image_links = await query_dish_image_via_google(normalized_dish_name)
 
-    if enable_cache and image_links:
-        try:
-            asyncio.create_task(cache_dish_image(normalized_dish_name, image_links))
-        except APIError:
-            logger.error("Error writing dish image cache to Supabase")
+    if enable_cache:
+        if image_links:
+            get_dish_image_lookup_cache().set(normalized_dish_name, tuple(image_links))
+            DishImageWriteBehind.enqueue(normalized_dish_name, image_links)
+        else:
+            get_dish_image_lookup_cache().set(
+                normalized_dish_name,
+                (),
+                settings.MENU_DISH_IMAGE_CACHE_NEGATIVE_TTL_SECONDS,
+            )
 
     return image_links[:num_img] if image_links else None
 
@@ -460,13 +887,26 @@ async def get_dish_data(
         return _unknown_dish_result()
 
     dish = await get_dish_info_via_openai(cleaned_name, accept_language)
+    return await attach_dish_image(dish, include_images=include_images)
+
 
+async def attach_dish_image(
+    dish: dict[str, Any],
+    *,
+    include_images: bool = True,
+    prefetched: Mapping[str, tuple[str, ...]] | None = None,
+) -> dict[str, Any]:
     img_src = None
     if include_images:
         try:
             if dish.get("text") == "Unknown":
                 raise OCRError("Unknown dish name")
-            img_src = await get_dish_image(dish.get("text"), 10, enable_cache=True)
+            img_src = await get_dish_image(
+                dish.get("text"),
+                10,
+                enable_cache=True,
+                prefetched=prefetched,
+            )
         except (HTTPStatusError, OCRError, APIError):
             img_src = None
 
@@ -474,7 +914,14 @@ async def get_dish_data(
 
 
 async def get_paragraph_data(dish_name: str, accept_language: str) -> dict[str, Any]:
-    paragraph_translation = await translate(dish_name, accept_language)
+    paragraph_translation = await get_llm_limiter(settings.OPENAI_MODEL).run(
+        lambda: translate(dish_name, accept_language)
+    )
+    await _store_translation(dish_name, accept_language, paragraph_translation)
+    return _paragraph_payload(paragraph_translation)
+
+
+def _paragraph_payload(paragraph_translation: str) -> dict[str, Any]:
     return {
         "description": paragraph_translation,
         "text": paragraph_translation,
@@ -483,6 +930,97 @@ async def get_paragraph_data(dish_name: str, accept_language: str) -> dict[str,
     }
 
 
+async def _store_translation(
+    text: str,
+    accept_language: str,
+    translation: str,
+    prompt_version: str = TRANSLATION_PROMPT_VERSION,
+) -> None:
+    if settings.MENU_TRANSLATION_CACHE_ENABLED and translation:
+        await get_translation_cache().set(
+            translation_cache_key(text, accept_language, prompt_version), translation
+        )
+
+
+def _translation_prompt_versions() -> tuple[str, ...]:
+    # Batched mode falls back to per-item calls for dropped entries, so it also
+    # reads their answers; per-item mode never reads batch-prompt answers.
+    if settings.MENU_TRANSLATION_MODE == TRANSLATION_MODE_BATCHED:
+        return (BATCH_TRANSLATION_PROMPT_VERSION, TRANSLATION_PROMPT_VERSION)
+    return (TRANSLATION_PROMPT_VERSION,)
+
+
+async def _cached_translations(
+    texts: list[str],
+    accept_language: str,
+    prompt_versions: tuple[str, ...] = (TRANSLATION_PROMPT_VERSION,),
+) -> dict[str, str]:
+    """Cached translations by input text, first matching prompt version wins.
+
+    Empty when the translation memory is off.
+    """
+    if not settings.MENU_TRANSLATION_CACHE_ENABLED or not texts:
+        return {}
+    cache_keys = {
+        text: [
+            translation_cache_key(text, accept_language, prompt_version)
+            for prompt_version in prompt_versions
+        ]
+        for text in texts
+    }
+    cached_values = await get_translation_cache().get_many(
+        [cache_key for keys in cache_keys.values() for cache_key in keys]
+    )
+    cached: dict[str, str] = {}
+    for text, keys in cache_keys.items():
+        cached_key = next((key for key in keys if key in cached_values), None)
+        if cached_key is not None:
+            cached[text] = cached_values[cached_key]
+    return cached
+
+
+async def _translate_paragraph_chunk(
+    texts: list[str], accept_language: str
+) -> list[str | None]:
+    try:
+        return await asyncio.wait_for(
+            get_llm_limiter(settings.OPENAI_MODEL).run(
+                lambda: translate_batch(texts, accept_language)
+            ),
+            timeout=stage_timeout(settings.LLM_TIMEOUT_SECONDS),
+        )
+    except Exception as exc:  # defensive catch for LLM/provider/parse failures
+        logger.error("Paragraph batch translation failed size={}: {}", len(texts), exc)
+        return [None] * len(texts)
+
+
+async def translate_paragraphs_batched(
+    texts: list[str], accept_language: str
+) -> list[str | None]:
+    """Index-aligned translations of `texts`, `MENU_TRANSLATION_BATCH_MAX_ITEMS` per call.
+
+    Entries a call dropped or failed on are None; callers fall back per item.
+    """
+    chunk_size = max(1, settings.MENU_TRANSLATION_BATCH_MAX_ITEMS)
+    chunks = [texts[start : start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    chunk_results = await asyncio.gather(
+        *[_translate_paragraph_chunk(chunk, accept_language) for chunk in chunks]
+    )
+    translations = [translation for chunk in chunk_results for translation in chunk]
+    await asyncio.gather(
+        *[
+            _store_translation(
+                text, accept_language, translation, BATCH_TRANSLATION_PROMPT_VERSION
+            )
+            for text, translation in zip(texts, translations, strict=True)
+            if translation is not None
+        ]
+    )
+    metrics.increment("translation.batch.calls", len(chunks))
+    metrics.increment("translation.batch.items", len(texts))
+    return translations
+
+
 def normalize_bounding_box(
     img_width: int,
     img_height: int,
@@ -508,18 +1046,9 @@ def normalize_bounding_box(
 
 
 def normalize_text_bbox_dip(img_width: int, img_height: int, ocr_results: list[dict]):
-    texts_bboxes = []
-    for line in ocr_results:
-        texts_bboxes.append(
-            asdict(
-                normalize_bounding_box(
-                    img_width,
-                    img_height,
-                    azure_dip_polygon=line["polygon"],
-                )
-            )
-        )
-    return texts_bboxes
+    if any(not line.get("polygon") for line in ocr_results):
+        raise OCRError("Missing DIP polygon for bounding box normalization")
+    return polygon_bounds(ocr_results).to_bounding_boxes(img_width, img_height)
 
 
 def serialize_dish_data_filtered(dish_data: list[dict], bounding_boxes: list[dict]):
@@ -581,6 +1110,15 @@ def filter_dip_lines(
 
 @duration
 async def run_dip(image: bytes, *, preserve_raw_lines: bool = False) -> list[dict]:
+    cache_key: str | None = None
+    if settings.MENU_DIP_CACHE_ENABLED:
+        cache_key = _dip_cache_key(image, preserve_raw_lines)
+        cached_lines = await get_dip_result_cache().get(cache_key)
+        if cached_lines is not None:
+            logger.info("DIP cache hit lines={}", len(cached_lines))
+            # Callers annotate lines in place, so never hand out the cached objects.
+            return copy.deepcopy(cached_lines)
+
     retrieve_url = await post_dip_request(image)
     results = await retrieve_dip_results(retrieve_url)
     if not results:
@@ -593,11 +1131,156 @@ async def run_dip(image: bytes, *, preserve_raw_lines: bool = False) -> list[dic
         remove_unknown=not preserve_raw_lines,
         remove_numeric_only=not preserve_raw_lines,
     )
-    return format_dip_lines_polygon(dip_line_results)
+    formatted_lines = format_dip_lines_polygon(dip_line_results)
+    if cache_key is not None:
+        await get_dip_result_cache().set(cache_key, copy.deepcopy(formatted_lines))
+    return formatted_lines
+
+
+class PipelineLatency:
+    """Stage timings, time-to-first-dish and total latency of one pipeline run, per mode."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self._started = time.monotonic()
+        self._first_dish_at: float | None = None
+        self._stages: dict[str, float] = {}
+
+    def dish_ready(self) -> None:
+        if self._first_dish_at is None:
+            self._first_dish_at = time.monotonic()
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        self._stages[stage] = seconds
+        metrics.observe(f"menu.pipeline.{self.mode}.{stage}_seconds", seconds)
+
+    def finish(self) -> None:
+        total_seconds = time.monotonic() - self._started
+        first_dish_seconds = (
+            None if self._first_dish_at is None else self._first_dish_at - self._started
+        )
+        metrics.observe(f"menu.pipeline.{self.mode}.total_seconds", total_seconds)
+        if first_dish_seconds is not None:
+            metrics.observe(
+                f"menu.pipeline.{self.mode}.time_to_first_dish_seconds", first_dish_seconds
+            )
+        logger.info(
+            "Pipeline latency mode={} time_to_first_dish={}s total={}s stages={}",
+            self.mode,
+            None if first_dish_seconds is None else round(first_dish_seconds, 3),
+            round(total_seconds, 3),
+            {stage: round(seconds, 3) for stage, seconds in self._stages.items()},
+        )
+
+
+def _dish_lookup_key(line: dict) -> str:
+    return tokenize_line(str(line["content"])).cleaned_name.casefold()
+
+
+async def _resolve_speculative_dish(
+    cleaned_name: str, accept_language: str, include_images: bool
+) -> dict[str, Any]:
+    if settings.MENU_DISH_INFO_CACHE_ENABLED:
+        cached_info = await get_dish_info_cache().get(
+            dish_info_cache_key(cleaned_name, accept_language)
+        )
+        if cached_info is not None:
+            return await attach_dish_image(dict(cached_info), include_images=include_images)
+    return await get_dish_data(cleaned_name, accept_language, include_images=include_images)
+
+
+def start_speculative_dish_tasks(
+    lines: list[dict],
+    line_indices: Iterable[int],
+    accept_language: str,
+    *,
+    include_images: bool,
+) -> dict[str, asyncio.Task]:
+    """Start dish lookups for `line_indices` before the stage that settles them finishes.
+
+    Tasks are keyed like `process_dip_results` keys its fan-out (casefolded
+    cleaned name), so the fan-out can adopt them once the lines are final.
+    """
+    tasks: dict[str, asyncio.Task] = {}
+    for line_index in line_indices:
+        cleaned_name = tokenize_line(str(lines[line_index]["content"])).cleaned_name
+        normalized_key = cleaned_name.casefold()
+        if cleaned_name and normalized_key not in tasks:
+            tasks[normalized_key] = asyncio.create_task(
+                _resolve_speculative_dish(cleaned_name, accept_language, include_images)
+            )
+    metrics.increment("menu.speculative.started", len(tasks))
+    return tasks
+
+
+async def _resolve_speculative_paragraph(content: str, accept_language: str) -> dict[str, Any]:
+    cached = await _cached_translations([content], accept_language)
+    if content in cached:
+        return _paragraph_payload(cached[content])
+    return await get_paragraph_data(content, accept_language)
+
+
+def start_speculative_paragraph_tasks(
+    lines: list[dict], accept_language: str
+) -> dict[str, asyncio.Task]:
+    """Start paragraph translations keyed by content, for `process_dip_paragraph_results`."""
+    tasks: dict[str, asyncio.Task] = {}
+    for line in lines:
+        content = line["content"]
+        if content not in tasks:
+            tasks[content] = asyncio.create_task(
+                _resolve_speculative_paragraph(content, accept_language)
+            )
+    metrics.increment("menu.speculative.started", len(tasks))
+    return tasks
+
+
+def _discard_speculative_task(task: asyncio.Task) -> None:
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()  # mark retrieved so a failed discard is not reported
+
+
+def _adopt_speculative_tasks(
+    tasks: dict[str, asyncio.Task],
+    needed_keys: Iterable[str],
+    *,
+    reusable: bool = True,
+) -> dict[str, asyncio.Task]:
+    """Keep speculative tasks whose keys the fan-out still needs; cancel the rest.
+
+    With `reusable=False` (e.g. the fan-out wants a different image policy than
+    the speculation ran with) nothing is adopted.
+    """
+    needed = set(needed_keys) if reusable else set()
+    adopted: dict[str, asyncio.Task] = {}
+    for key, task in tasks.items():
+        if key in needed:
+            adopted[key] = task
+        else:
+            _discard_speculative_task(task)
+    metrics.increment("menu.speculative.adopted", len(adopted))
+    metrics.increment("menu.speculative.discarded", len(tasks) - len(adopted))
+    return adopted
 
 
 @duration
-async def process_dip_results(dip_results: list[dict], accept_language: str) -> list[dict]:
+async def process_dip_results(
+    dip_results: list[dict],
+    accept_language: str,
+    *,
+    on_resolved: DishResolvedCallback | None = None,
+    prestarted: Mapping[str, Awaitable[dict[str, Any]]] | None = None,
+    latency: PipelineLatency | None = None,
+) -> list[dict]:
+    """Resolve dish info per OCR line, deduplicating LLM work by cleaned name.
+
+    `on_resolved(line_index, dish)` fires for every line sharing a name as soon as
+    its dish info is known, and again once the image lookup has been attached.
+    `prestarted` maps casefolded cleaned names to lookups already in flight, which
+    are awaited instead of starting new ones.
+    """
     if not dip_results:
         return []
 
@@ -605,18 +1288,97 @@ async def process_dip_results(dip_results: list[dict], accept_language: str) ->
     cleaned_lookup: dict[str, str] = {}
     line_keys: list[str | None] = []
     line_prices: list[str | None] = []
+    line_indices_by_key: dict[str, list[int]] = {}
 
     for line in dip_results:
-        line_prices.append(_extract_price_token(str(line.get("content", ""))))
-        cleaned_name = clean_dish_name(line["content"])
+        line_tokens = tokenize_line(str(line["content"]))
+        line_prices.append(line_tokens.price_token)
+        cleaned_name = line_tokens.cleaned_name
         if not cleaned_name:
             line_keys.append(None)
             continue
         normalized_key = cleaned_name.casefold()
         cleaned_lookup.setdefault(normalized_key, cleaned_name)
         line_keys.append(normalized_key)
+        line_indices_by_key.setdefault(normalized_key, []).append(len(line_keys) - 1)
+
+    batched = settings.MENU_DISH_INFO_MODE == DISH_INFO_MODE_BATCHED
+    # Batched mode falls back to per-item calls for dropped entries, so it also
+    # reads their answers; per-item mode never reads batch-prompt answers.
+    prompt_versions = (
+        (BATCH_DISH_INFO_PROMPT_VERSION, DISH_INFO_PROMPT_VERSION)
+        if batched
+        else (DISH_INFO_PROMPT_VERSION,)
+    )
+    cached_info_by_key: dict[str, dict[str, Any]] = {}
+    if settings.MENU_DISH_INFO_CACHE_ENABLED and cleaned_lookup:
+        cache_keys = {
+            normalized_key: [
+                dish_info_cache_key(cleaned_name, accept_language, prompt_version)
+                for prompt_version in prompt_versions
+            ]
+            for normalized_key, cleaned_name in cleaned_lookup.items()
+        }
+        cached_values = await get_dish_info_cache().get_many(
+            [cache_key for keys in cache_keys.values() for cache_key in keys]
+        )
+        for normalized_key, keys in cache_keys.items():
+            cached_key = next((key for key in keys if key in cached_values), None)
+            if cached_key is not None:
+                cached_info_by_key[normalized_key] = cached_values[cached_key]
+
+    resolved_info_by_key = dict(cached_info_by_key)
+    if batched:
+        uncached_keys = [key for key in cleaned_lookup if key not in resolved_info_by_key]
+        if uncached_keys:
+            batched_info = await resolve_dish_info_batched(
+                [cleaned_lookup[key] for key in uncached_keys],
+                accept_language,
+            )
+            resolved_info_by_key.update(zip(uncached_keys, batched_info, strict=True))
+
+    prefetched_images: dict[str, tuple[str, ...]] = {}
+    if include_images:
+        prefetched_images = await prefetch_dish_images(
+            dish["text"]
+            for dish in resolved_info_by_key.values()
+            if dish.get("text") and dish["text"] != "Unknown"
+        )
+
+    def _notify(normalized_key: str, dish: dict[str, Any]) -> None:
+        if on_resolved is None:
+            return
+        for line_index in line_indices_by_key[normalized_key]:
+            on_resolved(line_index, _with_line_price(dish, line_prices[line_index]))
 
     async def _fetch_unique(normalized_key: str, cleaned_name: str) -> tuple[str, dict[str, Any]]:
+        result = await _resolve_unique(normalized_key, cleaned_name)
+        if latency is not None:
+            latency.dish_ready()
+        return result
+
+    async def _resolve_unique(
+        normalized_key: str, cleaned_name: str
+    ) -> tuple[str, dict[str, Any]]:
+        prestarted_lookup = (prestarted or {}).get(normalized_key)
+        if prestarted_lookup is not None:
+            dish = await prestarted_lookup
+            _notify(normalized_key, dish)
+            return normalized_key, dish
+        resolved_info = resolved_info_by_key.get(normalized_key)
+        if resolved_info is None and on_resolved is not None:
+            resolved_info = await get_dish_info_via_openai(cleaned_name, accept_language)
+            resolved_info_by_key[normalized_key] = resolved_info
+        if resolved_info is not None:
+            if include_images:
+                _notify(normalized_key, resolved_info | {"img_src": None})
+            dish = await attach_dish_image(
+                dict(resolved_info),
+                include_images=include_images,
+                prefetched=prefetched_images,
+            )
+            _notify(normalized_key, dish)
+            return normalized_key, dish
         dish = await get_dish_data(
             cleaned_name,
             accept_language,
@@ -628,12 +1390,20 @@ async def process_dip_results(dip_results: list[dict], accept_language: str) ->
         _fetch_unique(normalized_key, cleaned_name)
         for normalized_key, cleaned_name in cleaned_lookup.items()
     ]
-    fanout_concurrency = _resolve_fanout_concurrency(len(unique_tasks))
-    unique_results = await _gather_with_limit(
-        unique_tasks,
-        fanout_concurrency,
-    )
-    resolved_by_key = {key: value for key, value in unique_results}
+    unique_results = await gather_until_deadline(unique_tasks, stage="dish_fanout")
+    resolved_by_key: dict[str, dict[str, Any]] = {}
+    for (normalized_key, cleaned_name), unique_result in zip(
+        cleaned_lookup.items(), unique_results, strict=True
+    ):
+        if unique_result is not None:
+            resolved_by_key[normalized_key] = unique_result[1]
+        elif normalized_key in resolved_info_by_key:
+            # Info arrived before the deadline; only the image lookup was cut off.
+            resolved_by_key[normalized_key] = resolved_info_by_key[normalized_key] | {
+                "img_src": None
+            }
+        else:
+            resolved_by_key[normalized_key] = _pending_dish_result(cleaned_name)
 
     results: list[dict] = []
     for key, price_token in zip(line_keys, line_prices, strict=True):
@@ -641,33 +1411,133 @@ async def process_dip_results(dip_results: list[dict], accept_language: str) ->
             results.append(_unknown_dish_result())
             continue
         resolved = resolved_by_key.get(key, _unknown_dish_result())
-        output_item = dict(resolved)
-        if price_token:
-            output_item["price"] = price_token
-        results.append(output_item)
+        results.append(_with_line_price(resolved, price_token))
 
     logger.info(
-        "Dish fan-out stats total={} unique={} include_images={} concurrency={}",
+        "Dish fan-out stats mode={} total={} unique={} cached={} include_images={} concurrency={}",
+        settings.MENU_DISH_INFO_MODE,
         len(dip_results),
         len(cleaned_lookup),
+        len(cached_info_by_key),
         include_images,
-        fanout_concurrency,
+        _dish_info_limiter().limit,
     )
     return results
 
 
+def _with_line_price(dish: dict[str, Any], price_token: str | None) -> dict[str, Any]:
+    output_item = dict(dish)
+    if price_token:
+        output_item["price"] = price_token
+    return output_item
+
+
+def _process_dish_lines(
+    lines: list[dict],
+    language: str,
+    boxes: list[dict[str, float]],
+    listener: MenuAnalysisListener | None,
+    **options: Any,
+) -> Awaitable[list[dict]]:
+    if listener is None:
+        return process_dip_results(lines, language, **options)
+    return process_dip_results(
+        lines,
+        language,
+        on_resolved=lambda line_index, dish: listener.on_dish(
+            line_index, dish, boxes[line_index]
+        ),
+        **options,
+    )
+
+
+def _notify_ocr_boxes(
+    listener: MenuAnalysisListener | None,
+    img_width: int,
+    img_height: int,
+    lines: list[dict],
+) -> None:
+    if listener is not None:
+        listener.on_ocr_boxes(normalize_text_bbox_dip(img_width, img_height, lines))
+
+
+def _finalize_results(
+    listener: MenuAnalysisListener | None,
+    dish_info: list[dict],
+    boxes: list[dict[str, float]],
+) -> dict[str, list[dict]]:
+    if listener is not None:
+        for line_index, (dish, box) in enumerate(zip(dish_info, boxes, strict=True)):
+            listener.on_dish(line_index, dish, box)
+    return {"results": serialize_dish_data_filtered(dish_info, boxes)}
+
+
 @duration
 async def process_dip_paragraph_results(
-    dip_results: list[dict], accept_language: str
+    dip_results: list[dict],
+    accept_language: str,
+    *,
+    prestarted: Mapping[str, Awaitable[dict[str, Any]]] | None = None,
 ) -> list[dict]:
-    tasks = [get_paragraph_data(line["content"], accept_language) for line in dip_results]
-    fanout_concurrency = _resolve_fanout_concurrency(len(tasks))
+    """Translate each distinct paragraph once, reading the translation memory first.
+
+    `prestarted` maps content to translations already in flight. With
+    `MENU_TRANSLATION_MODE=batched` the remaining misses go out in batched calls,
+    with a per-item fallback for entries a batch dropped.
+    """
+    prestarted = prestarted or {}
+    unique_texts: dict[str, str] = {}
+    line_keys: list[str] = []
+    for line in dip_results:
+        normalized_key = _normalize_paragraph_text(line["content"])
+        unique_texts.setdefault(normalized_key, line["content"])
+        line_keys.append(normalized_key)
+
+    batched = settings.MENU_TRANSLATION_MODE == TRANSLATION_MODE_BATCHED
+    cached = await _cached_translations(
+        list(unique_texts.values()), accept_language, _translation_prompt_versions()
+    )
+    resolved_by_key: dict[str, dict[str, Any]] = {
+        normalized_key: _paragraph_payload(cached[text])
+        for normalized_key, text in unique_texts.items()
+        if text in cached
+    }
+    uncached_keys = [
+        normalized_key
+        for normalized_key, text in unique_texts.items()
+        if normalized_key not in resolved_by_key and text not in prestarted
+    ]
+    if batched and uncached_keys:
+        translations = await translate_paragraphs_batched(
+            [unique_texts[normalized_key] for normalized_key in uncached_keys],
+            accept_language,
+        )
+        for normalized_key, translation in zip(uncached_keys, translations, strict=True):
+            if translation is not None:
+                resolved_by_key[normalized_key] = _paragraph_payload(translation)
+
+    pending_keys = [key for key in unique_texts if key not in resolved_by_key]
+    tasks = [
+        prestarted.get(unique_texts[key]) or get_paragraph_data(unique_texts[key], accept_language)
+        for key in pending_keys
+    ]
     logger.info(
-        "Paragraph fan-out stats total={} concurrency={}",
+        "Paragraph fan-out stats mode={} total={} unique={} cached={} calls={} concurrency={}",
+        settings.MENU_TRANSLATION_MODE,
+        len(dip_results),
+        len(unique_texts),
+        len(cached),
         len(tasks),
-        fanout_concurrency,
+        get_llm_limiter(settings.OPENAI_MODEL).limit,
     )
-    return await _gather_with_limit(tasks, fanout_concurrency)
+    paragraph_results = await gather_until_deadline(tasks, stage="paragraph_fanout")
+    for key, result in zip(pending_keys, paragraph_results, strict=True):
+        if result is not None:
+            resolved_by_key[key] = result
+    return [
+        resolved_by_key.get(key) or _pending_dish_result(line["content"])
+        for line, key in zip(dip_results, line_keys, strict=True)
+    ]
 
 
 @duration
@@ -676,26 +1546,69 @@ async def upload_pipeline_with_dip_auto_group_lines(
     img_height: int,
     img_width: int,
     accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
 ) -> dict[str, list[dict]]:
     language = _resolve_language(accept_language)
     dip_results_in_lines = await run_dip(image, preserve_raw_lines=True)
-    grouping_start = time.monotonic()
-    paragraphs, individual_lines = await build_paragraph(dip_results_in_lines)
-    grouping_elapsed = time.monotonic() - grouping_start
-    logger.info(
-        "Grouping stage elapsed={}s paragraphs={} individual_lines={}",
-        round(grouping_elapsed, 3),
-        len(paragraphs),
-        len(individual_lines),
-    )
+    _notify_ocr_boxes(listener, img_width, img_height, dip_results_in_lines)
 
-    dish_info_task = process_dip_results(individual_lines, language)
-    dish_description_task = process_dip_paragraph_results(paragraphs, language)
-    fan_out_start = time.monotonic()
-    dish_info, dish_description = await asyncio.gather(
-        dish_info_task, dish_description_task
+    # Speculative mode resolves clear title lines while LLM grouping runs, then
+    # adopts the lookups for lines that stayed dishes and cancels the others.
+    speculative = (
+        settings.MENU_DISH_FANOUT_SPECULATIVE
+        and settings.MENU_DISH_INFO_MODE != DISH_INFO_MODE_BATCHED
     )
-    fan_out_elapsed = time.monotonic() - fan_out_start
+    latency = PipelineLatency("speculative" if speculative else "sequential")
+    speculative_images = len(dip_results_in_lines) <= settings.MENU_IMAGE_ENRICH_MAX_ITEMS
+    speculative_tasks: dict[str, asyncio.Task] = {}
+    if speculative:
+        speculative_tasks = start_speculative_dish_tasks(
+            dip_results_in_lines,
+            speculative_title_lines(dip_results_in_lines),
+            language,
+            include_images=speculative_images,
+        )
+    try:
+        grouping_start = time.monotonic()
+        paragraphs, individual_lines = await build_paragraph(dip_results_in_lines)
+        grouping_elapsed = time.monotonic() - grouping_start
+        latency.record_stage("grouping", grouping_elapsed)
+        logger.info(
+            "Grouping stage elapsed={}s paragraphs={} individual_lines={} speculative={}",
+            round(grouping_elapsed, 3),
+            len(paragraphs),
+            len(individual_lines),
+            len(speculative_tasks),
+        )
+
+        prestarted = _adopt_speculative_tasks(
+            speculative_tasks,
+            map(_dish_lookup_key, individual_lines),
+            reusable=speculative_images
+            == (len(individual_lines) <= settings.MENU_IMAGE_ENRICH_MAX_ITEMS),
+        )
+        dish_info_bounding_box = normalize_text_bbox_dip(
+            img_width, img_height, individual_lines
+        )
+        dish_info_task = _process_dish_lines(
+            individual_lines,
+            language,
+            dish_info_bounding_box,
+            listener,
+            prestarted=prestarted,
+            latency=latency,
+        )
+        dish_description_task = process_dip_paragraph_results(paragraphs, language)
+        fan_out_start = time.monotonic()
+        dish_info, dish_description = await asyncio.gather(
+            dish_info_task, dish_description_task
+        )
+        fan_out_elapsed = time.monotonic() - fan_out_start
+        latency.record_stage("fan_out", fan_out_elapsed)
+    finally:
+        for task in speculative_tasks.values():
+            _discard_speculative_task(task)
+    latency.finish()
     logger.info(
         "Dish fan-out elapsed={}s dish_lines={} paragraph_lines={}",
         round(fan_out_elapsed, 3),
@@ -703,10 +1616,9 @@ async def upload_pipeline_with_dip_auto_group_lines(
         len(paragraphs),
     )
 
-    dish_info_bounding_box = normalize_text_bbox_dip(img_width, img_height, individual_lines)
     dish_description_bounding_box = normalize_text_bbox_dip(img_width, img_height, paragraphs)
     if not dish_info and dish_description:
-        return {"results": serialize_dish_data_filtered(dish_description, dish_description_bounding_box)}
+        return _finalize_results(listener, dish_description, dish_description_bounding_box)
 
     merged_dish_info, merged_boxes = merge_grouped_context_into_dishes(
         dish_info,
@@ -714,7 +1626,7 @@ async def upload_pipeline_with_dip_auto_group_lines(
         dish_description,
         dish_description_bounding_box,
     )
-    return {"results": serialize_dish_data_filtered(merged_dish_info, merged_boxes)}
+    return _finalize_results(listener, merged_dish_info, merged_boxes)
 
 
 @duration
@@ -723,9 +1635,11 @@ async def upload_pipeline_with_dip_layout_grouping_experiment(
     img_height: int,
     img_width: int,
     accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
 ) -> dict[str, list[dict]]:
     language = _resolve_language(accept_language)
     dip_results_in_lines = await run_dip(image, preserve_raw_lines=True)
+    _notify_ocr_boxes(listener, img_width, img_height, dip_results_in_lines)
     grouping_start = time.monotonic()
     paragraphs, individual_lines, grouping_debug = await build_paragraph_layout_experiment(
         dip_results_in_lines
@@ -741,43 +1655,93 @@ async def upload_pipeline_with_dip_layout_grouping_experiment(
         grouping_debug.get("groupedSegmentCount", 0),
     )
 
-    layout_lines_for_wash: list[dict] = []
-    for line in individual_lines:
-        line_with_origin = dict(line)
-        line_with_origin.setdefault("origin", "individual")
-        layout_lines_for_wash.append(line_with_origin)
-    for paragraph in paragraphs:
-        paragraph_with_origin = dict(paragraph)
-        paragraph_with_origin.setdefault("origin", "paragraph")
-        paragraph_with_origin.setdefault("role_hint", "description")
-        layout_lines_for_wash.append(paragraph_with_origin)
+    layout_lines_for_wash = build_layout_wash_lines(paragraphs, individual_lines)
 
-    wash_start = time.monotonic()
-    (
-        individual_dish_lines,
-        price_lines,
-        paragraph_context_lines,
-        discarded_lines,
-        wash_debug,
-    ) = await wash_layout_lines(layout_lines_for_wash)
-    wash_elapsed = time.monotonic() - wash_start
-    logger.info(
-        "Layout wash elapsed={}s mode={} dish_lines={} paragraph_lines={} price_lines={} discarded_lines={}",
-        round(wash_elapsed, 3),
-        wash_debug.get("mode"),
-        len(individual_dish_lines),
-        len(paragraph_context_lines),
-        len(price_lines),
-        len(discarded_lines),
+    # Overlap mode sends segments with an unambiguous role hint (titles to dish
+    # lookups, grouped paragraphs to translation) ahead while the wash runs. The
+    # wash still decides: lookups for lines it relabels or drops are cancelled.
+    overlap = (
+        settings.MENU_LAYOUT_WASH_OVERLAP
+        and settings.MENU_DISH_INFO_MODE != DISH_INFO_MODE_BATCHED
     )
+    latency = PipelineLatency("layout_overlap" if overlap else "layout_sequential")
+    latency.record_stage("grouping", grouping_elapsed)
+    speculative_images = len(layout_lines_for_wash) <= settings.MENU_IMAGE_ENRICH_MAX_ITEMS
+    speculative_dish_tasks: dict[str, asyncio.Task] = {}
+    speculative_paragraph_tasks: dict[str, asyncio.Task] = {}
+    if overlap:
+        speculative_dish_tasks = start_speculative_dish_tasks(
+            layout_lines_for_wash,
+            (
+                line_index
+                for line_index, line in enumerate(layout_lines_for_wash)
+                if line.get("role_hint") == "title"
+            ),
+            language,
+            include_images=speculative_images,
+        )
+        # Speculative translations run per item, so batched translation waits for
+        # the fan-out to batch them and read the batch-keyed memory.
+        if settings.MENU_TRANSLATION_MODE != TRANSLATION_MODE_BATCHED:
+            speculative_paragraph_tasks = start_speculative_paragraph_tasks(
+                [line for line in layout_lines_for_wash if line["origin"] == "paragraph"],
+                language,
+            )
+    try:
+        wash_start = time.monotonic()
+        (
+            individual_dish_lines,
+            price_lines,
+            paragraph_context_lines,
+            discarded_lines,
+            wash_debug,
+        ) = await wash_layout_lines(layout_lines_for_wash)
+        wash_elapsed = time.monotonic() - wash_start
+        latency.record_stage("wash", wash_elapsed)
+        logger.info(
+            "Layout wash elapsed={}s mode={} dish_lines={} paragraph_lines={} price_lines={} discarded_lines={}",
+            round(wash_elapsed, 3),
+            wash_debug.get("mode"),
+            len(individual_dish_lines),
+            len(paragraph_context_lines),
+            len(price_lines),
+            len(discarded_lines),
+        )
 
-    dish_info_task = process_dip_results(individual_dish_lines, language)
-    dish_description_task = process_dip_paragraph_results(paragraph_context_lines, language)
-    fan_out_start = time.monotonic()
-    dish_info, dish_description = await asyncio.gather(
-        dish_info_task, dish_description_task
-    )
-    fan_out_elapsed = time.monotonic() - fan_out_start
+        prestarted_dishes = _adopt_speculative_tasks(
+            speculative_dish_tasks,
+            map(_dish_lookup_key, individual_dish_lines),
+            reusable=speculative_images
+            == (len(individual_dish_lines) <= settings.MENU_IMAGE_ENRICH_MAX_ITEMS),
+        )
+        prestarted_paragraphs = _adopt_speculative_tasks(
+            speculative_paragraph_tasks,
+            (line["content"] for line in paragraph_context_lines),
+        )
+        dish_info_bounding_box = normalize_text_bbox_dip(
+            img_width, img_height, individual_dish_lines
+        )
+        dish_info_task = _process_dish_lines(
+            individual_dish_lines,
+            language,
+            dish_info_bounding_box,
+            listener,
+            prestarted=prestarted_dishes,
+            latency=latency,
+        )
+        dish_description_task = process_dip_paragraph_results(
+            paragraph_context_lines, language, prestarted=prestarted_paragraphs
+        )
+        fan_out_start = time.monotonic()
+        dish_info, dish_description = await asyncio.gather(
+            dish_info_task, dish_description_task
+        )
+        fan_out_elapsed = time.monotonic() - fan_out_start
+        latency.record_stage("fan_out", fan_out_elapsed)
+    finally:
+        for task in (*speculative_dish_tasks.values(), *speculative_paragraph_tasks.values()):
+            _discard_speculative_task(task)
+    latency.finish()
     logger.info(
         "Layout experiment fan-out elapsed={}s dish_lines={} paragraph_lines={}",
         round(fan_out_elapsed, 3),
@@ -785,16 +1749,35 @@ async def upload_pipeline_with_dip_layout_grouping_experiment(
         len(paragraph_context_lines),
     )
 
-    dish_info_bounding_box = normalize_text_bbox_dip(
-        img_width, img_height, individual_dish_lines
+    return _merge_layout_results(
+        listener,
+        img_width,
+        img_height,
+        dish_info,
+        dish_info_bounding_box,
+        dish_description,
+        paragraph_context_lines,
+        price_lines,
     )
+
+
+def _merge_layout_results(
+    listener: MenuAnalysisListener | None,
+    img_width: int,
+    img_height: int,
+    dish_info: list[dict],
+    dish_info_bounding_box: list[dict[str, float]],
+    dish_description: list[dict],
+    paragraph_context_lines: list[dict],
+    price_lines: list[dict],
+) -> dict[str, list[dict]]:
     dish_description_bounding_box = normalize_text_bbox_dip(
         img_width, img_height, paragraph_context_lines
     )
     price_bounding_box = normalize_text_bbox_dip(img_width, img_height, price_lines)
 
     if not dish_info and dish_description:
-        return {"results": serialize_dish_data_filtered(dish_description, dish_description_bounding_box)}
+        return _finalize_results(listener, dish_description, dish_description_bounding_box)
 
     merged_dish_info, merged_boxes = merge_grouped_context_into_dishes(
         dish_info,
@@ -804,21 +1787,98 @@ async def upload_pipeline_with_dip_layout_grouping_experiment(
         price_lines=price_lines,
         price_boxes=price_bounding_box,
     )
-    return {"results": serialize_dish_data_filtered(merged_dish_info, merged_boxes)}
+    return _finalize_results(listener, merged_dish_info, merged_boxes)
+
+
+@duration
+async def upload_pipeline_with_dip_layout_combined(
+    image: bytes,
+    img_height: int,
+    img_width: int,
+    accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
+) -> dict[str, list[dict]]:
+    """Layout-segments flow with grouping and wash merged into one LLM call."""
+    language = _resolve_language(accept_language)
+    dip_results_in_lines = await run_dip(image, preserve_raw_lines=True)
+    _notify_ocr_boxes(listener, img_width, img_height, dip_results_in_lines)
+
+    latency = PipelineLatency("layout_combined")
+    grouping_start = time.monotonic()
+    (
+        individual_dish_lines,
+        price_lines,
+        paragraph_context_lines,
+        discarded_lines,
+        grouping_debug,
+    ) = await build_and_wash_layout_combined(dip_results_in_lines)
+    latency.record_stage("grouping_wash", time.monotonic() - grouping_start)
+
+    dish_info_bounding_box = normalize_text_bbox_dip(
+        img_width, img_height, individual_dish_lines
+    )
+    dish_info_task = _process_dish_lines(
+        individual_dish_lines,
+        language,
+        dish_info_bounding_box,
+        listener,
+        latency=latency,
+    )
+    dish_description_task = process_dip_paragraph_results(paragraph_context_lines, language)
+    fan_out_start = time.monotonic()
+    dish_info, dish_description = await asyncio.gather(
+        dish_info_task, dish_description_task
+    )
+    latency.record_stage("fan_out", time.monotonic() - fan_out_start)
+    latency.finish()
+    logger.info(
+        "Combined layout fan-out mode={} dish_lines={} paragraph_lines={} discarded_lines={}",
+        grouping_debug.get("mode"),
+        len(individual_dish_lines),
+        len(paragraph_context_lines),
+        len(discarded_lines),
+    )
+
+    return _merge_layout_results(
+        listener,
+        img_width,
+        img_height,
+        dish_info,
+        dish_info_bounding_box,
+        dish_description,
+        paragraph_context_lines,
+        price_lines,
+    )
 
 
-async def analyze_menu_image(image: bytes, accept_language: str | None) -> dict[str, list[dict]]:
-    processed_image, img_height, img_width = process_image(image)
+async def analyze_menu_image(
+    image: bytes,
+    accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
+) -> dict[str, list[dict]]:
+    processed_image, img_height, img_width = await preprocess_image(image)
     return await upload_pipeline_with_dip_auto_group_lines(
-        processed_image, img_height, img_width, accept_language
+        processed_image, img_height, img_width, accept_language, listener
     )
 
 
 async def analyze_menu_image_layout_grouping_experiment(
     image: bytes,
     accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
 ) -> dict[str, list[dict]]:
-    processed_image, img_height, img_width = process_image(image)
+    processed_image, img_height, img_width = await preprocess_image(image)
     return await upload_pipeline_with_dip_layout_grouping_experiment(
-        processed_image, img_height, img_width, accept_language
+        processed_image, img_height, img_width, accept_language, listener
+    )
+
+
+async def analyze_menu_image_layout_combined(
+    image: bytes,
+    accept_language: str | None,
+    listener: MenuAnalysisListener | None = None,
+) -> dict[str, list[dict]]:
+    processed_image, img_height, img_width = await preprocess_image(image)
+    return await upload_pipeline_with_dip_layout_combined(
+        processed_image, img_height, img_width, accept_language, listener
     )
@@ -0,0 +1,239 @@
+import numpy as np
+
+PARAGRAPH_SCORE_LIMIT = 2.0
+PRICE_SCORE_LIMIT = 1.6
+# Penalties mirrored from the scoring formulas below; used to derive how far from a
+# context line a dish center can sit and still score under the limit.
+PARAGRAPH_ABOVE_PENALTY_FROM = 0.35
+PARAGRAPH_ABOVE_PENALTY = 0.9
+PARAGRAPH_BELOW_PENALTY_FROM = 0.04
+PARAGRAPH_BELOW_PENALTY = 0.7
+PARAGRAPH_VERTICAL_WEIGHT = 1.8
+PRICE_FAR_PENALTY_FROM = 0.18
+PRICE_FAR_PENALTY = 1.0
+PRICE_VERTICAL_WEIGHT = 3.0
+# Keeps the candidate window inclusive against float rounding at its edges.
+WINDOW_SLACK = 1e-6
+
+
+class DishBoxIndex:
+    """Dish boxes as columns plus a row index over box centers.
+
+    Scores only grow with vertical distance, so candidates outside a y-window can
+    never beat the score limit and are skipped. The index is kept sorted by center
+    y and updated in place whenever an assignment widens a dish box.
+    """
+
+    def __init__(self, boxes: list[dict[str, float]]):
+        self.x = np.array([box["x"] for box in boxes], dtype=np.float64)
+        self.y = np.array([box["y"] for box in boxes], dtype=np.float64)
+        self.w = np.array([box["w"] for box in boxes], dtype=np.float64)
+        self.h = np.array([box["h"] for box in boxes], dtype=np.float64)
+        center_y = self.y + self.h / 2.0
+        self._row_order = np.argsort(center_y, kind="stable")
+        self._row_keys = center_y[self._row_order]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def box(self, idx: int) -> dict[str, float]:
+        return {
+            "x": float(self.x[idx]),
+            "y": float(self.y[idx]),
+            "w": float(self.w[idx]),
+            "h": float(self.h[idx]),
+        }
+
+    def candidates(self, y_low: float, y_high: float) -> np.ndarray:
+        """Dish indices, ascending, whose center y lies in `[y_low, y_high]`."""
+        start = np.searchsorted(self._row_keys, y_low - WINDOW_SLACK, side="left")
+        stop = np.searchsorted(self._row_keys, y_high + WINDOW_SLACK, side="right")
+        return np.sort(self._row_order[start:stop])
+
+    def update(self, idx: int, box: dict[str, float]) -> None:
+        self.x[idx] = box["x"]
+        self.y[idx] = box["y"]
+        self.w[idx] = box["w"]
+        self.h[idx] = box["h"]
+        position = int(np.flatnonzero(self._row_order == idx)[0])
+        order = np.delete(self._row_order, position)
+        keys = np.delete(self._row_keys, position)
+        center_y = box["y"] + box["h"] / 2.0
+        insert_at = np.searchsorted(keys, center_y, side="right")
+        self._row_order = np.insert(order, insert_at, idx)
+        self._row_keys = np.insert(keys, insert_at, center_y)
+
+
+def _center(box: dict[str, float]) -> tuple[float, float]:
+    return box["x"] + box["w"] / 2.0, box["y"] + box["h"] / 2.0
+
+
+def paragraph_candidates(
+    index: DishBoxIndex, paragraph_box: dict[str, float]
+) -> np.ndarray:
+    _, center_y = _center(paragraph_box)
+    reach_above = max(
+        PARAGRAPH_ABOVE_PENALTY_FROM,
+        (PARAGRAPH_SCORE_LIMIT - PARAGRAPH_ABOVE_PENALTY) / PARAGRAPH_VERTICAL_WEIGHT,
+    )
+    reach_below = max(
+        PARAGRAPH_BELOW_PENALTY_FROM,
+        (PARAGRAPH_SCORE_LIMIT - PARAGRAPH_BELOW_PENALTY) / PARAGRAPH_VERTICAL_WEIGHT,
+    )
+    return index.candidates(center_y - reach_above, center_y + reach_below)
+
+
+def price_candidates(index: DishBoxIndex, price_box: dict[str, float]) -> np.ndarray:
+    _, center_y = _center(price_box)
+    reach = max(
+        PRICE_FAR_PENALTY_FROM,
+        (PRICE_SCORE_LIMIT - PRICE_FAR_PENALTY) / PRICE_VERTICAL_WEIGHT,
+    )
+    return index.candidates(center_y - reach, center_y + reach)
+
+
+def score_paragraph(
+    index: DishBoxIndex,
+    candidates: np.ndarray,
+    paragraph_box: dict[str, float],
+) -> np.ndarray:
+    paragraph_center_x, paragraph_center_y = _center(paragraph_box)
+    x, y, w, h = (
+        index.x[candidates],
+        index.y[candidates],
+        index.w[candidates],
+        index.h[candidates],
+    )
+    vertical_delta = paragraph_center_y - (y + h / 2.0)
+    horizontal_distance = np.abs(paragraph_center_x - (x + w / 2.0))
+    overlap = np.maximum(
+        0.0,
+        np.minimum(x + w, paragraph_box["x"] + paragraph_box["w"])
+        - np.maximum(x, paragraph_box["x"]),
+    )
+    overlap_ratio = overlap / np.maximum(1e-6, np.minimum(w, paragraph_box["w"]))
+    score = (
+        np.abs(vertical_delta) * PARAGRAPH_VERTICAL_WEIGHT
+        + horizontal_distance * 0.9
+        + (1.0 - overlap_ratio) * 0.6
+    )
+    score += np.where(
+        vertical_delta < -PARAGRAPH_BELOW_PENALTY_FROM, PARAGRAPH_BELOW_PENALTY, 0.0
+    )
+    score += np.where(
+        vertical_delta > PARAGRAPH_ABOVE_PENALTY_FROM, PARAGRAPH_ABOVE_PENALTY, 0.0
+    )
+    return score
+
+
+def score_price(
+    index: DishBoxIndex,
+    candidates: np.ndarray,
+    price_box: dict[str, float],
+) -> np.ndarray:
+    price_center_x, price_center_y = _center(price_box)
+    x, y, w, h = (
+        index.x[candidates],
+        index.y[candidates],
+        index.w[candidates],
+        index.h[candidates],
+    )
+    dish_center_x = x + w / 2.0
+    vertical_distance = np.abs(price_center_y - (y + h / 2.0))
+    horizontal_distance = np.abs(price_center_x - dish_center_x)
+    score = vertical_distance * PRICE_VERTICAL_WEIGHT + horizontal_distance * 0.8
+    score += np.where(price_center_x < dish_center_x, 0.4, 0.0)
+    score += np.where(
+        vertical_distance > PRICE_FAR_PENALTY_FROM, PRICE_FAR_PENALTY, 0.0
+    )
+    return score
+
+
+def select_best(candidates: np.ndarray, scores: np.ndarray, limit: float) -> int | None:
+    """Lowest-scoring candidate under `limit`; ties go to the lowest dish index."""
+    if not len(candidates):
+        return None
+    best = int(np.argmin(scores))
+    return int(candidates[best]) if scores[best] < limit else None
+
+
+def score_matrix(
+    index: DishBoxIndex,
+    context_boxes: list[dict[str, float]],
+    *,
+    kind: str,
+) -> np.ndarray:
+    """Context-by-dish scores against the current boxes; pruned pairs are `inf`."""
+    matrix = np.full((len(context_boxes), len(index)), np.inf)
+    for row, context_box in enumerate(context_boxes):
+        if kind == "paragraph":
+            candidates = paragraph_candidates(index, context_box)
+            matrix[row, candidates] = score_paragraph(index, candidates, context_box)
+        else:
+            candidates = price_candidates(index, context_box)
+            matrix[row, candidates] = score_price(index, candidates, context_box)
+    return matrix
+
+
+def solve_min_cost_assignment(cost: np.ndarray, limit: float) -> dict[int, int]:
+    """Globally optimal one-to-one row->column matching using only entries below `limit`.
+
+    Hungarian algorithm with row/column potentials (shortest augmenting paths),
+    O(n^2·m) with the inner scans vectorized. Disallowed entries get a cost large
+    enough that any allowed pair is preferred, and are dropped from the result.
+    """
+    rows, cols = cost.shape
+    if rows == 0 or cols == 0:
+        return {}
+
+    allowed = cost < limit
+    finite_cost = np.where(allowed, cost, 0.0)
+    forbidden_cost = (float(finite_cost.max()) + limit + 1.0) * (min(rows, cols) + 1)
+    working = np.where(allowed, cost, forbidden_cost)
+    transposed = rows > cols
+    if transposed:
+        working = working.T
+        rows, cols = cols, rows
+
+    row_potential = np.zeros(rows + 1)
+    col_potential = np.zeros(cols + 1)
+    col_owner = np.zeros(cols + 1, dtype=np.intp)
+    predecessor = np.zeros(cols + 1, dtype=np.intp)
+    for row in range(1, rows + 1):
+        col_owner[0] = row
+        current_col = 0
+        min_reduced = np.full(cols + 1, np.inf)
+        visited = np.zeros(cols + 1, dtype=bool)
+        while True:
+            visited[current_col] = True
+            owner = col_owner[current_col]
+            reduced = working[owner - 1] - row_potential[owner] - col_potential[1:]
+            open_cols = ~visited[1:]
+            improves = open_cols & (reduced < min_reduced[1:])
+            min_reduced[1:][improves] = reduced[improves]
+            predecessor[1:][improves] = current_col
+            candidates = np.where(open_cols, min_reduced[1:], np.inf)
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+
+            visited_cols = np.flatnonzero(visited)
+            row_potential[col_owner[visited_cols]] += delta
+            col_potential[visited_cols] -= delta
+            min_reduced[1:][open_cols] -= delta
+            current_col = next_col
+            if col_owner[current_col] == 0:
+                break
+        while current_col:
+            previous_col = predecessor[current_col]
+            col_owner[current_col] = col_owner[previous_col]
+            current_col = previous_col
+
+    matches: dict[int, int] = {}
+    for col in range(1, cols + 1):
+        owner = int(col_owner[col])
+        if owner == 0:
+            continue
+        row_idx, col_idx = (col - 1, owner - 1) if transposed else (owner - 1, col - 1)
+        if allowed[row_idx, col_idx]:
+            matches[row_idx] = col_idx
+    return matches
@@ -4,31 +4,36 @@ import os
 import time
 from typing import Any
 
-from openai import AsyncOpenAI
-
 from src.core.config import settings
+from src.core.vendors.llm.client import LLMTransport
 from src.core.vendors.utilities.client import logger
+from src.services.deadline import stage_timeout
+from src.services.llm_hedging import run_hedged
+from src.services.ocr.decision_cache import memoized_parse
 from src.services.ocr.line_grouping import (
     build_compact_grouping_payload,
     build_line_features,
+    confident_title_indices,
     heuristic_group_lines,
     should_invoke_llm_grouping,
 )
 from src.services.ocr.llm_utlities import LINES_to_PARGRAPH_PROMPT
-from src.services.ocr.models import GroupedParagraphs
-from src.services.utils import build_openai_reasoning_kwargs, duration
-
-_openai_client: AsyncOpenAI | None = None
-
+from src.services.ocr.models import GroupedParagraphs, TranslatedParagraphs
+from src.services.utils import build_openai_reasoning_kwargs, duration, prompt_fingerprint
 
-def _get_openai_client() -> AsyncOpenAI:
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = AsyncOpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL,
-        )
-    return _openai_client
+TRANSLATION_PROMPT = (
+    "You are a translation engine that can only translate text and cannot interpret it"
+)
+BATCH_TRANSLATION_PROMPT_SUFFIX = """
+Batch mode:
+- The input is a JSON array of items with fields index and text.
+- Return exactly one entry in Translations for every input index, with the same index.
+- Translate each item independently.
+"""
+TRANSLATION_PROMPT_VERSION = prompt_fingerprint(TRANSLATION_PROMPT)
+BATCH_TRANSLATION_PROMPT_VERSION = prompt_fingerprint(
+    TRANSLATION_PROMPT, BATCH_TRANSLATION_PROMPT_SUFFIX
+)
 
 
 def _extract_parsed_paragraphs(completion: Any) -> GroupedParagraphs | None:
@@ -84,17 +89,29 @@ async def _group_with_llm(features) -> list[list[int]] | None:
         settings.MENU_GROUPING_LLM_REASONING_EFFORT
     )
     start_time = time.monotonic()
-    completion = await asyncio.wait_for(
-        _get_openai_client().responses.parse(
-            model=settings.OPENAI_MODEL,
-            input=[
-                {"role": "system", "content": LINES_to_PARGRAPH_PROMPT},
-                {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
-            ],
-            text_format=GroupedParagraphs,
-            **parse_kwargs,
+    completion = await memoized_parse(
+        "grouping",
+        prompt=LINES_to_PARGRAPH_PROMPT,
+        model=settings.OPENAI_MODEL,
+        reasoning_effort=settings.MENU_GROUPING_LLM_REASONING_EFFORT,
+        payload=payload,
+        text_format=GroupedParagraphs,
+        call=lambda: asyncio.wait_for(
+            run_hedged(
+                "grouping",
+                settings.OPENAI_MODEL,
+                lambda: LLMTransport.get_openai_client().responses.parse(
+                    model=settings.OPENAI_MODEL,
+                    input=[
+                        {"role": "system", "content": LINES_to_PARGRAPH_PROMPT},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
+                    ],
+                    text_format=GroupedParagraphs,
+                    **parse_kwargs,
+                ),
+            ),
+            timeout=stage_timeout(settings.MENU_GROUPING_TIMEOUT_SECONDS),
         ),
-        timeout=settings.MENU_GROUPING_TIMEOUT_SECONDS,
     )
     logger.info("Call spent time:{}", time.monotonic() - start_time)
     return _extract_llm_groups(completion, len(features))
@@ -125,6 +142,22 @@ def _materialize_paragraph_lines(
     return paragraph_lines, paragraph_indices
 
 
+def speculative_title_lines(dip_results_in_lines: list[dict]) -> list[int]:
+    """Indices of clear title lines worth resolving while grouping still runs.
+
+    Empty when `build_paragraph` will settle on the heuristic alone, since then
+    there is no LLM call to overlap with.
+    """
+    features = build_line_features(dip_results_in_lines)
+    if not should_invoke_llm_grouping(
+        heuristic_group_lines(features),
+        line_count=len(dip_results_in_lines),
+        llm_line_threshold=settings.MENU_GROUPING_LLM_LINE_THRESHOLD,
+    ):
+        return []
+    return confident_title_indices(features)
+
+
 @duration
 async def build_paragraph(
     dip_results_in_lines: list[dict],
@@ -154,7 +187,7 @@ async def build_paragraph(
             grouping_mode = "timeout_fallback"
             grouped_indices = []
             logger.warning(
-                "Paragraph grouping timed out after {}s",
+                "Paragraph grouping timed out (limit {}s or request deadline)",
                 settings.MENU_GROUPING_TIMEOUT_SECONDS,
             )
         except Exception as exc:  # defensive catch for provider and parse failures
@@ -189,13 +222,10 @@ async def build_paragraph(
 
 @duration
 async def translate(text: str, accept_language: str) -> str:
-    translation_prompt = (
-        "You are a translation engine that can only translate text and cannot interpret it"
-    )
-    completion = await _get_openai_client().responses.create(
+    completion = await LLMTransport.get_openai_client().responses.create(
         model=settings.OPENAI_MODEL,
         input=[
-            {"role": "system", "content": translation_prompt},
+            {"role": "system", "content": TRANSLATION_PROMPT},
             {"role": "user", "content": f"translate to {accept_language}:{text}"},
         ],
         **build_openai_reasoning_kwargs(),
@@ -203,6 +233,34 @@ async def translate(text: str, accept_language: str) -> str:
     return completion.output_text
 
 
+@duration
+async def translate_batch(texts: list[str], accept_language: str) -> list[str | None]:
+    """Translate `texts` in one call; entries the model skipped come back as None."""
+    items = [{"index": idx, "text": text} for idx, text in enumerate(texts)]
+    completion = await LLMTransport.get_openai_client().responses.parse(
+        model=settings.OPENAI_MODEL,
+        input=[
+            {"role": "system", "content": TRANSLATION_PROMPT + BATCH_TRANSLATION_PROMPT_SUFFIX},
+            {
+                "role": "user",
+                "content": f"translate to {accept_language}:"
+                + json.dumps(items, ensure_ascii=False),
+            },
+        ],
+        text_format=TranslatedParagraphs,
+        **build_openai_reasoning_kwargs(),
+    )
+    aligned: list[str | None] = [None] * len(texts)
+    parsed = getattr(completion, "output_parsed", None)
+    if parsed is None:
+        logger.error("Batch translation returned no structured output size={}", len(texts))
+        return aligned
+    for entry in parsed.Translations:
+        if 0 <= entry.index < len(texts) and aligned[entry.index] is None:
+            aligned[entry.index] = entry.text
+    return aligned
+
+
 if __name__ == "__main__":
     start = time.time()
     abs_path = os.path.abspath(__file__)
@@ -0,0 +1,116 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.services.cache import TieredCache, build_cache_backend
+from src.services.utils import prompt_fingerprint
+
+_grouping_decision_cache: TieredCache | None = None
+
+
+def get_grouping_decision_cache() -> TieredCache:
+    """Parsed grouping and wash decisions by payload fingerprint, shared across requests."""
+    global _grouping_decision_cache
+    if _grouping_decision_cache is None:
+        _grouping_decision_cache = TieredCache(
+            "grouping_decisions",
+            max_entries=settings.MENU_GROUPING_MEMO_MAX_ENTRIES,
+            ttl_seconds=settings.MENU_GROUPING_MEMO_TTL_SECONDS,
+            backend=build_cache_backend(
+                settings.MENU_GROUPING_MEMO_BACKEND,
+                path=settings.MENU_GROUPING_MEMO_PATH,
+                table=settings.MENU_GROUPING_MEMO_TABLE,
+            ),
+        )
+    return _grouping_decision_cache
+
+
+@dataclass(frozen=True, slots=True)
+class CachedCompletion:
+    """Stands in for a provider completion when the parsed output came from the memo."""
+
+    output_parsed: BaseModel
+    status: str = "cached"
+
+
+def _canonical(value: Any, precision: int) -> Any:
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, dict):
+        return {key: _canonical(item, precision) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonical(item, precision) for item in value]
+    return value
+
+
+def decision_cache_key(
+    stage: str,
+    *,
+    prompt: str,
+    model: str,
+    reasoning_effort: str,
+    payload: list[dict],
+) -> str:
+    """Fingerprint of everything the stage's answer depends on.
+
+    Coordinates are rounded to `MENU_GROUPING_MEMO_BBOX_PRECISION` places so
+    re-uploads of the same layout with slight OCR jitter share an entry.
+    """
+    raw_key = json.dumps(
+        {
+            "stage": stage,
+            "prompt": prompt_fingerprint(prompt),
+            "model": model,
+            "reasoning_effort": reasoning_effort,
+            "payload": _canonical(payload, settings.MENU_GROUPING_MEMO_BBOX_PRECISION),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+async def memoized_parse(
+    stage: str,
+    *,
+    prompt: str,
+    model: str,
+    reasoning_effort: str,
+    payload: list[dict],
+    text_format: type[BaseModel],
+    call: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Runs a structured `responses.parse` call through the decision memo.
+
+    Returns the provider completion, or a `CachedCompletion` on a hit. Only
+    completions that parsed are stored, so timeouts, errors and parse
+    fallbacks are retried next time.
+    """
+    if not settings.MENU_GROUPING_MEMO_ENABLED:
+        return await call()
+
+    cache = get_grouping_decision_cache()
+    cache_key = decision_cache_key(
+        stage,
+        prompt=prompt,
+        model=model,
+        reasoning_effort=reasoning_effort,
+        payload=payload,
+    )
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        metrics.increment(f"grouping_memo.{stage}.hits")
+        return CachedCompletion(output_parsed=text_format.model_validate(cached))
+
+    metrics.increment(f"grouping_memo.{stage}.misses")
+    completion = await call()
+    parsed = getattr(completion, "output_parsed", None)
+    if isinstance(parsed, text_format):
+        await cache.set(cache_key, parsed.model_dump(mode="json"))
+    return completion
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class LineBounds:
+    """Columnar axis-aligned bounds for a list of OCR lines, one array entry per line."""
+
+    x_min: np.ndarray
+    x_max: np.ndarray
+    y_min: np.ndarray
+    y_max: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x_min)
+
+    def page_extent(self) -> tuple[float, float]:
+        """Largest x/y over all lines, floored at 1.0; the scale used by layout payloads."""
+        if not len(self):
+            return 1.0, 1.0
+        return max(1.0, float(self.x_max.max())), max(1.0, float(self.y_max.max()))
+
+    def scaled(self, x_scale: float, y_scale: float) -> "LineBounds":
+        return LineBounds(
+            x_min=self.x_min / x_scale,
+            x_max=self.x_max / x_scale,
+            y_min=self.y_min / y_scale,
+            y_max=self.y_max / y_scale,
+        )
+
+    def centers(self) -> tuple[np.ndarray, np.ndarray]:
+        return (self.x_min + self.x_max) / 2.0, (self.y_min + self.y_max) / 2.0
+
+    def to_layout_bboxes(self) -> list[dict[str, float]]:
+        """Rounded min/max/center dicts in the shape the grouping and wash prompts expect."""
+        x_center, y_center = self.centers()
+        columns = zip(
+            self.x_min.tolist(),
+            self.x_max.tolist(),
+            self.y_min.tolist(),
+            self.y_max.tolist(),
+            x_center.tolist(),
+            y_center.tolist(),
+            strict=True,
+        )
+        return [
+            {
+                "x_min": round(x_min, 4),
+                "x_max": round(x_max, 4),
+                "y_min": round(y_min, 4),
+                "y_max": round(y_max, 4),
+                "x_center": round(x_mid, 4),
+                "y_center": round(y_mid, 4),
+            }
+            for x_min, x_max, y_min, y_max, x_mid, y_mid in columns
+        ]
+
+    def to_bounding_boxes(
+        self, img_width: int, img_height: int
+    ) -> list[dict[str, float]]:
+        """`BoundingBox`-shaped `x/y/w/h` dicts relative to the image size."""
+        columns = zip(
+            (self.x_min / img_width).tolist(),
+            (self.y_min / img_height).tolist(),
+            ((self.x_max - self.x_min) / img_width).tolist(),
+            ((self.y_max - self.y_min) / img_height).tolist(),
+            strict=True,
+        )
+        return [{"x": x, "y": y, "w": w, "h": h} for x, y, w, h in columns]
+
+
+def _reduce_coords(coord_lists: list[list[float]]) -> tuple[np.ndarray, np.ndarray]:
+    counts = np.fromiter(map(len, coord_lists), dtype=np.intp, count=len(coord_lists))
+    if counts.min() == 0:
+        raise ValueError("Polygon without coordinates")
+    flat = np.fromiter(
+        chain.from_iterable(coord_lists), dtype=np.float64, count=int(counts.sum())
+    )
+
+    if counts.min() == counts.max():
+        # DIP lines are 4-point quads, so the common case is a dense N×4 matrix.
+        matrix = flat.reshape(len(coord_lists), int(counts[0]))
+        return matrix.min(axis=1), matrix.max(axis=1)
+
+    # Merged paragraphs concatenate member polygons, so fall back to segmented reductions.
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return np.minimum.reduceat(flat, offsets), np.maximum.reduceat(flat, offsets)
+
+
+def polygon_bounds(lines: list[dict]) -> LineBounds:
+    """Build per-line bounds from `{"polygon": {"x_coords", "y_coords"}}` lines in one pass."""
+    if not lines:
+        empty = np.empty(0, dtype=np.float64)
+        return LineBounds(x_min=empty, x_max=empty, y_min=empty, y_max=empty)
+
+    x_min, x_max = _reduce_coords([line["polygon"]["x_coords"] for line in lines])
+    y_min, y_max = _reduce_coords([line["polygon"]["y_coords"] for line in lines])
+    return LineBounds(x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max)
@@ -1,43 +1,30 @@
 import asyncio
 import json
-import re
 import time
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from openai import AsyncOpenAI
-
 from src.core.config import settings
+from src.core.vendors.llm.client import LLMTransport
 from src.core.vendors.utilities.client import logger
+from src.services.deadline import stage_timeout
 from src.services.ocr.llm_utlities import (
+    SEGMENTS_GROUP_AND_WASH_PROMPT,
     SEGMENTS_WASH_PROMPT,
     SEGMENTS_to_PARGRAPH_PROMPT,
 )
-from src.services.ocr.models import GroupedSegments, WashedSegments
+from src.services.ocr.decision_cache import memoized_parse
+from src.services.ocr.geometry import polygon_bounds
+from src.services.ocr.models import (
+    GroupedSegments,
+    GroupedWashedSegments,
+    WashedSegments,
+)
+from src.services.ocr.tokenizer import is_price_only, tokenize_line
 from src.services.utils import build_openai_reasoning_kwargs, duration
 
 SegmentRole = Literal["title", "description", "price", "unknown"]
 LayoutWashLabel = Literal["dish_title", "description", "price", "non_dish", "unknown"]
-_PRICE_NUMBER_PATTERN = r"(?:\d{1,3}(?:[.,]\d{3})+|\d{1,4})(?:[.,]\d{1,2})?"
-_TRAILING_PRICE_PATTERN = re.compile(
-    rf"[-–—:]\s*(?:[$€£¥]\s*)?{_PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?\s*$",
-    re.IGNORECASE,
-)
-_TRAILING_PRICE_WITH_SPACE_PATTERN = re.compile(
-    rf"\s+((?:[$€£¥]\s*)?{_PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?)\s*$",
-    re.IGNORECASE,
-)
-_PRICE_ONLY_PATTERN = re.compile(
-    rf"^(?:[$€£¥]\s*)?{_PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?$",
-    re.IGNORECASE,
-)
-_PRICE_TOKEN_PATTERN = re.compile(
-    rf"(?:[$€£¥]\s*)?{_PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?",
-    re.IGNORECASE,
-)
-_SEGMENT_DELIMITER_PATTERN = re.compile(r"\s*(?:\||•|·|;|；|\u2022)\s*")
-
-_openai_client: AsyncOpenAI | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,114 +38,17 @@ class SegmentCandidate:
     bbox: dict[str, float]
 
 
-def _get_openai_client() -> AsyncOpenAI:
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = AsyncOpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL,
-        )
-    return _openai_client
-
-
 def _resolve_layout_grouping_model() -> str:
     preferred_model = settings.MENU_LAYOUT_GROUPING_LLM_MODEL.strip()
     return preferred_model or settings.OPENAI_MODEL
 
 
-def _trim_text_range(text: str, start: int, end: int) -> tuple[int, int] | None:
-    left = start
-    right = end
-    while left < right and text[left].isspace():
-        left += 1
-    while right > left and text[right - 1].isspace():
-        right -= 1
-    if left >= right:
-        return None
-    return left, right
-
-
-def _trim_price_range(text: str, start: int, end: int) -> tuple[int, int] | None:
-    trimmed = _trim_text_range(text, start, end)
-    if trimmed is None:
-        return None
-
-    left, right = trimmed
-    while left < right and text[left] in {"-", "–", "—", ":"}:
-        left += 1
-    return _trim_text_range(text, left, right)
-
-
-def _split_with_delimiters(text: str, start: int, end: int) -> list[tuple[int, int]]:
-    if start >= end:
-        return []
-
-    ranges: list[tuple[int, int]] = []
-    cursor = start
-    for match in _SEGMENT_DELIMITER_PATTERN.finditer(text, start, end):
-        candidate = _trim_text_range(text, cursor, match.start())
-        if candidate is not None:
-            ranges.append(candidate)
-        cursor = match.end()
-
-    tail = _trim_text_range(text, cursor, end)
-    if tail is not None:
-        ranges.append(tail)
-    return ranges
-
-
-def _split_out_trailing_price(text: str, start: int, end: int) -> list[tuple[int, int]]:
-    chunk = text[start:end]
-    price_start: int | None = None
-    strict_match = _TRAILING_PRICE_PATTERN.search(chunk)
-    if strict_match is not None:
-        price_start = start + strict_match.start()
-    else:
-        loose_match = _TRAILING_PRICE_WITH_SPACE_PATTERN.search(chunk)
-        if loose_match is not None:
-            price_start = start + loose_match.start(1)
-    if price_start is None:
-        return [(start, end)]
-
-    pieces: list[tuple[int, int]] = []
-    left_piece = _trim_text_range(text, start, price_start)
-    if left_piece is not None:
-        pieces.append(left_piece)
-    price_piece = _trim_price_range(text, price_start, end)
-    if price_piece is not None:
-        pieces.append(price_piece)
-
-    return pieces or [(start, end)]
-
-
-def _split_by_repeated_prices(text: str, start: int, end: int) -> list[tuple[int, int]]:
-    chunk = text[start:end]
-    matches = list(_PRICE_TOKEN_PATTERN.finditer(chunk))
-    if len(matches) < 2:
-        return [(start, end)]
-
-    ranges: list[tuple[int, int]] = []
-    cursor = start
-    for match in matches:
-        price_end = start + match.end()
-        candidate = _trim_text_range(text, cursor, price_end)
-        if candidate is not None:
-            ranges.append(candidate)
-        cursor = price_end
-
-    tail = _trim_text_range(text, cursor, end)
-    if tail is not None:
-        ranges.append(tail)
-
-    return ranges if len(ranges) >= 2 else [(start, end)]
-
-
 def _classify_segment(text: str) -> SegmentRole:
     stripped = text.strip()
     if not stripped:
         return "unknown"
 
-    if _PRICE_ONLY_PATTERN.fullmatch(stripped):
+    if is_price_only(stripped):
         return "price"
 
     words = [part for part in stripped.split() if part]
@@ -175,19 +65,13 @@ def _classify_segment(text: str) -> SegmentRole:
     return "unknown"
 
 
-def _segment_polygon_from_char_range(
-    line_polygon: dict[str, list[float]],
+def _segment_x_range_from_char_range(
+    x_min: float,
+    x_max: float,
     text_len: int,
     start: int,
     end: int,
-) -> dict[str, list[float]]:
-    raw_x = [float(value) for value in line_polygon["x_coords"]]
-    raw_y = [float(value) for value in line_polygon["y_coords"]]
-    x_min = min(raw_x)
-    x_max = max(raw_x)
-    y_min = min(raw_y)
-    y_max = max(raw_y)
-
+) -> tuple[float, float]:
     if text_len <= 0 or x_max <= x_min:
         seg_x_min = x_min
         seg_x_max = x_max
@@ -198,53 +82,42 @@ def _segment_polygon_from_char_range(
         if seg_x_max <= seg_x_min:
             seg_x_max = seg_x_min + max(1.0, width * 0.02)
 
-    return {
-        "x_coords": [seg_x_min, seg_x_max, seg_x_max, seg_x_min],
-        "y_coords": [y_min, y_min, y_max, y_max],
-    }
+    return seg_x_min, seg_x_max
 
 
 def build_layout_segments(dip_results_in_lines: list[dict]) -> list[SegmentCandidate]:
     if not dip_results_in_lines:
         return []
 
-    max_x = 1.0
-    max_y = 1.0
-    for line in dip_results_in_lines:
-        polygon = line["polygon"]
-        max_x = max(max_x, float(max(polygon["x_coords"])))
-        max_y = max(max_y, float(max(polygon["y_coords"])))
+    line_bounds = polygon_bounds(dip_results_in_lines)
+    max_x, max_y = line_bounds.page_extent()
+    line_x_min = line_bounds.x_min.tolist()
+    line_x_max = line_bounds.x_max.tolist()
+    line_y_min = line_bounds.y_min.tolist()
+    line_y_max = line_bounds.y_max.tolist()
 
     output: list[SegmentCandidate] = []
     segment_index = 0
     for line_idx, line in enumerate(dip_results_in_lines):
         text = str(line.get("content", ""))
-        trimmed_full = _trim_text_range(text, 0, len(text))
-        if trimmed_full is None:
-            continue
-
-        base_ranges = _split_with_delimiters(text, trimmed_full[0], trimmed_full[1])
-        expanded_ranges: list[tuple[int, int]] = []
-        for start, end in base_ranges:
-            for priced_start, priced_end in _split_by_repeated_prices(text, start, end):
-                expanded_ranges.extend(
-                    _split_out_trailing_price(text, priced_start, priced_end)
-                )
-
         segment_order = 0
-        for start, end in expanded_ranges:
+        for start, end in tokenize_line(text).segments:
             segment_text = text[start:end].strip()
             if not segment_text:
                 continue
-            polygon = _segment_polygon_from_char_range(
-                line["polygon"], len(text), start, end
+            seg_x_min, seg_x_max = _segment_x_range_from_char_range(
+                line_x_min[line_idx], line_x_max[line_idx], len(text), start, end
             )
-            raw_x = [float(value) for value in polygon["x_coords"]]
-            raw_y = [float(value) for value in polygon["y_coords"]]
-            x_min = min(raw_x) / max_x
-            x_max = max(raw_x) / max_x
-            y_min = min(raw_y) / max_y
-            y_max = max(raw_y) / max_y
+            seg_y_min = line_y_min[line_idx]
+            seg_y_max = line_y_max[line_idx]
+            polygon = {
+                "x_coords": [seg_x_min, seg_x_max, seg_x_max, seg_x_min],
+                "y_coords": [seg_y_min, seg_y_min, seg_y_max, seg_y_max],
+            }
+            x_min = seg_x_min / max_x
+            x_max = seg_x_max / max_x
+            y_min = seg_y_min / max_y
+            y_max = seg_y_max / max_y
             output.append(
                 SegmentCandidate(
                     index=segment_index,
@@ -289,22 +162,11 @@ def _build_layout_line_wash_payload(lines: list[dict]) -> list[dict]:
     if not lines:
         return []
 
-    max_x = 1.0
-    max_y = 1.0
-    for line in lines:
-        polygon = line["polygon"]
-        max_x = max(max_x, float(max(polygon["x_coords"])))
-        max_y = max(max_y, float(max(polygon["y_coords"])))
+    bounds = polygon_bounds(lines)
+    bboxes = bounds.scaled(*bounds.page_extent()).to_layout_bboxes()
 
     payload: list[dict] = []
-    for idx, line in enumerate(lines):
-        polygon = line["polygon"]
-        x_coords = [float(value) for value in polygon["x_coords"]]
-        y_coords = [float(value) for value in polygon["y_coords"]]
-        x_min = min(x_coords) / max_x
-        x_max = max(x_coords) / max_x
-        y_min = min(y_coords) / max_y
-        y_max = max(y_coords) / max_y
+    for idx, (line, bbox) in enumerate(zip(lines, bboxes, strict=True)):
         payload.append(
             {
                 "index": idx,
@@ -313,14 +175,7 @@ def _build_layout_line_wash_payload(lines: list[dict]) -> list[dict]:
                 "segment_index": line.get("segment_index"),
                 "role_hint": line.get("role_hint", "unknown"),
                 "origin": line.get("origin", "individual"),
-                "bbox": {
-                    "x_min": round(x_min, 4),
-                    "x_max": round(x_max, 4),
-                    "y_min": round(y_min, 4),
-                    "y_max": round(y_max, 4),
-                    "x_center": round((x_min + x_max) / 2.0, 4),
-                    "y_center": round((y_min + y_max) / 2.0, 4),
-                },
+                "bbox": bbox,
             }
         )
     return payload
@@ -402,6 +257,23 @@ def partition_layout_lines_by_label(
     return dish_candidate_lines, price_lines, description_lines, discarded_lines
 
 
+def build_layout_wash_lines(
+    paragraph_lines: list[dict], individual_lines: list[dict]
+) -> list[dict]:
+    """Individual lines then paragraphs, each tagged with its `origin` for the wash."""
+    layout_lines: list[dict] = []
+    for line in individual_lines:
+        line_with_origin = dict(line)
+        line_with_origin.setdefault("origin", "individual")
+        layout_lines.append(line_with_origin)
+    for paragraph in paragraph_lines:
+        paragraph_with_origin = dict(paragraph)
+        paragraph_with_origin.setdefault("origin", "paragraph")
+        paragraph_with_origin.setdefault("role_hint", "description")
+        layout_lines.append(paragraph_with_origin)
+    return layout_lines
+
+
 @duration
 async def wash_layout_lines(
     lines: list[dict],
@@ -416,17 +288,25 @@ async def wash_layout_lines(
 
     mode = "wash_llm"
     try:
-        completion = await asyncio.wait_for(
-            _get_openai_client().responses.parse(
-                model=_resolve_layout_grouping_model(),
-                input=[
-                    {"role": "system", "content": SEGMENTS_WASH_PROMPT},
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
-                ],
-                text_format=WashedSegments,
-                **parse_kwargs,
+        completion = await memoized_parse(
+            "layout_wash",
+            prompt=SEGMENTS_WASH_PROMPT,
+            model=_resolve_layout_grouping_model(),
+            reasoning_effort=settings.MENU_GROUPING_LLM_REASONING_EFFORT,
+            payload=payload,
+            text_format=WashedSegments,
+            call=lambda: asyncio.wait_for(
+                LLMTransport.get_openai_client().responses.parse(
+                    model=_resolve_layout_grouping_model(),
+                    input=[
+                        {"role": "system", "content": SEGMENTS_WASH_PROMPT},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
+                    ],
+                    text_format=WashedSegments,
+                    **parse_kwargs,
+                ),
+                timeout=stage_timeout(settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS),
             ),
-            timeout=settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS,
         )
         labels_by_index = _extract_layout_line_labels(completion, len(lines))
         if labels_by_index is None:
@@ -436,7 +316,7 @@ async def wash_layout_lines(
         labels_by_index = {}
         mode = "wash_timeout_fallback"
         logger.warning(
-            "Layout wash timed out after {}s",
+            "Layout wash timed out (limit {}s or request deadline)",
             settings.MENU_LAYOUT_WASH_TIMEOUT_SECONDS,
         )
     except Exception as exc:  # defensive for provider/parse failures
@@ -714,17 +594,25 @@ async def build_paragraph_layout_experiment(
     start_time = time.monotonic()
 
     try:
-        completion = await asyncio.wait_for(
-            _get_openai_client().responses.parse(
-                model=_resolve_layout_grouping_model(),
-                input=[
-                    {"role": "system", "content": SEGMENTS_to_PARGRAPH_PROMPT},
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
-                ],
-                text_format=GroupedSegments,
-                **parse_kwargs,
+        completion = await memoized_parse(
+            "layout_grouping",
+            prompt=SEGMENTS_to_PARGRAPH_PROMPT,
+            model=_resolve_layout_grouping_model(),
+            reasoning_effort=settings.MENU_GROUPING_LLM_REASONING_EFFORT,
+            payload=payload,
+            text_format=GroupedSegments,
+            call=lambda: asyncio.wait_for(
+                LLMTransport.get_openai_client().responses.parse(
+                    model=_resolve_layout_grouping_model(),
+                    input=[
+                        {"role": "system", "content": SEGMENTS_to_PARGRAPH_PROMPT},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
+                    ],
+                    text_format=GroupedSegments,
+                    **parse_kwargs,
+                ),
+                timeout=stage_timeout(settings.MENU_GROUPING_TIMEOUT_SECONDS),
             ),
-            timeout=settings.MENU_GROUPING_TIMEOUT_SECONDS,
         )
         grouped_segments = _extract_segment_groups(completion, len(segments))
         if grouped_segments is None:
@@ -757,7 +645,7 @@ async def build_paragraph_layout_experiment(
                 fallback_used = True
     except TimeoutError:
         logger.warning(
-            "Layout grouping timed out after {}s",
+            "Layout grouping timed out (limit {}s or request deadline)",
             settings.MENU_GROUPING_TIMEOUT_SECONDS,
         )
         return (
@@ -809,3 +697,112 @@ async def build_paragraph_layout_experiment(
             "fallbackUsed": fallback_used,
         },
     )
+
+
+@duration
+async def build_and_wash_layout_combined(
+    dip_results_in_lines: list[dict],
+) -> tuple[list[dict], list[dict], list[dict], list[dict], dict[str, Any]]:
+    """Layout grouping and wash in one structured LLM call.
+
+    Returns the same partition as `wash_layout_lines` run on the output of
+    `build_paragraph_layout_experiment`. Labels come per segment; paragraphs
+    count as descriptions. On timeout or failure the segments stay ungrouped
+    and fall back to their role hints.
+    """
+    segments = build_layout_segments(dip_results_in_lines)
+    if not segments:
+        return [], [], [], [], {"mode": "combined_empty", "segmentCount": 0}
+
+    payload = build_layout_grouping_payload(segments)
+    parse_kwargs = build_openai_reasoning_kwargs(
+        settings.MENU_GROUPING_LLM_REASONING_EFFORT
+    )
+    start_time = time.monotonic()
+
+    grouped_segments: list[list[int]] = []
+    labels_by_segment: dict[int, LayoutWashLabel] = {}
+    mode = "combined_llm"
+    try:
+        completion = await memoized_parse(
+            "layout_combined",
+            prompt=SEGMENTS_GROUP_AND_WASH_PROMPT,
+            model=_resolve_layout_grouping_model(),
+            reasoning_effort=settings.MENU_GROUPING_LLM_REASONING_EFFORT,
+            payload=payload,
+            text_format=GroupedWashedSegments,
+            call=lambda: asyncio.wait_for(
+                LLMTransport.get_openai_client().responses.parse(
+                    model=_resolve_layout_grouping_model(),
+                    input=[
+                        {"role": "system", "content": SEGMENTS_GROUP_AND_WASH_PROMPT},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=True)},
+                    ],
+                    text_format=GroupedWashedSegments,
+                    **parse_kwargs,
+                ),
+                timeout=stage_timeout(settings.MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS),
+            ),
+        )
+        groups = _extract_segment_groups(completion, len(segments))
+        if groups is None:
+            mode = "combined_parse_fallback"
+        else:
+            grouped_segments = groups
+            labels_by_segment = _extract_layout_line_labels(completion, len(segments)) or {}
+    except TimeoutError:
+        mode = "combined_timeout_fallback"
+        logger.warning(
+            "Combined layout grouping timed out (limit {}s or request deadline)",
+            settings.MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS,
+        )
+    except Exception as exc:  # defensive for provider/parse failures
+        mode = "combined_error_fallback"
+        logger.error("Combined layout grouping LLM call failed: {}", exc)
+
+    (
+        paragraph_lines,
+        individual_lines,
+        grouped_source_line_groups,
+        grouped_segment_set,
+    ) = materialize_layout_groups(segments, grouped_segments)
+    layout_lines = build_layout_wash_lines(paragraph_lines, individual_lines)
+    labels_by_line = {
+        line_index: labels_by_segment[line["segment_index"]]
+        for line_index, line in enumerate(layout_lines)
+        if line["origin"] == "individual" and line["segment_index"] in labels_by_segment
+    }
+    (
+        dish_candidate_lines,
+        price_lines,
+        description_lines,
+        discarded_lines,
+    ) = partition_layout_lines_by_label(layout_lines, labels_by_line)
+
+    logger.info(
+        "Combined layout grouping elapsed={}s mode={} segments={} groups={} dish_lines={} discarded_lines={}",
+        round(time.monotonic() - start_time, 3),
+        mode,
+        len(segments),
+        len(grouped_source_line_groups),
+        len(dish_candidate_lines),
+        len(discarded_lines),
+    )
+    return (
+        dish_candidate_lines,
+        price_lines,
+        description_lines,
+        discarded_lines,
+        {
+            "mode": mode,
+            "segmentCount": len(segments),
+            "groupCount": len(grouped_source_line_groups),
+            "groupedSegmentCount": len(grouped_segment_set),
+            "groupedSourceLineGroups": grouped_source_line_groups,
+            "labeledCount": len(labels_by_segment),
+            "dishLineCount": len(dish_candidate_lines),
+            "priceLineCount": len(price_lines),
+            "descriptionLineCount": len(description_lines),
+            "discardedLineCount": len(discarded_lines),
+        },
+    )
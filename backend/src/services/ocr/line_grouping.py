@@ -1,16 +1,8 @@
-import re
 from dataclasses import dataclass
 
+from src.services.ocr.geometry import polygon_bounds
+from src.services.ocr.tokenizer import tokenize_line
 
-PRICE_NUMBER_PATTERN = r"(?:\d{1,3}(?:[.,]\d{3})+|\d{1,4})(?:[.,]\d{1,2})?"
-TRAILING_PRICE_PATTERN = re.compile(
-    rf"[-–—]\s*(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?円)?\s*$"
-)
-FULL_PRICE_PATTERN = re.compile(
-    rf"^(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?$",
-    re.IGNORECASE,
-)
-NUMERIC_TOKEN_PATTERN = re.compile(PRICE_NUMBER_PATTERN)
 DESCRIPTION_HINT_TOKENS = (
     "with",
     "served",
@@ -53,51 +45,29 @@ class GroupingDecision:
     ambiguous_reasons: list[str]
 
 
-def _normalize_numeric_text(text: str) -> str:
-    return re.sub(r"[\s$€£¥.,\-–—:]", "", text).lower()
-
-
-def _is_numeric_only(text: str) -> bool:
-    normalized = _normalize_numeric_text(text)
-    return bool(normalized) and normalized.isdigit()
-
-
-def _has_price_like_pattern(text: str) -> bool:
-    stripped = text.strip()
-    if FULL_PRICE_PATTERN.fullmatch(stripped):
-        return True
-    if TRAILING_PRICE_PATTERN.search(stripped):
-        return True
-
-    numeric_hits = NUMERIC_TOKEN_PATTERN.findall(stripped)
-    if not numeric_hits:
-        return False
-    if len(numeric_hits) == 1 and len(stripped.split()) <= 3:
-        return True
-    return False
-
-
 def build_line_features(dip_results_in_lines: list[dict]) -> list[LineFeatures]:
     if not dip_results_in_lines:
         return []
 
-    max_x = 1.0
-    max_y = 1.0
-    for line in dip_results_in_lines:
-        polygon = line["polygon"]
-        max_x = max(max_x, float(max(polygon["x_coords"])))
-        max_y = max(max_y, float(max(polygon["y_coords"])))
+    bounds = polygon_bounds(dip_results_in_lines)
+    bounds = bounds.scaled(*bounds.page_extent())
+    x_centers, y_centers = bounds.centers()
+    columns = zip(
+        bounds.x_min.tolist(),
+        bounds.x_max.tolist(),
+        bounds.y_min.tolist(),
+        bounds.y_max.tolist(),
+        x_centers.tolist(),
+        y_centers.tolist(),
+        strict=True,
+    )
 
     features: list[LineFeatures] = []
-    for index, line in enumerate(dip_results_in_lines):
+    for index, (line, (x_min, x_max, y_min, y_max, x_center, y_center)) in enumerate(
+        zip(dip_results_in_lines, columns, strict=True)
+    ):
         text = str(line.get("content", "")).strip()
-        polygon = line["polygon"]
-        raw_x = [float(value) for value in polygon["x_coords"]]
-        raw_y = [float(value) for value in polygon["y_coords"]]
-        x_min = min(raw_x) / max_x
-        x_max = max(raw_x) / max_x
-        y_min = min(raw_y) / max_y
-        y_max = max(raw_y) / max_y
+        tokens = tokenize_line(text)
         word_count = len([part for part in text.split() if part])
 
         features.append(
@@ -108,10 +78,10 @@ def build_line_features(dip_results_in_lines: list[dict]) -> list[LineFeatures]:
                 x_max=x_max,
                 y_min=y_min,
                 y_max=y_max,
-                x_center=(x_min + x_max) / 2.0,
-                y_center=(y_min + y_max) / 2.0,
-                has_price_like_pattern=_has_price_like_pattern(text),
-                is_numeric_only=_is_numeric_only(text),
+                x_center=x_center,
+                y_center=y_center,
+                has_price_like_pattern=tokens.has_price_like_pattern,
+                is_numeric_only=tokens.is_numeric_only,
                 word_count=word_count,
             )
         )
@@ -174,6 +144,16 @@ def _is_title_candidate(feature: LineFeatures) -> bool:
     return len(feature.text) <= 30 and feature.word_count <= 7
 
 
+def confident_title_indices(features: list[LineFeatures]) -> list[int]:
+    """Lines that read as dish titles beyond doubt: a price, or a short non-description line."""
+    return [
+        feature.index
+        for feature in features
+        if _is_title_candidate(feature)
+        and (feature.has_price_like_pattern or feature.word_count <= 5)
+    ]
+
+
 def heuristic_group_lines(features: list[LineFeatures]) -> GroupingDecision:
     if not features:
         return GroupingDecision(
@@ -80,3 +80,43 @@ Rules:
 Output requirements:
 - Return only structured output that matches WashedSegments.
 """
+
+SEGMENTS_GROUP_AND_WASH_PROMPT = """
+You are grouping and labeling OCR menu text segments in one pass.
+
+Input:
+- A JSON array of menu segments with fields:
+  - index (int, segment id)
+  - source_line_index (int, original OCR line index)
+  - segment_order (int, order within the original OCR line)
+  - text (string)
+  - bbox (normalized coordinates)
+  - role_hint ("title" | "description" | "price" | "unknown")
+
+Task 1, Paragraphs:
+- Group segments that are description-like (dish details, ingredient phrases,
+  preparation phrases) into paragraphs.
+- A single OCR line can contain multiple dishes, multiple descriptions, or dish+price pairs.
+- Use source_line_index, segment_order, and bbox proximity to separate nearby items.
+- Do not include title or price segments in grouped output.
+- Do not group non-dish context such as logos, store names, section headers, or promo text.
+
+Task 2, Segments:
+- Label every segment index as one of:
+  - dish_title: explicit menu item title/name.
+  - description: dish details, ingredient/preparation text tied to a dish.
+  - price: standalone pricing text.
+  - non_dish: branding, logos, address/contact, legal text, promotions, section headers/category labels, or other non-dish context.
+  - unknown: uncertain.
+- Segments you grouped into a paragraph should be labeled description.
+
+Rules:
+- Do not assume English. Menus can be in any language.
+- Treat role_hint as guidance, not a strict label.
+- Prefer precision: if text is clearly non-dish context, label it non_dish.
+- Keep indices valid and unique in both lists.
+
+Output requirements:
+- Return only structured output that matches GroupedWashedSegments.
+- GroupedWashedSegments.Paragraphs[].segment_indices must contain segment indices.
+"""
@@ -37,3 +37,17 @@ class SegmentWashDecision(BaseModel):
 
 class WashedSegments(BaseModel):
     Segments: list[SegmentWashDecision]
+
+
+class IndexedTranslation(BaseModel):
+    index: int
+    text: str
+
+
+class TranslatedParagraphs(BaseModel):
+    Translations: list[IndexedTranslation]
+
+
+class GroupedWashedSegments(BaseModel):
+    Paragraphs: list[SegmentGroup]
+    Segments: list[SegmentWashDecision]
@@ -0,0 +1,251 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+PRICE_NUMBER_PATTERN = r"(?:\d{1,3}(?:[.,]\d{3})+|\d{1,4})(?:[.,]\d{1,2})?"
+PRICE_UNIT_PATTERN = r"(?:usd|eur|gbp|cad|aud|cny|rmb|円)"
+PRICE_TOKEN_PATTERN = (
+    rf"(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?{PRICE_UNIT_PATTERN})?"
+)
+SEGMENT_DELIMITER_PATTERN = r"\s*(?:\||•|·|;|；)\s*"
+
+# One pass over a line finds both segment delimiters and price tokens. The two
+# never overlap: price tokens hold whitespace only before a digit or a unit.
+_LINE_SCAN = re.compile(
+    rf"(?P<delimiter>{SEGMENT_DELIMITER_PATTERN})|(?P<price>{PRICE_TOKEN_PATTERN})",
+    re.IGNORECASE,
+)
+_PRICE_TOKEN = re.compile(PRICE_TOKEN_PATTERN, re.IGNORECASE)
+# Trailing-price variants differ on purpose: the captured price for a dish, a
+# separated price split off a layout segment, a space-separated one, and the
+# stricter dash-only form used as a grouping signal.
+_TRAILING_PRICE_CAPTURE = re.compile(
+    rf"(?:[-–—:]\s*)?({PRICE_TOKEN_PATTERN})\s*$",
+    re.IGNORECASE,
+)
+_SEPARATED_TRAILING_PRICE = re.compile(
+    rf"[-–—:]\s*{PRICE_TOKEN_PATTERN}\s*$", re.IGNORECASE
+)
+_SPACED_TRAILING_PRICE = re.compile(rf"\s+({PRICE_TOKEN_PATTERN})\s*$", re.IGNORECASE)
+_DASHED_TRAILING_PRICE = re.compile(
+    rf"[-–—]\s*(?:[$€£¥]\s*)?{PRICE_NUMBER_PATTERN}(?:\s?円)?\s*$"
+)
+_NUMERIC_NOISE = re.compile(r"[\s$€£¥.,\-–—:]")
+# Dish name cleanup: separated prices such as "- 7", "- $7.5", ": 1,200円", the
+# vegan marker "(vg)", then standalone prices like "$7.5" or "12.50".
+_NAME_SEPARATED_PRICE = re.compile(
+    r"[-–—:]\s*(?:[$€£¥]\s*)?\d+(?:[.,]\d+)?(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?",
+    re.IGNORECASE,
+)
+_NAME_VEGAN_MARKER = re.compile(r"\(\s*vg\s*\)", re.IGNORECASE)
+_NAME_STANDALONE_PRICE = re.compile(
+    r"\s*(?:[$€£¥]\s*\d+(?:[.,]\d+)?|\d+[.,]\d+|\d+\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))",
+    re.IGNORECASE,
+)
+TOKENIZER_CACHE_SIZE = 8192
+
+
+@dataclass(frozen=True, slots=True)
+class LineTokens:
+    """Everything the menu pipeline reads from the text of one OCR line.
+
+    `segments` are `(start, end)` offsets into the original text, split at
+    delimiters, between repeated prices and before a trailing price.
+    """
+
+    text: str
+    price_token: str | None
+    cleaned_name: str
+    is_price_only: bool
+    is_numeric_only: bool
+    has_price_like_pattern: bool
+    segments: tuple[tuple[int, int], ...]
+
+
+def trim_text_range(text: str, start: int, end: int) -> tuple[int, int] | None:
+    left = start
+    right = end
+    while left < right and text[left].isspace():
+        left += 1
+    while right > left and text[right - 1].isspace():
+        right -= 1
+    if left >= right:
+        return None
+    return left, right
+
+
+def _trim_price_range(text: str, start: int, end: int) -> tuple[int, int] | None:
+    trimmed = trim_text_range(text, start, end)
+    if trimmed is None:
+        return None
+
+    left, right = trimmed
+    while left < right and text[left] in {"-", "–", "—", ":"}:
+        left += 1
+    return trim_text_range(text, left, right)
+
+
+def is_price_only(text: str) -> bool:
+    return _PRICE_TOKEN.fullmatch(text.strip()) is not None
+
+
+def _scan(
+    text: str, start: int, end: int
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    delimiters: list[tuple[int, int]] = []
+    prices: list[tuple[int, int]] = []
+    for match in _LINE_SCAN.finditer(text, start, end):
+        if match.lastgroup == "delimiter":
+            delimiters.append(match.span())
+        else:
+            prices.append(match.span())
+    return delimiters, prices
+
+
+def _split_at_delimiters(
+    text: str, start: int, end: int, delimiters: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    cursor = start
+    for delimiter_start, delimiter_end in delimiters:
+        candidate = trim_text_range(text, cursor, delimiter_start)
+        if candidate is not None:
+            ranges.append(candidate)
+        cursor = delimiter_end
+
+    tail = trim_text_range(text, cursor, end)
+    if tail is not None:
+        ranges.append(tail)
+    return ranges
+
+
+def _split_by_repeated_prices(
+    text: str, start: int, end: int, prices: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    if len(prices) < 2:
+        return [(start, end)]
+
+    ranges: list[tuple[int, int]] = []
+    cursor = start
+    for _, price_end in prices:
+        candidate = trim_text_range(text, cursor, price_end)
+        if candidate is not None:
+            ranges.append(candidate)
+        cursor = price_end
+
+    tail = trim_text_range(text, cursor, end)
+    if tail is not None:
+        ranges.append(tail)
+
+    return ranges if len(ranges) >= 2 else [(start, end)]
+
+
+def _split_out_trailing_price(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    chunk = text[start:end]
+    price_start: int | None = None
+    strict_match = _SEPARATED_TRAILING_PRICE.search(chunk)
+    if strict_match is not None:
+        price_start = start + strict_match.start()
+    else:
+        loose_match = _SPACED_TRAILING_PRICE.search(chunk)
+        if loose_match is not None:
+            price_start = start + loose_match.start(1)
+    if price_start is None:
+        return [(start, end)]
+
+    pieces: list[tuple[int, int]] = []
+    left_piece = trim_text_range(text, start, price_start)
+    if left_piece is not None:
+        pieces.append(left_piece)
+    price_piece = _trim_price_range(text, price_start, end)
+    if price_piece is not None:
+        pieces.append(price_piece)
+
+    return pieces or [(start, end)]
+
+
+def _segment_ranges(
+    text: str,
+    start: int,
+    end: int,
+    delimiters: list[tuple[int, int]],
+    prices: list[tuple[int, int]],
+) -> tuple[tuple[int, int], ...]:
+    ranges: list[tuple[int, int]] = []
+    for chunk_start, chunk_end in _split_at_delimiters(text, start, end, delimiters):
+        chunk_prices = [
+            price
+            for price in prices
+            if chunk_start <= price[0] and price[1] <= chunk_end
+        ]
+        for piece_start, piece_end in _split_by_repeated_prices(
+            text, chunk_start, chunk_end, chunk_prices
+        ):
+            # Every trailing-price form needs a digit, and every digit lies in a token.
+            if any(
+                piece_start < price_end and price_start < piece_end
+                for price_start, price_end in chunk_prices
+            ):
+                ranges.extend(_split_out_trailing_price(text, piece_start, piece_end))
+            else:
+                ranges.append((piece_start, piece_end))
+    return tuple(ranges)
+
+
+def _clean_name(text: str, has_digits: bool) -> str:
+    cleaned = text
+    if has_digits:
+        cleaned = _NAME_SEPARATED_PRICE.sub("", cleaned)
+    if "(" in cleaned:
+        cleaned = _NAME_VEGAN_MARKER.sub("", cleaned)
+    if has_digits:
+        cleaned = _NAME_STANDALONE_PRICE.sub("", cleaned)
+    return " ".join(cleaned.split())
+
+
+@lru_cache(maxsize=TOKENIZER_CACHE_SIZE)
+def tokenize_line(text: str) -> LineTokens:
+    """Scan one line of menu text once and derive every price/name feature from it.
+
+    Lines repeat across pipeline stages and uploads, so results are memoized by text.
+    """
+    trimmed = trim_text_range(text, 0, len(text))
+    if trimmed is None:
+        return LineTokens(
+            text=text,
+            price_token=None,
+            cleaned_name="",
+            is_price_only=False,
+            is_numeric_only=False,
+            has_price_like_pattern=False,
+            segments=(),
+        )
+
+    start, end = trimmed
+    stripped = text[start:end]
+    delimiters, prices = _scan(text, start, end)
+    has_digits = bool(prices)
+
+    price_only = has_digits and _PRICE_TOKEN.fullmatch(stripped) is not None
+    price_token: str | None = None
+    has_price_like_pattern = price_only
+    if price_only:
+        price_token = stripped
+    elif has_digits:
+        trailing = _TRAILING_PRICE_CAPTURE.search(stripped)
+        if trailing is not None:
+            price_token = trailing.group(1).strip() or None
+        has_price_like_pattern = _DASHED_TRAILING_PRICE.search(
+            stripped
+        ) is not None or (len(prices) == 1 and len(stripped.split()) <= 3)
+
+    normalized = _NUMERIC_NOISE.sub("", stripped).lower()
+    return LineTokens(
+        text=text,
+        price_token=price_token,
+        cleaned_name=_clean_name(text, has_digits),
+        is_price_only=price_only,
+        is_numeric_only=bool(normalized) and normalized.isdigit(),
+        has_price_like_pattern=has_price_like_pattern,
+        segments=_segment_ranges(text, start, end, delimiters, prices),
+    )
@@ -1,7 +1,7 @@
 import asyncio
 import functools
+import hashlib
 from loguru import logger
-import re
 import time
 from dataclasses import dataclass
 from typing import Callable, ParamSpec, TypeVar
@@ -11,7 +11,9 @@ from langchain_core.runnables import RunnableSerializable
 from langchain_openai import ChatOpenAI
 
 from src.core.config import settings
-from src.models import Dish
+from src.core.vendors.llm.client import LLMTransport
+from src.models import Dish, DishBatch
+from src.services.ocr.tokenizer import tokenize_line
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -50,27 +52,8 @@ class BoundingBox:
 
 
 def clean_dish_name(dish_name: str) -> str:
-    # Remove trailing prices such as "- 7", "- $7.5", ": 1,200円"
-    cleaned_name = re.sub(
-        r"[-–—:]\s*(?:[$€£¥]\s*)?\d+(?:[.,]\d+)?(?:\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))?",
-        "",
-        dish_name,
-        flags=re.IGNORECASE,
-    )
-    cleaned_name = re.sub(
-        r"\(\s*vg\s*\)", "", cleaned_name, flags=re.IGNORECASE
-    )  # Removes vegan indicator '(vg)'
-    cleaned_name = re.sub(
-        r"\s*(?:[$€£¥]\s*\d+(?:[.,]\d+)?|\d+[.,]\d+|\d+\s?(?:usd|eur|gbp|cad|aud|cny|rmb|円))",
-        "",
-        cleaned_name,
-        flags=re.IGNORECASE,
-    )  # Removes standalone prices like '$7.5' or '12'
-    cleaned_name = re.sub(
-        r"\s+", " ", cleaned_name
-    ).strip()  # Clean up extra spaces and trim
-
-    return cleaned_name
+    # Drops prices such as "- 7", "- $7.5", ": 1,200円" or "$7.5" and the vegan marker "(vg)"
+    return tokenize_line(dish_name).cleaned_name
 
 
 def resolve_reasoning_effort(raw_effort: str | None = None) -> str | None:
@@ -90,6 +73,10 @@ def build_openai_reasoning_kwargs(
     return {"reasoning": {"effort": reasoning_effort}}
 
 
+def prompt_fingerprint(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:12]
+
+
 def build_chat_openai(
     model: str | None = None,
     reasoning_effort: str | None = None,
@@ -100,6 +87,7 @@ def build_chat_openai(
         "model_name": model_name,
         "openai_api_base": settings.OPENAI_BASE_URL,
         "openai_api_key": settings.OPENAI_API_KEY,
+        **LLMTransport.chat_model_kwargs(),
     }
     resolved_effort = resolve_reasoning_effort(reasoning_effort)
     if resolved_effort is not None:
@@ -118,17 +106,28 @@ def build_search_chain(model: str | None = None) -> RunnableSerializable:
     prompt = ChatPromptTemplate.from_messages(
         [
             ("system", PROMPT),
-            (
-                "human",
-                "Target language: '{accept_language}'. OCR text: '{dish_name}'. "
-                "Return only the structured fields.",
-            ),
+            ("human", SEARCH_HUMAN_PROMPT),
         ]
     )
     runnable = prompt | llm.with_structured_output(Dish,method="function_calling")
     return runnable
 
 
+def build_batch_search_chain(model: str | None = None) -> RunnableSerializable:
+    selected_model = model or settings.MENU_DISH_INFO_LLM_MODEL or settings.OPENAI_MODEL
+    llm = build_chat_openai(
+        selected_model,
+        temperature=settings.MENU_DISH_INFO_LLM_TEMPERATURE,
+    )
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", PROMPT + BATCH_PROMPT_SUFFIX),
+            ("human", BATCH_SEARCH_HUMAN_PROMPT),
+        ]
+    )
+    return prompt | llm.with_structured_output(DishBatch, method="function_calling")
+
+
 PROMPT = """\
 You are a multilingual menu extraction assistant. Return structured JSON with:
 - dish_name
@@ -153,6 +152,27 @@ Normalization examples (menu terminology):
   - LATTE -> 拿铁咖啡
 """
 
+SEARCH_HUMAN_PROMPT = (
+    "Target language: '{accept_language}'. OCR text: '{dish_name}'. "
+    "Return only the structured fields."
+)
+DISH_INFO_PROMPT_VERSION = prompt_fingerprint(PROMPT, SEARCH_HUMAN_PROMPT)
+
+BATCH_PROMPT_SUFFIX = """
+Batch mode:
+- The input is a JSON array of OCR items with fields index and text.
+- Return exactly one entry in dishes for every input index, with the same index.
+- Apply the rules above to each item independently.
+"""
+
+BATCH_SEARCH_HUMAN_PROMPT = (
+    "Target language: '{accept_language}'. OCR items: {dish_items}. "
+    "Return only the structured fields."
+)
+BATCH_DISH_INFO_PROMPT_VERSION = prompt_fingerprint(
+    PROMPT, BATCH_PROMPT_SUFFIX, BATCH_SEARCH_HUMAN_PROMPT
+)
+
 
 def build_recommendation_chain(model: str | None = None) -> RunnableSerializable:
     llm = build_chat_openai(model)
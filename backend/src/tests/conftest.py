@@ -7,6 +7,7 @@ from src.api.deps import get_user
 from src.core.vendors.supabase.client import SupabaseClient
 from src.main import app
 from src.models import User
+from src.services.dish_image_writer import DishImageWriteBehind
 
 
 @pytest.fixture(autouse=True)
@@ -18,6 +19,27 @@ def mock_startup_dependencies(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr("src.main.FatSecretClient", lambda *args, **kwargs: None)
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("src.services.menu._dip_result_cache", None)
+    monkeypatch.setattr("src.services.menu._dish_info_cache", None)
+    monkeypatch.setattr("src.services.menu._translation_cache", None)
+    monkeypatch.setattr(
+        "src.services.ocr.decision_cache._grouping_decision_cache", None
+    )
+    monkeypatch.setattr("src.services.menu._dish_image_lookup_cache", None)
+    monkeypatch.setattr("src.services.access_policy._access_policy_engine", None)
+    monkeypatch.setattr("src.api.deps._verified_user_cache", None)
+    monkeypatch.setattr("src.services.llm_limiter._llm_limiters", {})
+    monkeypatch.setattr("src.services.llm_hedging._llm_hedgers", {})
+    monkeypatch.setattr(DishImageWriteBehind, "_pending", {})
+    monkeypatch.setattr(DishImageWriteBehind, "_refreshing", set())
+    monkeypatch.setattr(DishImageWriteBehind, "_refresh_tasks", set())
+    monkeypatch.setattr(DishImageWriteBehind, "_stopping", False)
+    monkeypatch.setattr(DishImageWriteBehind, "has_refreshed_at", True)
+    monkeypatch.setattr(DishImageWriteBehind, "_schema_errors_logged", set())
+
+
 @pytest.fixture
 def test_user() -> User:
     return User(
@@ -76,3 +76,14 @@ def test_debug_benchmark_endpoints_with_sample_artifacts(client, monkeypatch, tm
     )
     assert image_response.status_code == 200
     assert image_response.headers["content-type"] == "image/jpeg"
+
+
+def test_debug_metrics_exposes_cache_stats(client, monkeypatch):
+    monkeypatch.setattr("src.api.debug.settings.DEBUG_TOOLS_ENABLED", True)
+
+    response = client.get("/debug/metrics")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["caches"][0]["name"] == "dip_ocr"
+    assert "counters" in payload
@@ -1,3 +1,10 @@
+import asyncio
+import json
+
+from src.core.config import settings
+from src.services.exceptions import PreprocessingBusyError
+
+
 def test_menu_analyze_full_flow(client, sample_image_bytes, monkeypatch):
     async def fake_post_dip_request(_image: bytes) -> str:
         return "https://fake-dip/result/123"
@@ -31,7 +38,7 @@ def test_menu_analyze_full_flow(client, sample_image_bytes, monkeypatch):
         # Treat the second non-price line as a grouped paragraph.
         return [lines[1]], [lines[0]]
 
-    async def fake_process_dip_results(lines, accept_language):
+    async def fake_process_dip_results(lines, accept_language, **_kwargs):
         return [
             {
                 "description": f"{line['content']} ({accept_language})",
@@ -42,7 +49,7 @@ def test_menu_analyze_full_flow(client, sample_image_bytes, monkeypatch):
             for line in lines
         ]
 
-    async def fake_process_dip_paragraph_results(lines, accept_language):
+    async def fake_process_dip_paragraph_results(lines, accept_language, **_kwargs):
         return [
             {
                 "description": f"{line['content']} ({accept_language})",
@@ -136,7 +143,7 @@ def test_menu_analyze_timeout_fallback_returns_non_error_payload(
         # Simulate timeout fallback behavior: no grouped paragraphs.
         return [], lines
 
-    async def fake_process_dip_results(lines, accept_language):
+    async def fake_process_dip_results(lines, accept_language, **_kwargs):
         return [
             {
                 "description": f"{line['content']} ({accept_language})",
@@ -147,7 +154,7 @@ def test_menu_analyze_timeout_fallback_returns_non_error_payload(
             for line in lines
         ]
 
-    async def fake_process_dip_paragraph_results(lines, accept_language):
+    async def fake_process_dip_paragraph_results(lines, accept_language, **_kwargs):
         return []
 
     monkeypatch.setattr("src.services.menu.post_dip_request", fake_post_dip_request)
@@ -184,7 +191,7 @@ def test_menu_analyze_fast_flow_uses_lines_only_path(client, sample_image_bytes,
             }
         ]
 
-    async def fake_process_dip_results(lines, _accept_language):
+    async def fake_process_dip_results(lines, _accept_language, **_kwargs):
         return [
             {
                 "description": line["content"],
@@ -216,12 +223,116 @@ def test_menu_analyze_fast_flow_uses_lines_only_path(client, sample_image_bytes,
     assert len(payload["results"]) == 1
 
 
+def test_menu_analyze_returns_partial_results_at_request_deadline(
+    client, sample_image_bytes, monkeypatch
+):
+    async def fake_run_dip(_image: bytes):
+        return [
+            {"content": "Burger", "polygon": {"x_coords": [10, 100], "y_coords": [10, 40]}},
+            {"content": "Ramen", "polygon": {"x_coords": [10, 100], "y_coords": [50, 80]}},
+        ]
+
+    async def fake_get_dish_data(dish_name: str, _accept_language: str, *, include_images=True):
+        if dish_name == "Ramen":
+            await asyncio.sleep(5)
+        return {
+            "description": f"{dish_name} description",
+            "text": dish_name,
+            "text_translation": dish_name,
+            "img_src": None,
+        }
+
+    monkeypatch.setattr("src.services.menu.run_dip", fake_run_dip)
+    monkeypatch.setattr("src.services.menu.get_dish_data", fake_get_dish_data)
+
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze?flowId=fast",
+        files=files,
+        headers={"Accept-Language": "en", "X-Request-Deadline": "0.3"},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["info"]["text"] for item in payload["results"]] == ["Burger", "Ramen"]
+    assert payload["results"][1]["info"]["pending"] is True
+    assert payload["meta"]["deadlineExceeded"] is True
+    assert payload["meta"]["pendingItemIds"] == [1]
+
+
+def test_menu_analyze_stream_reports_pending_items_by_streamed_id(
+    client, sample_image_bytes, monkeypatch
+):
+    async def fake_run_dip(_image: bytes):
+        return [
+            {"content": "Ramen", "polygon": {"x_coords": [10, 100], "y_coords": [10, 40]}},
+            {"content": "Burger", "polygon": {"x_coords": [10, 100], "y_coords": [50, 80]}},
+        ]
+
+    async def fake_get_dish_info_via_openai(dish_name: str, _accept_language: str):
+        if dish_name == "Ramen":
+            await asyncio.sleep(5)
+        return {
+            "description": f"{dish_name} description",
+            "text": dish_name,
+            "text_translation": dish_name,
+        }
+
+    async def fake_get_dish_image(
+        _dish_name, _num_img=10, *, enable_cache=False, prefetched=None
+    ):
+        return None
+
+    monkeypatch.setattr("src.services.menu.run_dip", fake_run_dip)
+    monkeypatch.setattr(
+        "src.services.menu.get_dish_info_via_openai", fake_get_dish_info_via_openai
+    )
+    monkeypatch.setattr("src.services.menu.get_dish_image", fake_get_dish_image)
+
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze/stream?flowId=fast",
+        files=files,
+        headers={"Accept-Language": "en", "X-Request-Deadline": "0.3"},
+    )
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    items = {
+        event["data"]["id"]: event["data"]["info"]
+        for event in events
+        if event["event"] in {"item", "patch"}
+    }
+    meta = events[-1]
+    assert meta["event"] == "meta"
+    assert meta["data"]["deadlineExceeded"] is True
+    assert meta["data"]["totalItems"] == len(items) == 2
+    # Burger resolves first, so it is streamed as item 0 although it is line 1.
+    assert items[0]["text"] == "Burger"
+    assert meta["data"]["pendingItemIds"] == [1]
+    assert items[1]["text"] == "Ramen"
+    assert items[1]["pending"] is True
+
+
+def test_menu_analyze_rejects_malformed_deadline_header(client, sample_image_bytes):
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze",
+        files=files,
+        headers={"X-Request-Deadline": "soon"},
+    )
+
+    assert response.status_code == 400
+
+
 def test_menu_analyze_layout_experiment_flow_uses_experimental_pipeline(
     client,
     sample_image_bytes,
     monkeypatch,
 ):
-    async def fake_layout_pipeline(_image: bytes, _accept_language: str | None):
+    async def fake_layout_pipeline(
+        _image: bytes, _accept_language: str | None, listener=None
+    ):
         return {
             "results": [
                 {
@@ -265,3 +376,140 @@ def test_menu_flow_catalog(client):
     assert "flows" in payload
     assert any(flow["id"] == "dip.auto_group.v1" for flow in payload["flows"])
     assert any(flow["id"] == "dip.layout_segments_llm.v1" for flow in payload["flows"])
+    assert any(
+        flow["id"] == "dip.layout_segments_combined_llm.v1" for flow in payload["flows"]
+    )
+
+
+def test_menu_analyze_stream_emits_ocr_items_patches_and_meta(
+    client,
+    sample_image_bytes,
+    monkeypatch,
+):
+    async def fake_post_dip_request(_image: bytes) -> str:
+        return "https://fake-dip/result/stream"
+
+    async def fake_retrieve_dip_results(_url: str, timeout: int = 3):
+        return {
+            "status": "succeeded",
+            "analyzeResult": {
+                "pages": [
+                    {
+                        "lines": [
+                            {
+                                "content": "Margherita Pizza 12.50",
+                                "polygon": [10, 10, 300, 10, 300, 50, 10, 50],
+                            },
+                            {
+                                "content": "Fresh basil and tomato sauce",
+                                "polygon": [10, 55, 400, 55, 400, 90, 10, 90],
+                            },
+                        ]
+                    }
+                ]
+            },
+        }
+
+    async def fake_build_paragraph(lines):
+        return [lines[1]], [lines[0]]
+
+    async def fake_get_dish_info_via_openai(dish_name: str, _accept_language: str):
+        return {
+            "description": "",
+            "text": dish_name,
+            "text_translation": dish_name,
+        }
+
+    async def fake_get_dish_image(
+        dish_name, _num_img=10, *, enable_cache=False, prefetched=None
+    ):
+        return [f"https://img/{dish_name}"]
+
+    async def fake_process_dip_paragraph_results(lines, _accept_language, **_kwargs):
+        return [
+            {
+                "description": line["content"],
+                "text": line["content"],
+                "text_translation": line["content"],
+                "img_src": None,
+            }
+            for line in lines
+        ]
+
+    monkeypatch.setattr("src.services.menu.post_dip_request", fake_post_dip_request)
+    monkeypatch.setattr(
+        "src.services.menu.retrieve_dip_results", fake_retrieve_dip_results
+    )
+    monkeypatch.setattr("src.services.menu.build_paragraph", fake_build_paragraph)
+    monkeypatch.setattr(
+        "src.services.menu.get_dish_info_via_openai", fake_get_dish_info_via_openai
+    )
+    monkeypatch.setattr("src.services.menu.get_dish_image", fake_get_dish_image)
+    monkeypatch.setattr(
+        "src.services.menu.process_dip_paragraph_results",
+        fake_process_dip_paragraph_results,
+    )
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 10, raising=False)
+
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze/stream",
+        files=files,
+        headers={"Accept-Language": "en"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [event["event"] for event in events] == [
+        "ocr",
+        "item",
+        "patch",
+        "patch",
+        "meta",
+    ]
+    assert len(events[0]["data"]) == 2
+    first_item = events[1]["data"]
+    assert first_item["info"]["text"] == "Margherita Pizza"
+    assert first_item["info"]["price"] == "12.50"
+    assert first_item["info"]["img_src"] is None
+    assert events[2]["data"]["info"]["img_src"] == ["https://img/Margherita Pizza"]
+    merged = events[3]["data"]
+    assert merged["id"] == first_item["id"]
+    assert "Fresh basil and tomato sauce" in merged["info"]["description"]
+    assert merged["boundingBox"]["h"] > first_item["boundingBox"]["h"]
+    assert events[4]["data"]["flowId"] == "dip.auto_group.v1"
+    assert events[4]["data"]["totalItems"] == 1
+
+
+def test_menu_analyze_stream_rejects_unknown_flow(client, sample_image_bytes):
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze/stream?flowId=non-existing-flow",
+        files=files,
+        headers={"Accept-Language": "en"},
+    )
+
+    assert response.status_code == 400
+    assert "availableFlows" in response.json()["detail"]
+
+
+def test_menu_analyze_returns_503_when_preprocessing_is_saturated(
+    client,
+    sample_image_bytes,
+    monkeypatch,
+):
+    async def saturated_preprocess_image(_image: bytes):
+        raise PreprocessingBusyError("Image preprocessing is saturated")
+
+    monkeypatch.setattr("src.services.menu.preprocess_image", saturated_preprocess_image)
+
+    files = {"file": ("menu.jpeg", sample_image_bytes, "image/jpeg")}
+    response = client.post(
+        "/menu/analyze",
+        files=files,
+        headers={"Accept-Language": "en"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
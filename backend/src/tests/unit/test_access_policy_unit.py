@@ -0,0 +1,147 @@
+import pytest
+
+from src.menu_engine.contracts import MenuRecommendationRequestContract
+from src.menu_engine.recommendations import MenuRecommendationService
+from src.models import User
+from src.services.access_policy import AccessDecision, AccessPolicyEngine
+
+
+class FakeResponse:
+    def __init__(self, data=None, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, client: "FakeSupabase", table: str):
+        self.client = client
+        self.table = table
+        self.select_kwargs: dict = {}
+
+    def select(self, *_columns, **kwargs):
+        self.select_kwargs = kwargs
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def gte(self, *_args):
+        return self
+
+    def lt(self, *_args):
+        return self
+
+    def insert(self, data):
+        self.client.inserted.append(data)
+        return self
+
+    async def execute(self):
+        self.client.calls.append((self.table, self.select_kwargs))
+        if self.table == "user_roles":
+            return FakeResponse([{"role": "free"}])
+        if self.table == "access_limits":
+            return FakeResponse([{"role": "free", "daily_limit": 2}])
+        if self.table == "user_access_records":
+            return FakeResponse([], count=self.client.records_today)
+        raise AssertionError(self.table)
+
+
+class FakeSupabase:
+    def __init__(self, records_today: int = 0):
+        self.records_today = records_today
+        self.calls: list[tuple[str, dict]] = []
+        self.inserted: list[dict] = []
+
+    def table(self, name: str):
+        return FakeQuery(self, name)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch) -> FakeSupabase:
+    client = FakeSupabase(records_today=1)
+
+    async def fake_get_client(cls):
+        return client
+
+    monkeypatch.setattr(
+        "src.services.access_policy.SupabaseClient.get_client",
+        classmethod(fake_get_client),
+    )
+    return client
+
+
+def _user() -> User:
+    return User(
+        role="authenticated", user_metadata={}, iat=0, exp=4_102_444_800, sub="u-1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_access_limits_use_head_count_and_cache_policy(fake_supabase):
+    engine = AccessPolicyEngine()
+
+    first = await engine.get_access_limits(_user())
+    calls_after_first = len(fake_supabase.calls)
+    second = await engine.get_access_limits(_user())
+
+    assert (
+        first
+        == second
+        == {
+            "role": "free",
+            "daily_limit": 2,
+            "remaining_accesses": 1,
+            "expires_at": None,
+        }
+    )
+    count_call = dict(fake_supabase.calls)["user_access_records"]
+    assert count_call["head"] is True
+    assert count_call["count"].value == "exact"
+    assert len(fake_supabase.calls) == calls_after_first == 3
+
+
+@pytest.mark.asyncio
+async def test_try_consume_checks_and_increments_until_limit(fake_supabase):
+    engine = AccessPolicyEngine()
+
+    allowed = await engine.try_consume(_user())
+    calls_before_denial = len(fake_supabase.calls)
+    denied = await engine.try_consume(_user())
+
+    assert allowed == AccessDecision(allowed=True, remaining_accesses=0)
+    assert denied == AccessDecision(allowed=False, remaining_accesses=0)
+    assert len(fake_supabase.calls) == calls_before_denial
+
+    await engine.release(_user())
+    assert (await engine.try_consume(_user())).allowed is True
+
+
+@pytest.mark.asyncio
+async def test_recommendation_releases_reservation_when_generation_fails():
+    events: list[str] = []
+
+    class FakeRepository:
+        async def try_consume(self, _user):
+            events.append("consume")
+            return AccessDecision(allowed=True, remaining_accesses=4)
+
+        async def commit(self, _user):
+            events.append("commit")
+
+        async def release(self, _user):
+            events.append("release")
+
+    class FailingGenerator:
+        async def recommend(self, _request):
+            raise RuntimeError("llm down")
+
+    service = MenuRecommendationService(
+        access_policy_repository=FakeRepository(),
+        recommendation_generator=FailingGenerator(),
+    )
+    request = MenuRecommendationRequestContract(dishes=["Tiramisu"], language="en")
+
+    with pytest.raises(RuntimeError):
+        await service.recommend_for_user(request=request, user=_user())
+
+    assert events == ["consume", "release"]
@@ -0,0 +1,59 @@
+import itertools
+
+import numpy as np
+
+from src.services.ocr.assignment import (
+    DishBoxIndex,
+    paragraph_candidates,
+    price_candidates,
+    solve_min_cost_assignment,
+)
+
+
+def _box(y: float, x: float = 0.1) -> dict[str, float]:
+    return {"x": x, "y": y, "w": 0.2, "h": 0.02}
+
+
+def test_dish_box_index_prunes_far_rows_and_tracks_updates():
+    index = DishBoxIndex([_box(0.05), _box(0.50), _box(0.95)])
+
+    assert price_candidates(index, _box(0.50)).tolist() == [1]
+    assert paragraph_candidates(index, _box(0.50)).tolist() == [0, 1, 2]
+
+    index.update(2, _box(0.55))
+
+    assert price_candidates(index, _box(0.50)).tolist() == [1, 2]
+    assert index.box(2)["y"] == 0.55
+
+
+def test_solve_min_cost_assignment_matches_brute_force():
+    rng = np.random.default_rng(7)
+    limit = 2.0
+    for _ in range(200):
+        rows, cols = rng.integers(1, 5, size=2)
+        cost = rng.random((rows, cols)) * 3
+        cost[rng.random((rows, cols)) < 0.2] = np.inf
+
+        matches = solve_min_cost_assignment(cost, limit)
+
+        best_size, best_total = 0, 0.0
+        for size in range(min(rows, cols), 0, -1):
+            for row_pick in itertools.combinations(range(rows), size):
+                for col_pick in itertools.permutations(range(cols), size):
+                    pairs = list(zip(row_pick, col_pick))
+                    if all(cost[r, c] < limit for r, c in pairs):
+                        total = sum(cost[r, c] for r, c in pairs)
+                        if best_size < size or total < best_total:
+                            best_size, best_total = size, total
+            if best_size:
+                break
+        assert len(matches) == best_size
+        assert len(set(matches.values())) == len(matches)
+        assert abs(sum(cost[r, c] for r, c in matches.items()) - best_total) < 1e-9
+
+
+def test_solve_min_cost_assignment_drops_disallowed_pairs():
+    cost = np.array([[0.5, np.inf], [3.0, np.inf]])
+
+    assert solve_min_cost_assignment(cost, 2.0) == {0: 0}
+    assert solve_min_cost_assignment(np.empty((0, 3)), 2.0) == {}
@@ -3,9 +3,15 @@ from types import SimpleNamespace
 import pytest
 
 from src.core.config import settings
+from src.core.vendors.llm.client import LLMTransport
 from src.services.ocr.build_paragraph import build_paragraph
-from src.services.ocr.build_paragraph import translate
-from src.services.ocr.models import GroupedParagraphs, Lines
+from src.services.ocr.build_paragraph import translate, translate_batch
+from src.services.ocr.models import (
+    GroupedParagraphs,
+    IndexedTranslation,
+    Lines,
+    TranslatedParagraphs,
+)
 
 
 def _sample_dip_lines() -> list[dict]:
@@ -50,8 +56,8 @@ async def test_build_paragraph_async_parse_success(monkeypatch):
         "minimal",
         raising=False,
     )
-    monkeypatch.setattr("src.services.ocr.build_paragraph.AsyncOpenAI", FakeAsyncOpenAI)
-    monkeypatch.setattr("src.services.ocr.build_paragraph._openai_client", None)
+    monkeypatch.setattr("src.core.vendors.llm.client.AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
 
     paragraph_lines, individual_lines = await build_paragraph(_sample_dip_lines())
 
@@ -116,8 +122,8 @@ async def test_translate_adds_global_reasoning_effort(monkeypatch):
         "minimal",
         raising=False,
     )
-    monkeypatch.setattr("src.services.ocr.build_paragraph.AsyncOpenAI", FakeAsyncOpenAI)
-    monkeypatch.setattr("src.services.ocr.build_paragraph._openai_client", None)
+    monkeypatch.setattr("src.core.vendors.llm.client.AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
 
     translated = await translate("hello", "es")
 
@@ -138,9 +144,35 @@ async def test_translate_skips_reasoning_when_disabled(monkeypatch):
             self.responses = SimpleNamespace(create=_create)
 
     monkeypatch.setattr(settings, "OPENAI_REASONING_EFFORT", "none", raising=False)
-    monkeypatch.setattr("src.services.ocr.build_paragraph.AsyncOpenAI", FakeAsyncOpenAI)
-    monkeypatch.setattr("src.services.ocr.build_paragraph._openai_client", None)
+    monkeypatch.setattr("src.core.vendors.llm.client.AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
 
     await translate("hello", "es")
 
     assert "reasoning" not in captured_create_kwargs
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_aligns_by_index_and_skips_bad_entries(monkeypatch):
+    parsed = TranslatedParagraphs(
+        Translations=[
+            IndexedTranslation(index=1, text="second"),
+            IndexedTranslation(index=0, text="first"),
+            IndexedTranslation(index=1, text="duplicate"),
+            IndexedTranslation(index=7, text="out of range"),
+        ]
+    )
+
+    class FakeAsyncOpenAI:
+        def __init__(self, *args, **kwargs):
+            async def _parse(**_kwargs):
+                return SimpleNamespace(output_parsed=parsed)
+
+            self.responses = SimpleNamespace(parse=_parse)
+
+    monkeypatch.setattr("src.core.vendors.llm.client.AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
+
+    result = await translate_batch(["eins", "zwei", "drei"], "en")
+
+    assert result == ["first", "second", None]
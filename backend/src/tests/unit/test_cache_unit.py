@@ -0,0 +1,105 @@
+import pytest
+
+from src.services.cache import (
+    DiskCacheBackend,
+    LRUCache,
+    SqliteCacheBackend,
+    TieredCache,
+)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.services.cache.time.monotonic", lambda: now[0])
+    cache = LRUCache(max_entries=4, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=30)
+
+    now[0] = 111.0
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_persistent_hits_to_memory():
+    class FakeBackend:
+        def __init__(self):
+            self.store = {"k": ["from-backend"]}
+            self.reads = 0
+
+        async def get(self, key):
+            self.reads += 1
+            return self.store.get(key)
+
+        async def set(self, key, value, ttl_seconds):
+            self.store[key] = value
+
+    backend = FakeBackend()
+    cache = TieredCache("unit_promote", max_entries=4, ttl_seconds=60, backend=backend)
+
+    assert await cache.get("k") == ["from-backend"]
+    assert await cache.get("k") == ["from-backend"]
+    assert await cache.get("missing") is None
+
+    stats = cache.stats()
+    assert backend.reads == 2
+    assert stats["memoryHits"] == 1
+    assert stats["persistentHits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_treats_backend_errors_as_misses():
+    class BrokenBackend:
+        async def get(self, key):
+            raise OSError("disk gone")
+
+        async def set(self, key, value, ttl_seconds):
+            raise OSError("disk gone")
+
+    cache = TieredCache(
+        "unit_broken", max_entries=4, ttl_seconds=60, backend=BrokenBackend()
+    )
+
+    assert await cache.get("k") is None
+    await cache.set("k", {"v": 1})
+    assert await cache.get("k") == {"v": 1}
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_backend_round_trip_and_expiry(tmp_path, monkeypatch):
+    backend = DiskCacheBackend(tmp_path)
+    await backend.set("abc:1", [{"content": "Sushi"}], ttl_seconds=30)
+
+    assert await backend.get("abc:1") == [{"content": "Sushi"}]
+
+    real_time = __import__("time").time
+    monkeypatch.setattr("src.services.cache.time.time", lambda: real_time() + 60)
+    assert await backend.get("abc:1") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_backend_round_trip_and_overwrite(tmp_path):
+    backend = SqliteCacheBackend(tmp_path / "nested" / "cache.sqlite3")
+
+    assert await backend.get("dish") is None
+    await backend.set("dish", {"text": "Latte"}, ttl_seconds=30)
+    await backend.set("dish", {"text": "Mocha"}, ttl_seconds=30)
+    await backend.set("expired", {"text": "Old"}, ttl_seconds=-1)
+
+    assert await backend.get("dish") == {"text": "Mocha"}
+    assert await backend.get("expired") is None
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from src.services.deadline import (
+    current_deadline,
+    gather_until_deadline,
+    parse_deadline_header,
+    request_deadline,
+    stage_timeout,
+)
+
+
+async def _sleep_then(value: str, delay: float) -> str:
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_stage_timeout_shrinks_to_remaining_budget():
+    assert stage_timeout(8) == 8
+
+    with request_deadline(2) as deadline:
+        assert current_deadline() is deadline
+        assert 1.5 < stage_timeout(8) <= 2
+        assert stage_timeout(0.5) == 0.5
+
+    assert current_deadline() is None
+
+
+def test_request_deadline_without_budget_is_disabled():
+    with request_deadline(0) as deadline:
+        assert deadline is None
+        assert stage_timeout(8) == 8
+
+
+@pytest.mark.asyncio
+async def test_gather_until_deadline_cancels_unfinished_work():
+    cancelled = asyncio.Event()
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "slow"
+
+    with request_deadline(0.05) as deadline:
+        results = await gather_until_deadline(
+            [_sleep_then("fast", 0), slow()], stage="test"
+        )
+
+    assert results == ["fast", None]
+    assert cancelled.is_set()
+    assert deadline.exceeded
+
+
+@pytest.mark.asyncio
+async def test_gather_until_deadline_inherits_deadline_in_spawned_tasks():
+    async def read_budget() -> float:
+        return stage_timeout(30)
+
+    with request_deadline(1):
+        results = await gather_until_deadline([read_budget()], stage="test")
+
+    assert results[0] <= 1
+
+
+@pytest.mark.asyncio
+async def test_gather_until_deadline_without_deadline_behaves_like_gather():
+    assert await gather_until_deadline([_sleep_then("a", 0)], stage="test") == ["a"]
+
+
+def test_parse_deadline_header():
+    assert parse_deadline_header(None) is None
+    assert parse_deadline_header(" ") is None
+    assert parse_deadline_header("12.5") == 12.5
+    for raw_value in ("0", "-1", "soon", "nan"):
+        with pytest.raises(ValueError):
+            parse_deadline_header(raw_value)
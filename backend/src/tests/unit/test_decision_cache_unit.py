@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.services.ocr.decision_cache import CachedCompletion, memoized_parse
+from src.services.ocr.models import GroupedParagraphs, Lines
+
+
+def _payload(jitter: float = 0.0) -> list[dict]:
+    return [
+        {"index": 0, "text": "Pho", "bbox": {"x_min": 0.1 + jitter, "y_min": 0.2}},
+        {
+            "index": 1,
+            "text": "Beef soup",
+            "bbox": {"x_min": 0.1, "y_min": 0.25 + jitter},
+        },
+    ]
+
+
+async def _memoized(payload: list[dict], call):
+    return await memoized_parse(
+        "grouping",
+        prompt="group these lines",
+        model="model-a",
+        reasoning_effort="minimal",
+        payload=payload,
+        text_format=GroupedParagraphs,
+        call=call,
+    )
+
+
+@pytest.mark.asyncio
+async def test_memo_hit_skips_llm_and_ignores_bbox_jitter(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_GROUPING_MEMO_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_GROUPING_MEMO_BBOX_PRECISION", 3, raising=False)
+    calls = 0
+    grouped = GroupedParagraphs(Paragraphs=[Lines(segment_lines_indices=[0, 1])])
+
+    async def _call():
+        nonlocal calls
+        calls += 1
+        return SimpleNamespace(output_parsed=grouped, status="completed")
+
+    first = await _memoized(_payload(), _call)
+    second = await _memoized(_payload(jitter=0.00001), _call)
+
+    assert calls == 1
+    assert first.output_parsed == grouped
+    assert isinstance(second, CachedCompletion)
+    assert second.output_parsed == grouped
+
+
+@pytest.mark.asyncio
+async def test_memo_does_not_store_parse_fallbacks(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_GROUPING_MEMO_ENABLED", True, raising=False)
+    calls = 0
+
+    async def _call():
+        nonlocal calls
+        calls += 1
+        return SimpleNamespace(output_parsed=None, status="incomplete")
+
+    await _memoized(_payload(), _call)
+    second = await _memoized(_payload(), _call)
+
+    assert calls == 2
+    assert second.output_parsed is None
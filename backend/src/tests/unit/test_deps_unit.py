@@ -3,7 +3,8 @@ import http
 import pytest
 from fastapi import HTTPException
 
-from src.api.deps import get_user
+from src.api.deps import get_user, get_verified_user_cache
+from src.core.metrics import metrics
 
 
 def test_get_user_rejects_invalid_authorization_header():
@@ -29,3 +30,29 @@ def test_get_user_parses_bearer_token(monkeypatch: pytest.MonkeyPatch):
 
     assert user.sub == "user-my-token"
     assert user.user_role.value == "free"
+
+
+def test_get_user_reuses_verified_user_until_expiry(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+
+    def fake_verify_jwt(token: str) -> dict:
+        calls.append(token)
+        return {
+            "role": "authenticated",
+            "user_metadata": {},
+            "iat": 0,
+            "exp": 4_102_444_800 if token == "long" else 0,
+            "sub": f"user-{token}",
+        }
+
+    monkeypatch.setattr("src.api.deps.verify_jwt", fake_verify_jwt)
+    metrics.reset()
+
+    first = get_user("Bearer long")
+    second = get_user("Bearer long")
+    get_user("Bearer expired")
+    get_user("Bearer expired")
+
+    assert first is second
+    assert calls == ["long", "expired", "expired"]
+    assert get_verified_user_cache().stats()["hitRate"] == 0.25
@@ -0,0 +1,126 @@
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.services.menu import DipLatencyEstimator, retrieve_dip_results
+
+RESULT_URL = "https://fake-dip/result/poll"
+
+
+class FakeDipClient:
+    def __init__(self, responses: list[httpx.Response]):
+        self._responses = responses
+        self.calls = 0
+
+    async def get(self, _url, headers=None):
+        response = self._responses[min(self.calls, len(self._responses) - 1)]
+        self.calls += 1
+        return response
+
+
+def _response(status: str, *, status_code: int = 200, retry_after: str | None = None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(
+        status_code,
+        json={"status": status},
+        headers=headers,
+        request=httpx.Request("GET", RESULT_URL),
+    )
+
+
+@pytest.fixture
+def poll_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DIP_POLL_FIRST_POLL_RATIO", 0.5, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_MIN_INTERVAL_SECONDS", 0.2, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_MAX_INTERVAL_SECONDS", 2.0, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_BACKOFF_FACTOR", 2.0, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_HONOR_RETRY_AFTER", True, raising=False)
+    monkeypatch.setattr(
+        "src.services.menu.dip_latency_estimator", DipLatencyEstimator(1.0)
+    )
+
+
+def _install(monkeypatch, client: FakeDipClient) -> list[float]:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float):
+        sleeps.append(round(delay, 6))
+
+    monkeypatch.setattr(
+        "src.services.menu.HttpClientRegistry.get_client", lambda _vendor: client
+    )
+    monkeypatch.setattr("src.services.menu.asyncio.sleep", fake_sleep)
+    return sleeps
+
+
+@pytest.mark.asyncio
+async def test_retrieve_dip_results_backs_off_and_honors_retry_after(
+    monkeypatch, poll_settings
+):
+    client = FakeDipClient(
+        [
+            _response("running"),
+            _response("running", retry_after="1.5"),
+            _response("running"),
+            _response("succeeded"),
+        ]
+    )
+    sleeps = _install(monkeypatch, client)
+
+    result = await retrieve_dip_results(RESULT_URL, timeout=30)
+
+    assert result == {"status": "succeeded"}
+    # First poll uses the estimate, then exponential backoff unless Retry-After is set.
+    assert sleeps == [0.5, 1.0, 1.5, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_dip_results_waits_on_throttling(monkeypatch, poll_settings):
+    client = FakeDipClient(
+        [
+            _response("running", status_code=429, retry_after="0.7"),
+            _response("succeeded"),
+        ]
+    )
+    sleeps = _install(monkeypatch, client)
+
+    result = await retrieve_dip_results(RESULT_URL, timeout=30)
+
+    assert result == {"status": "succeeded"}
+    assert sleeps == [0.5, 0.7]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_dip_results_returns_none_when_budget_exhausted(
+    monkeypatch, poll_settings
+):
+    now = [0.0]
+    client = FakeDipClient([_response("running")])
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(
+        "src.services.menu.HttpClientRegistry.get_client", lambda _vendor: client
+    )
+    monkeypatch.setattr("src.services.menu.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr("src.services.menu.time.monotonic", lambda: now[0])
+
+    result = await retrieve_dip_results(RESULT_URL, timeout=3)
+
+    assert result is None
+    assert sum(sleeps) == pytest.approx(3.0)
+
+
+def test_dip_latency_estimator_tracks_completion_time(monkeypatch):
+    monkeypatch.setattr(settings, "DIP_POLL_FIRST_POLL_RATIO", 0.5, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_MIN_INTERVAL_SECONDS", 0.1, raising=False)
+    monkeypatch.setattr(settings, "DIP_POLL_MAX_INTERVAL_SECONDS", 5.0, raising=False)
+    estimator = DipLatencyEstimator(2.0, smoothing=0.5)
+
+    estimator.record(4.0)
+
+    assert estimator.estimate_seconds == 3.0
+    assert estimator.first_poll_delay() == 1.5
@@ -0,0 +1,204 @@
+import asyncio
+import datetime
+
+import httpx
+import pytest
+from postgrest import APIError
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.services.dish_image_writer import (
+    DishImageWriteBehind,
+    dish_image_columns,
+    is_dish_image_row_stale,
+)
+
+
+class FakeUpsertTable:
+    def __init__(self):
+        self.upserts: list[list[dict]] = []
+        self.error: Exception | None = None
+
+    def table(self, _name: str):
+        return self
+
+    def upsert(self, rows: list[dict], on_conflict: str):
+        assert on_conflict == "dish_name"
+        self.upserts.append(rows)
+        return self
+
+    async def execute(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        return None
+
+
+@pytest.fixture
+def fake_table(monkeypatch) -> FakeUpsertTable:
+    table = FakeUpsertTable()
+
+    async def fake_get_client(cls):
+        return table
+
+    monkeypatch.setattr(
+        "src.services.dish_image_writer.SupabaseClient.get_client",
+        classmethod(fake_get_client),
+    )
+    metrics.reset()
+    return table
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_and_flushes_single_upsert(fake_table):
+    DishImageWriteBehind.enqueue("latte", ["https://img/a"])
+    DishImageWriteBehind.enqueue("mocha", ["https://img/b"])
+    DishImageWriteBehind.enqueue("latte", ["https://img/c"])
+
+    flushed = await DishImageWriteBehind.flush()
+
+    assert flushed == 2
+    assert len(fake_table.upserts) == 1
+    rows = {row["dish_name"]: row for row in fake_table.upserts[0]}
+    assert rows["latte"]["img_urls"] == ["https://img/c"]
+    assert rows["latte"]["refreshed_at"] == rows["mocha"]["refreshed_at"]
+    assert metrics.counter("dish_image.write_behind.flushed") == 2
+
+
+@pytest.mark.asyncio
+async def test_write_behind_drops_past_queue_cap(monkeypatch, fake_table):
+    monkeypatch.setattr(settings, "MENU_DISH_IMAGE_WRITE_QUEUE_MAX", 1, raising=False)
+
+    assert DishImageWriteBehind.enqueue("latte", ["https://img/a"]) is True
+    assert DishImageWriteBehind.enqueue("mocha", ["https://img/b"]) is False
+    assert DishImageWriteBehind.enqueue("latte", ["https://img/c"]) is True
+    assert metrics.counter("dish_image.write_behind.dropped") == 1
+
+
+@pytest.mark.asyncio
+async def test_write_behind_worker_drains_on_close(monkeypatch, fake_table):
+    monkeypatch.setattr(
+        settings, "MENU_DISH_IMAGE_WRITE_FLUSH_SECONDS", 60, raising=False
+    )
+
+    async def fake_fetch(_dish_name: str):
+        await asyncio.sleep(0)
+        return ["https://img/fresh"]
+
+    DishImageWriteBehind.start()
+    DishImageWriteBehind.enqueue("latte", ["https://img/a"])
+    DishImageWriteBehind.schedule_refresh("mocha", fake_fetch)
+    await DishImageWriteBehind.close()
+
+    written = [row["dish_name"] for rows in fake_table.upserts for row in rows]
+    assert sorted(written) == ["latte", "mocha"]
+    assert DishImageWriteBehind._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_write_behind_worker_survives_transport_errors(monkeypatch, fake_table):
+    monkeypatch.setattr(
+        settings, "MENU_DISH_IMAGE_WRITE_FLUSH_SECONDS", 60, raising=False
+    )
+    fake_table.error = httpx.ConnectError("down")
+
+    DishImageWriteBehind.start()
+    DishImageWriteBehind.enqueue("latte", ["https://img/a"])
+    DishImageWriteBehind._wakeup.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert not DishImageWriteBehind._worker.done()
+    assert metrics.counter("dish_image.write_behind.dropped") == 1
+
+    DishImageWriteBehind.enqueue("mocha", ["https://img/b"])
+    await DishImageWriteBehind.close()
+
+    batches = [[row["dish_name"] for row in rows] for rows in fake_table.upserts]
+    assert batches == [["latte"], ["mocha"]]
+
+
+@pytest.mark.asyncio
+async def test_refresh_errors_are_counted_not_raised(fake_table):
+    async def failing_fetch(_dish_name: str):
+        raise RuntimeError("boom")
+
+    DishImageWriteBehind.schedule_refresh("latte", failing_fetch)
+    await asyncio.gather(*DishImageWriteBehind._refresh_tasks)
+
+    assert metrics.counter("dish_image.write_behind.refresh_errors") == 1
+    assert DishImageWriteBehind._refreshing == set()
+
+
+@pytest.mark.asyncio
+async def test_schedule_refresh_dedupes_in_flight_names(fake_table):
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def fake_fetch(dish_name: str):
+        calls.append(dish_name)
+        await release.wait()
+        return ["https://img/fresh"]
+
+    DishImageWriteBehind.schedule_refresh("latte", fake_fetch)
+    DishImageWriteBehind.schedule_refresh("latte", fake_fetch)
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*DishImageWriteBehind._refresh_tasks)
+
+    assert calls == ["latte"]
+    assert DishImageWriteBehind._pending == {"latte": ["https://img/fresh"]}
+
+
+@pytest.mark.asyncio
+async def test_flush_falls_back_without_refreshed_at_column(fake_table):
+    fake_table.error = APIError({"code": "PGRST204", "message": "no refreshed_at"})
+
+    DishImageWriteBehind.enqueue("latte", ["https://img/a"])
+    assert await DishImageWriteBehind.flush() == 1
+    DishImageWriteBehind.enqueue("mocha", ["https://img/b"])
+    assert await DishImageWriteBehind.flush() == 1
+
+    assert "refreshed_at" in fake_table.upserts[0][0]
+    assert fake_table.upserts[1:] == [
+        [{"dish_name": "latte", "img_urls": ["https://img/a"]}],
+        [{"dish_name": "mocha", "img_urls": ["https://img/b"]}],
+    ]
+    assert dish_image_columns("dish_name") == "dish_name,img_urls,created_at"
+    assert metrics.counter("dish_image.write_behind.errors") == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_unique_constraint_is_logged_once(monkeypatch, fake_table):
+    errors: list[str] = []
+    monkeypatch.setattr(
+        "src.services.dish_image_writer.logger.error",
+        lambda message, *args: errors.append(message.format(*args)),
+    )
+
+    for name in ("latte", "mocha"):
+        fake_table.error = APIError({"code": "42P10", "message": "no constraint"})
+        DishImageWriteBehind.enqueue(name, ["https://img/a"])
+        assert await DishImageWriteBehind.flush() == 0
+
+    schema_errors = [
+        error for error in errors if "dish_image_write_behind.sql" in error
+    ]
+    assert len(schema_errors) == 1
+    assert "unique constraint" in schema_errors[0]
+    assert metrics.counter("dish_image.write_behind.errors") == 2
+
+
+def test_is_dish_image_row_stale_prefers_refreshed_at(monkeypatch):
+    monkeypatch.setattr(
+        settings, "MENU_DISH_IMAGE_REFRESH_AFTER_SECONDS", 3600, raising=False
+    )
+    now = datetime.datetime.now(datetime.UTC)
+    old = (now - datetime.timedelta(days=5)).isoformat()
+
+    assert is_dish_image_row_stale({"created_at": old}) is True
+    assert (
+        is_dish_image_row_stale({"created_at": old, "refreshed_at": now.isoformat()})
+        is False
+    )
+    assert is_dish_image_row_stale({}) is False
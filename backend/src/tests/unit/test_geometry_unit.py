@@ -0,0 +1,47 @@
+import pytest
+
+from src.services.ocr.geometry import polygon_bounds
+
+
+def _line(x_coords: list[float], y_coords: list[float]) -> dict:
+    return {"content": "x", "polygon": {"x_coords": x_coords, "y_coords": y_coords}}
+
+
+def test_polygon_bounds_handles_quads_and_merged_polygons():
+    lines = [
+        _line([10, 30, 30, 10], [5, 5, 15, 15]),
+        _line([40, 90, 90, 40, 35, 95], [20, 20, 30, 30, 32, 44]),
+    ]
+
+    bounds = polygon_bounds(lines)
+
+    assert bounds.x_min.tolist() == [10.0, 35.0]
+    assert bounds.x_max.tolist() == [30.0, 95.0]
+    assert bounds.y_min.tolist() == [5.0, 20.0]
+    assert bounds.y_max.tolist() == [15.0, 44.0]
+    assert bounds.page_extent() == (95.0, 44.0)
+
+
+def test_polygon_bounds_to_bounding_boxes_matches_image_relative_shape():
+    bounds = polygon_bounds([_line([10, 30, 30, 10], [20, 20, 60, 60])])
+
+    assert bounds.to_bounding_boxes(100, 200) == [
+        {"x": 0.1, "y": 0.1, "w": 0.2, "h": 0.2}
+    ]
+    assert bounds.scaled(*bounds.page_extent()).to_layout_bboxes() == [
+        {
+            "x_min": 0.3333,
+            "x_max": 1.0,
+            "y_min": 0.3333,
+            "y_max": 1.0,
+            "x_center": 0.6667,
+            "y_center": 0.6667,
+        }
+    ]
+
+
+def test_polygon_bounds_empty_and_invalid_input():
+    assert len(polygon_bounds([])) == 0
+    assert polygon_bounds([]).page_extent() == (1.0, 1.0)
+    with pytest.raises(ValueError):
+        polygon_bounds([_line([], [])])
@@ -0,0 +1,48 @@
+import pytest
+
+from src.core.config import settings
+from src.core.vendors.http.client import (
+    HttpClientRegistry,
+    HttpVendor,
+    parse_vendor_limits,
+)
+
+
+def test_parse_vendor_limits_skips_invalid_pairs():
+    limits = parse_vendor_limits(
+        "azure_dip=20, GOOGLE_SEARCH=5,broken,fatsecret=x,zero=0"
+    )
+
+    assert limits == {"azure_dip": 20, "google_search": 5}
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_client_per_vendor_and_applies_limits(monkeypatch):
+    captured_limits = {}
+
+    class FakeAsyncClient:
+        def __init__(self, *, limits, timeout, http2):
+            captured_limits[id(self)] = limits
+            self.is_closed = False
+
+        async def aclose(self):
+            self.is_closed = True
+
+    monkeypatch.setattr("src.core.vendors.http.client.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(
+        settings, "HTTP_CLIENT_VENDOR_LIMITS", "azure_dip=7", raising=False
+    )
+    monkeypatch.setattr(settings, "HTTP_CLIENT_MAX_CONNECTIONS", 11, raising=False)
+    monkeypatch.setattr(HttpClientRegistry, "_clients", {})
+
+    dip_client = HttpClientRegistry.get_client(HttpVendor.AZURE_DIP)
+    google_client = HttpClientRegistry.get_client(HttpVendor.GOOGLE_SEARCH)
+
+    assert HttpClientRegistry.get_client(HttpVendor.AZURE_DIP) is dip_client
+    assert captured_limits[id(dip_client)].max_connections == 7
+    assert captured_limits[id(google_client)].max_connections == 11
+
+    await HttpClientRegistry.close()
+
+    assert dip_client.is_closed
+    assert HttpClientRegistry.get_client(HttpVendor.AZURE_DIP) is not dip_client
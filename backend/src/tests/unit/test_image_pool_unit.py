@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.services.exceptions import PreprocessingBusyError
+from src.services.image_pool import ImagePreprocessPool
+from src.services.image_preprocessing import encode_jpeg_within_limit
+from src.services.menu import process_image
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(ImagePreprocessPool, "_executor", None)
+    monkeypatch.setattr(ImagePreprocessPool, "_in_flight", 0)
+    yield
+    ImagePreprocessPool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_when_workers_and_queue_are_full(monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_PREPROCESS_WORKERS", 1, raising=False)
+    monkeypatch.setattr(settings, "IMAGE_PREPROCESS_MAX_QUEUE", 1, raising=False)
+    release = threading.Event()
+    metrics.reset()
+
+    blocked = [
+        asyncio.create_task(ImagePreprocessPool.run(release.wait, 5)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(PreprocessingBusyError):
+        await ImagePreprocessPool.run(lambda: None)
+    snapshot = metrics.snapshot()
+    assert snapshot["gauges"]["image_preprocess.queue_depth"] == 1
+    assert snapshot["counters"]["image_preprocess.rejected"] == 1
+
+    release.set()
+    await asyncio.gather(*blocked)
+    assert ImagePreprocessPool.has_capacity()
+    assert metrics.snapshot()["gauges"]["image_preprocess.in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_slot_until_cancelled_work_finishes(monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_PREPROCESS_WORKERS", 1, raising=False)
+    monkeypatch.setattr(settings, "IMAGE_PREPROCESS_MAX_QUEUE", 0, raising=False)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _decode() -> None:
+        started.set()
+        release.wait(5)
+
+    caller = asyncio.create_task(ImagePreprocessPool.run(_decode))
+    await asyncio.to_thread(started.wait, 5)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    with pytest.raises(PreprocessingBusyError):
+        await ImagePreprocessPool.run(lambda: None)
+
+    release.set()
+    for _ in range(100):
+        if ImagePreprocessPool.has_capacity():
+            break
+        await asyncio.sleep(0.01)
+    assert ImagePreprocessPool.has_capacity()
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_process_image_off_loop():
+    image = np.full((120, 240, 3), 200, dtype=np.uint8)
+    _, encoded = cv2.imencode(".png", image)
+
+    processed, height, width = await ImagePreprocessPool.run(
+        process_image, encoded.tobytes()
+    )
+
+    assert (height, width) == (120, 240)
+    assert processed[:2] == b"\xff\xd8"
+
+
+def test_encode_jpeg_within_limit_bisects_to_highest_fitting_quality():
+    rng = np.random.default_rng(7)
+    image = rng.integers(0, 255, size=(300, 300, 3), dtype=np.uint8)
+    full_size = len(
+        cv2.imencode(".jpeg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 80])[1]
+    )
+    q40 = len(cv2.imencode(".jpeg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 40])[1])
+    q45 = len(cv2.imencode(".jpeg", image, [int(cv2.IMWRITE_JPEG_QUALITY), 45])[1])
+
+    assert len(encode_jpeg_within_limit(image, max_bytes=full_size)) == full_size
+    assert len(encode_jpeg_within_limit(image, max_bytes=q40 + (q45 - q40) // 2)) == q40
+    assert len(encode_jpeg_within_limit(image, max_bytes=1)) < q40
@@ -0,0 +1,74 @@
+import cv2
+import numpy as np
+
+from src.core.metrics import metrics
+from src.services.image_preprocessing import preprocess_upload, read_jpeg_header
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[:, : width // 2] = 255
+    success, encoded = cv2.imencode(".jpeg", image)
+    assert success
+    return encoded.tobytes()
+
+
+def _with_exif_orientation(jpeg: bytes, orientation: int) -> bytes:
+    tiff = (
+        b"MM\x00\x2a\x00\x00\x00\x08"
+        + b"\x00\x01"
+        + b"\x01\x12\x00\x03\x00\x00\x00\x01"
+        + orientation.to_bytes(2, "big")
+        + b"\x00\x00"
+        + b"\x00\x00\x00\x00"
+    )
+    payload = b"Exif\x00\x00" + tiff
+    app1 = b"\xff\xe1" + (len(payload) + 2).to_bytes(2, "big") + payload
+    return jpeg[:2] + app1 + jpeg[2:]
+
+
+def test_read_jpeg_header_reports_size_and_orientation():
+    header = read_jpeg_header(_with_exif_orientation(_jpeg(64, 32), 6))
+
+    assert (header.width, header.height, header.orientation) == (64, 32, 6)
+    assert header.oriented_size == (32, 64)
+    assert read_jpeg_header(b"\x89PNG\r\n\x1a\n") is None
+
+
+def test_preprocess_upload_passes_through_small_upright_jpeg():
+    jpeg = _jpeg(320, 200)
+
+    processed, height, width = preprocess_upload(
+        jpeg, max_width=2000, max_bytes=len(jpeg)
+    )
+
+    assert processed is jpeg
+    assert (height, width) == (200, 320)
+
+
+def test_preprocess_upload_applies_exif_orientation():
+    rotated = _with_exif_orientation(_jpeg(64, 32), 6)
+
+    processed, height, width = preprocess_upload(
+        rotated, max_width=2000, max_bytes=10**6
+    )
+
+    assert (height, width) == (64, 32)
+    assert cv2.imdecode(np.frombuffer(processed, np.uint8), cv2.IMREAD_COLOR).shape[
+        :2
+    ] == (
+        64,
+        32,
+    )
+
+
+def test_preprocess_upload_uses_reduced_decode_for_oversized_jpeg():
+    metrics.reset()
+
+    processed, height, width = preprocess_upload(
+        _jpeg(880, 40), max_width=400, max_bytes=10**6
+    )
+
+    assert (height, width) == (18, 400)
+    assert metrics.counter("image_preprocess.reduced_decode.x2") == 1
+    assert read_jpeg_header(processed).width == 400
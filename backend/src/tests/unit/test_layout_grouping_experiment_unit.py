@@ -1,11 +1,23 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.core.vendors.llm.client import LLMTransport
 from src.services.ocr.layout_grouping_experiment import (
     SegmentCandidate,
     _resolve_layout_grouping_model,
+    build_and_wash_layout_combined,
     build_fallback_segment_groups,
     build_layout_segments,
     materialize_layout_groups,
     partition_layout_lines_by_label,
 )
+from src.services.ocr.models import (
+    GroupedWashedSegments,
+    SegmentGroup,
+    SegmentWashDecision,
+)
 
 
 def test_build_layout_segments_splits_delimiters_and_trailing_price():
@@ -284,3 +296,95 @@ def test_partition_layout_lines_by_label_uses_role_hint_fallback_for_unlabeled_l
         "selected daily ingredients"
     ]
     assert discarded_lines == []
+
+
+def _combined_dip_lines() -> list[dict]:
+    return [
+        {
+            "content": "TRATTORIA ROMA",
+            "polygon": {"x_coords": [10, 200, 200, 10], "y_coords": [10, 10, 30, 30]},
+        },
+        {
+            "content": "Carbonara - 14",
+            "polygon": {"x_coords": [10, 220, 220, 10], "y_coords": [50, 50, 70, 70]},
+        },
+        {
+            "content": "guanciale, egg yolk and pecorino",
+            "polygon": {"x_coords": [12, 250, 250, 12], "y_coords": [74, 74, 94, 94]},
+        },
+    ]
+
+
+def _fake_openai(monkeypatch, parse):
+    class FakeAsyncOpenAI:
+        def __init__(self, *args, **kwargs):
+            self.responses = SimpleNamespace(parse=parse)
+
+    monkeypatch.setattr("src.core.vendors.llm.client.AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
+
+
+@pytest.mark.asyncio
+async def test_build_and_wash_layout_combined_groups_and_labels_in_one_call(monkeypatch):
+    calls: list[dict] = []
+    parsed = GroupedWashedSegments(
+        Paragraphs=[SegmentGroup(segment_indices=[3])],
+        Segments=[
+            SegmentWashDecision(index=0, label="non_dish"),
+            SegmentWashDecision(index=1, label="dish_title"),
+            SegmentWashDecision(index=2, label="price"),
+            SegmentWashDecision(index=3, label="description"),
+        ],
+    )
+
+    async def _parse(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(output_parsed=parsed)
+
+    _fake_openai(monkeypatch, _parse)
+
+    (
+        dish_lines,
+        price_lines,
+        description_lines,
+        discarded_lines,
+        debug,
+    ) = await build_and_wash_layout_combined(_combined_dip_lines())
+
+    assert len(calls) == 1
+    assert calls[0]["text_format"] is GroupedWashedSegments
+    assert [line["content"] for line in dish_lines] == ["Carbonara"]
+    assert [line["content"] for line in price_lines] == ["14"]
+    assert [line["content"] for line in description_lines] == [
+        "guanciale, egg yolk and pecorino"
+    ]
+    assert [line["content"] for line in discarded_lines] == ["TRATTORIA ROMA"]
+    assert debug["mode"] == "combined_llm"
+    assert debug["groupedSourceLineGroups"] == [[2]]
+
+
+@pytest.mark.asyncio
+async def test_build_and_wash_layout_combined_falls_back_to_role_hints_on_error(
+    monkeypatch,
+):
+    async def _parse(**_kwargs):
+        raise RuntimeError("provider down")
+
+    _fake_openai(monkeypatch, _parse)
+    monkeypatch.setattr(settings, "MENU_LAYOUT_COMBINED_TIMEOUT_SECONDS", 5, raising=False)
+
+    (
+        dish_lines,
+        price_lines,
+        description_lines,
+        discarded_lines,
+        debug,
+    ) = await build_and_wash_layout_combined(_combined_dip_lines())
+
+    assert [line["content"] for line in dish_lines] == ["TRATTORIA ROMA", "Carbonara"]
+    assert [line["content"] for line in price_lines] == ["14"]
+    assert [line["content"] for line in description_lines] == [
+        "guanciale, egg yolk and pecorino"
+    ]
+    assert discarded_lines == []
+    assert debug["mode"] == "combined_error_fallback"
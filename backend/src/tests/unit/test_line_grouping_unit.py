@@ -1,4 +1,8 @@
-from src.services.ocr.line_grouping import build_line_features, heuristic_group_lines
+from src.services.ocr.line_grouping import (
+    build_line_features,
+    confident_title_indices,
+    heuristic_group_lines,
+)
 
 
 def test_heuristic_grouping_single_column_description_pairing():
@@ -92,3 +96,26 @@ def test_build_line_features_detects_yen_price_tokens():
 
     assert features[0].has_price_like_pattern is True
     assert features[1].has_price_like_pattern is False
+
+
+def test_confident_title_indices_skip_descriptions_and_bare_numbers():
+    dip_lines = [
+        {
+            "content": "Margherita - 12",
+            "polygon": {"x_coords": [10, 220], "y_coords": [10, 35]},
+        },
+        {
+            "content": "Fresh basil, tomato sauce and mozzarella",
+            "polygon": {"x_coords": [12, 260], "y_coords": [38, 62]},
+        },
+        {
+            "content": "Tiramisu",
+            "polygon": {"x_coords": [10, 220], "y_coords": [70, 95]},
+        },
+        {
+            "content": "14",
+            "polygon": {"x_coords": [230, 260], "y_coords": [70, 95]},
+        },
+    ]
+
+    assert confident_title_indices(build_line_features(dip_lines)) == [0, 2]
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.services.llm_hedging import RequestHedger, get_llm_hedger, run_hedged
+
+
+def _hedger(**overrides) -> RequestHedger:
+    options = {
+        "percentile": 0.5,
+        "window": 10,
+        "min_samples": 2,
+        "min_delay_seconds": 0.01,
+        "max_ratio": 1.0,
+    }
+    options.update(overrides)
+    return RequestHedger("test", **options)
+
+
+async def _warm_up(hedger: RequestHedger, count: int = 2) -> None:
+    async def _fast() -> str:
+        return "fast"
+
+    for _ in range(count):
+        await hedger.run(_fast)
+
+
+def _counter(name: str) -> int:
+    return metrics.snapshot()["counters"].get(name, 0)
+
+
+@pytest.mark.asyncio
+async def test_hedger_waits_for_samples_before_hedging():
+    hedger = _hedger(min_samples=3)
+    assert hedger.hedge_delay() is None
+
+    await _warm_up(hedger, count=3)
+
+    assert hedger.hedge_delay() == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_over_straggler_and_cancels_it():
+    hedger = _hedger()
+    await _warm_up(hedger)
+    attempts: list[int] = []
+    cancelled: list[int] = []
+    fired_before = _counter("llm.hedge.test.fired")
+    won_before = _counter("llm.hedge.test.won")
+
+    async def _call() -> int:
+        attempt = len(attempts)
+        attempts.append(attempt)
+        try:
+            await asyncio.sleep(5 if attempt == 0 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    assert await hedger.run(_call) == 1
+    await asyncio.sleep(0)
+    assert cancelled == [0]
+    assert _counter("llm.hedge.test.fired") - fired_before == 1
+    assert _counter("llm.hedge.test.won") - won_before == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_that_fails_does_not_beat_running_primary():
+    hedger = _hedger()
+    await _warm_up(hedger)
+    attempts: list[int] = []
+
+    async def _call() -> str:
+        attempt = len(attempts)
+        attempts.append(attempt)
+        if attempt == 1:
+            raise RuntimeError("hedge failed")
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    assert await hedger.run(_call) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_is_capped():
+    hedger = _hedger(max_ratio=0.0)
+    await _warm_up(hedger)
+    attempts = 0
+
+    async def _slow() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    assert await hedger.run(_slow) == "slow"
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_run_hedged_calls_once_when_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGING_ENABLED", False, raising=False)
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await run_hedged("dish_info", "model-a", _call) == "ok"
+    assert calls == 1
+
+
+def test_get_llm_hedger_is_shared_per_operation_and_model():
+    assert get_llm_hedger("dish_info", "model-a") is get_llm_hedger(
+        "dish_info", "model-a"
+    )
+    assert get_llm_hedger("dish_info", "model-a") is not get_llm_hedger(
+        "grouping", "model-a"
+    )
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.services.llm_limiter import (
+    AdaptiveConcurrencyLimiter,
+    get_llm_limiter,
+    is_rate_limit_error,
+)
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+
+def _limiter(**overrides) -> AdaptiveConcurrencyLimiter:
+    options = {"initial": 8, "minimum": 2, "maximum": 10}
+    options.update(overrides)
+    return AdaptiveConcurrencyLimiter("test-model", **options)
+
+
+async def _ok(value: int = 1) -> int:
+    return value
+
+
+@pytest.mark.asyncio
+async def test_limiter_grows_additively_and_stops_at_maximum():
+    # Microsecond calls jitter by far more than 3x; spikes are covered elsewhere.
+    limiter = _limiter(latency_spike_factor=float("inf"))
+
+    for _ in range(9):
+        await limiter.run(_ok)
+    assert limiter.limit == 9
+
+    for _ in range(100):
+        await limiter.run(_ok)
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_limiter_halves_on_throttle_and_retries_until_success(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_LIMITER_BACKOFF_BASE_SECONDS", 0, raising=False)
+    monkeypatch.setattr(settings, "LLM_LIMITER_MAX_RETRIES", 3, raising=False)
+    metrics.reset()
+    limiter = _limiter()
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise FakeRateLimitError()
+        return "done"
+
+    assert await limiter.run(flaky) == "done"
+    assert calls == 2
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+    assert metrics.counter("llm.limiter.test-model.retries") == 1
+    assert metrics.snapshot()["gauges"]["llm.limiter.test-model.window"] == 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_gives_up_after_max_retries_and_passes_other_errors(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_LIMITER_BACKOFF_BASE_SECONDS", 0, raising=False)
+    monkeypatch.setattr(settings, "LLM_LIMITER_MAX_RETRIES", 2, raising=False)
+    limiter = _limiter()
+    calls = 0
+
+    async def throttled() -> None:
+        nonlocal calls
+        calls += 1
+        raise FakeRateLimitError()
+
+    async def broken() -> None:
+        raise ValueError("bad output")
+
+    with pytest.raises(FakeRateLimitError):
+        await limiter.run(throttled)
+    assert calls == 3
+
+    with pytest.raises(ValueError):
+        await limiter.run(broken)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_shrinks_on_latency_spike():
+    limiter = _limiter(latency_spike_factor=3.0)
+    await limiter.run(_ok)
+    limiter._latency_estimate = 0.001
+
+    async def slow() -> None:
+        await asyncio.sleep(0.02)
+
+    await limiter.run(slow)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_keeps_fixed_window_when_not_adaptive(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_LIMITER_BACKOFF_BASE_SECONDS", 0, raising=False)
+    limiter = _limiter(adaptive=False)
+    calls = 0
+
+    async def flaky() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise FakeRateLimitError()
+
+    await limiter.run(flaky)
+    for _ in range(20):
+        await limiter.run(_ok)
+
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_limiter_frees_slot_when_call_is_cancelled():
+    limiter = _limiter(initial=2, minimum=2, maximum=2, adaptive=False)
+    release = asyncio.Event()
+
+    async def blocked() -> None:
+        await release.wait()
+
+    running = [asyncio.create_task(limiter.run(blocked)) for _ in range(2)]
+    queued = asyncio.create_task(limiter.run(_ok))
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+
+    running[0].cancel()
+    assert await queued == 1
+    release.set()
+    await running[1]
+
+    assert limiter.in_flight == 0
+
+
+def test_get_llm_limiter_is_shared_per_model(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_CONCURRENCY", 6, raising=False)
+
+    limiter = get_llm_limiter("model-a")
+
+    assert get_llm_limiter("model-a") is limiter
+    assert get_llm_limiter("model-b") is not limiter
+    assert limiter.limit == 6
+
+
+def test_is_rate_limit_error_reads_status_from_response():
+    class ResponseError(Exception):
+        def __init__(self, status_code: int):
+            self.response = type("Response", (), {"status_code": status_code})()
+
+    assert is_rate_limit_error(FakeRateLimitError())
+    assert is_rate_limit_error(ResponseError(429))
+    assert not is_rate_limit_error(ResponseError(500))
+    assert not is_rate_limit_error(ValueError())
@@ -0,0 +1,56 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import settings
+from src.core.vendors.llm.client import LLMTransport
+from src.main import app
+from src.services.utils import build_chat_openai
+
+
+@pytest.fixture
+def fresh_transport(monkeypatch):
+    monkeypatch.setattr(LLMTransport, "_http_client", None)
+    monkeypatch.setattr(LLMTransport, "_openai_client", None)
+
+
+@pytest.mark.asyncio
+async def test_transport_shares_one_pool_across_call_sites(
+    monkeypatch, fresh_transport
+):
+    monkeypatch.setattr(settings, "LLM_HTTP_MAX_CONNECTIONS", 64, raising=False)
+    monkeypatch.setattr(
+        settings, "LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", 200, raising=False
+    )
+    monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 3, raising=False)
+
+    openai_client = LLMTransport.get_openai_client()
+    http_client = LLMTransport.get_http_client()
+    chat_model = build_chat_openai()
+
+    assert LLMTransport.get_openai_client() is openai_client
+    assert openai_client._client is http_client
+    assert openai_client.max_retries == 3
+    assert chat_model.root_async_client._client is http_client
+    assert chat_model.max_retries == 3
+    pool = http_client._transport._pool
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 64
+
+    await LLMTransport.close()
+
+    assert http_client.is_closed
+    assert LLMTransport.get_http_client() is not http_client
+    assert LLMTransport.get_openai_client() is not openai_client
+    await LLMTransport.close()
+
+
+def test_app_lifespans_leave_chat_model_transport_open(fresh_transport):
+    chat_model = build_chat_openai()
+    http_client = chat_model.http_async_client
+
+    for _ in range(2):
+        with TestClient(app):
+            pass
+
+    assert not http_client.is_closed
+    assert LLMTransport.get_http_client() is http_client
@@ -1,3 +1,5 @@
+import cv2
+import numpy as np
 import pytest
 
 from src.menu_engine.analysis import (
@@ -6,6 +8,9 @@ from src.menu_engine.analysis import (
     MenuFlowDescriptor,
     MenuFlowRegistry,
 )
+from src.menu_engine.near_duplicates import NearDuplicateIndex
+from src.menu_engine.streaming import MenuAnalysisStreamRecorder
+from src.services.deadline import current_deadline
 
 
 class FakeFlow:
@@ -92,3 +97,126 @@ def test_analysis_service_flow_catalog_exposes_default_flow():
         "dip.auto_group.v1",
         "dip.lines_only.v1",
     ]
+
+
+@pytest.mark.asyncio
+async def test_analysis_stream_emits_items_then_meta_for_non_streaming_flow():
+    registry = MenuFlowRegistry(
+        flows=[FakeFlow("dip.auto_group.v1", label="Auto Group")],
+        default_flow_id="dip.auto_group.v1",
+    )
+    service = MenuAnalysisService(registry)
+
+    events = [
+        event
+        async for event in service.analyze_stream(
+            image=b"test-image", accept_language="en"
+        )
+    ]
+
+    assert [event.event for event in events] == ["item", "meta"]
+    assert events[0].data.info["text"] == "Margherita Pizza"
+    assert events[1].data.total_items == 1
+
+
+def test_analysis_stream_rejects_unknown_flow_before_streaming():
+    registry = MenuFlowRegistry(
+        flows=[FakeFlow("dip.auto_group.v1")],
+        default_flow_id="dip.auto_group.v1",
+    )
+    service = MenuAnalysisService(registry)
+
+    with pytest.raises(FlowNotFoundError):
+        service.analyze_stream(
+            image=b"test-image", accept_language="en", flow_hint="nope"
+        )
+
+
+def test_stream_recorder_patches_changed_items_and_skips_unknown():
+    events = []
+    recorder = MenuAnalysisStreamRecorder(events.append)
+    box = {"x": 0.1, "y": 0.1, "w": 0.2, "h": 0.1}
+
+    recorder.on_dish(3, {"text": "Latte", "img_src": None}, box)
+    recorder.on_dish(0, {"text": "Unknown"}, box)
+    recorder.on_dish(3, {"text": "Latte", "img_src": None}, box)
+    recorder.on_dish(3, {"text": "Latte", "img_src": ["https://img/latte"]}, box)
+
+    assert [(event.event, event.data.id) for event in events] == [
+        ("item", 0),
+        ("patch", 0),
+    ]
+    assert recorder.total_items == 1
+
+
+@pytest.mark.asyncio
+async def test_analysis_service_reuses_result_for_near_duplicate_upload():
+    class CountingFlow(FakeFlow):
+        calls = 0
+
+        async def run(self, image: bytes, accept_language: str | None):
+            CountingFlow.calls += 1
+            return await super().run(image, accept_language)
+
+    registry = MenuFlowRegistry(
+        flows=[CountingFlow("dip.auto_group.v1")],
+        default_flow_id="dip.auto_group.v1",
+    )
+    service = MenuAnalysisService(
+        registry,
+        near_duplicate_index=NearDuplicateIndex(
+            max_entries=10, max_distance=6, ttl_seconds=60
+        ),
+    )
+    menu = np.full((400, 300, 3), 240, dtype=np.uint8)
+    for row in range(10):
+        cv2.rectangle(menu, (20, 20 + row * 36), (120 + row * 15, 34 + row * 36), 0, -1)
+    first_upload = cv2.imencode(".jpeg", menu, [int(cv2.IMWRITE_JPEG_QUALITY), 95])[1]
+    second_upload = cv2.imencode(".jpeg", menu, [int(cv2.IMWRITE_JPEG_QUALITY), 50])[1]
+
+    first = await service.analyze(image=first_upload.tobytes(), accept_language="en")
+    second = await service.analyze(image=second_upload.tobytes(), accept_language="en")
+    other_language = await service.analyze(
+        image=second_upload.tobytes(), accept_language="fr"
+    )
+
+    assert CountingFlow.calls == 2
+    assert second == first
+    assert second is not first
+    assert other_language.meta.language == "fr"
+
+
+@pytest.mark.asyncio
+async def test_analysis_service_does_not_reuse_deadline_cut_result():
+    class DeadlineCutFlow(FakeFlow):
+        calls = 0
+
+        async def run(self, image: bytes, accept_language: str | None):
+            # Only translations or image lookups ran out: no item is pending.
+            DeadlineCutFlow.calls += 1
+            current_deadline().exceeded = True
+            return await super().run(image, accept_language)
+
+    registry = MenuFlowRegistry(
+        flows=[DeadlineCutFlow("dip.auto_group.v1")],
+        default_flow_id="dip.auto_group.v1",
+    )
+    service = MenuAnalysisService(
+        registry,
+        near_duplicate_index=NearDuplicateIndex(
+            max_entries=10, max_distance=6, ttl_seconds=60
+        ),
+    )
+    menu = np.full((400, 300, 3), 240, dtype=np.uint8)
+    for row in range(10):
+        cv2.rectangle(menu, (20, 20 + row * 36), (120 + row * 15, 34 + row * 36), 0, -1)
+    upload = cv2.imencode(".jpeg", menu)[1].tobytes()
+
+    first = await service.analyze(
+        image=upload, accept_language="en", deadline_seconds=30
+    )
+    await service.analyze(image=upload, accept_language="en", deadline_seconds=30)
+
+    assert first.meta.deadline_exceeded is True
+    assert first.meta.pending_item_ids == []
+    assert DeadlineCutFlow.calls == 2
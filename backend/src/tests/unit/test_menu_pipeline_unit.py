@@ -1,3 +1,4 @@
+from src.core.config import settings
 from src.services.menu import (
     filter_dip_lines,
     format_polygon,
@@ -132,3 +133,74 @@ def test_merge_grouped_context_into_dishes_attaches_price_line():
 
     assert merged_info[0]["price"] == "$3.99"
     assert merged_boxes[0]["w"] > dish_boxes[0]["w"]
+
+
+def _stacked_dishes_with_two_prices():
+    dish_info = [
+        {"text": "Muffin", "text_translation": "Muffin"},
+        {"text": "Bagel", "text_translation": "Bagel"},
+    ]
+    dish_boxes = [
+        {"x": 0.10, "y": 0.19, "w": 0.20, "h": 0.02},
+        {"x": 0.10, "y": 0.25, "w": 0.20, "h": 0.02},
+    ]
+    price_lines = [{"content": "$3.99"}, {"content": "$4.50"}]
+    price_boxes = [
+        {"x": 0.32, "y": 0.23, "w": 0.08, "h": 0.02},
+        {"x": 0.32, "y": 0.26, "w": 0.08, "h": 0.02},
+    ]
+    return dish_info, dish_boxes, price_lines, price_boxes
+
+
+def test_merge_grouped_context_into_dishes_greedy_assigns_in_reading_order():
+    dish_info, dish_boxes, price_lines, price_boxes = _stacked_dishes_with_two_prices()
+
+    merged_info, _ = merge_grouped_context_into_dishes(
+        dish_info,
+        dish_boxes,
+        [],
+        [],
+        price_lines=price_lines,
+        price_boxes=price_boxes,
+    )
+
+    assert "price" not in merged_info[0]
+    assert merged_info[1]["price"] == "$3.99 / $4.50"
+
+
+def test_merge_grouped_context_into_dishes_optimal_mode_matches_globally(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_MERGE_ASSIGNMENT_MODE", "optimal", raising=False)
+    dish_info, dish_boxes, price_lines, price_boxes = _stacked_dishes_with_two_prices()
+
+    merged_info, merged_boxes = merge_grouped_context_into_dishes(
+        dish_info,
+        dish_boxes,
+        [],
+        [],
+        price_lines=price_lines,
+        price_boxes=price_boxes,
+    )
+
+    assert merged_info[0]["price"] == "$3.99"
+    assert merged_info[1]["price"] == "$4.50"
+    assert merged_boxes[0]["w"] > dish_boxes[0]["w"]
+
+
+def test_merge_grouped_context_into_dishes_optimal_mode_falls_back_to_greedy(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_MERGE_ASSIGNMENT_MODE", "optimal", raising=False)
+    dish_info = [{"text": "Muffin", "text_translation": "Muffin"}]
+    dish_boxes = [{"x": 0.10, "y": 0.20, "w": 0.30, "h": 0.02}]
+    paragraph_info = [{"description": "Blueberry"}, {"description": "Baked daily"}]
+    paragraph_boxes = [
+        {"x": 0.10, "y": 0.225, "w": 0.30, "h": 0.02},
+        {"x": 0.10, "y": 0.25, "w": 0.30, "h": 0.02},
+    ]
+
+    merged_info, _ = merge_grouped_context_into_dishes(
+        dish_info,
+        dish_boxes,
+        paragraph_info,
+        paragraph_boxes,
+    )
+
+    assert merged_info[0]["description"] == "Blueberry Baked daily"
@@ -1,9 +1,27 @@
 import asyncio
 
 import pytest
+from postgrest import APIError
 
 from src.core.config import settings
-from src.services.menu import process_dip_paragraph_results, process_dip_results, run_dip
+from src.core.metrics import metrics
+from src.models import Dish, DishBatch, IndexedDish
+from src.services.deadline import request_deadline
+from src.services.menu import (
+    dish_info_cache_key,
+    get_dish_info_cache,
+    get_dish_image,
+    get_dish_image_lookup_cache,
+    get_dish_info_via_openai,
+    plan_dish_info_batches,
+    prefetch_dish_images,
+    process_dip_paragraph_results,
+    process_dip_results,
+    run_dip,
+    upload_pipeline_with_dip_auto_group_lines,
+    upload_pipeline_with_dip_layout_grouping_experiment,
+)
+from src.services.utils import BATCH_DISH_INFO_PROMPT_VERSION
 
 
 def _line(content: str) -> dict:
@@ -94,31 +112,220 @@ async def test_process_dip_results_preserves_input_order_with_limited_concurrenc
 
 
 @pytest.mark.asyncio
-async def test_process_dip_results_uses_adaptive_concurrency_cap(monkeypatch):
-    seen_concurrency: list[int] = []
+async def test_process_dip_results_caps_llm_calls_at_limiter_window(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    class FakeChain:
+        async def ainvoke(self, inputs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return Dish(dish_name=inputs["dish_name"])
+
+    monkeypatch.setattr("src.services.menu.chain", FakeChain())
+    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_CONCURRENCY", 5, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_ADAPTIVE", False, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 0, raising=False)
 
-    async def fake_get_dish_data(
-        dish_name: str, _accept_language: str, *, include_images: bool = True
-    ):
+    dip_results = [_line(f"Dish {idx}") for idx in range(40)]
+    result = await process_dip_results(dip_results, "en")
+
+    assert [item["text"] for item in result] == [f"Dish {idx}" for idx in range(40)]
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+async def test_process_dip_results_keeps_resolved_info_when_deadline_cuts_image_lookup(
+    monkeypatch,
+):
+    async def fake_get_dish_info_via_openai(dish_name: str, _accept_language: str):
         return _dish_payload(dish_name)
 
-    async def fake_gather_with_limit(coroutines, concurrency_limit: int):
-        seen_concurrency.append(concurrency_limit)
-        return await asyncio.gather(*coroutines)
+    async def slow_attach_dish_image(dish, *, include_images=True, prefetched=None):
+        await asyncio.sleep(5)
+        return dish
 
+    monkeypatch.setattr(
+        "src.services.menu.get_dish_info_via_openai", fake_get_dish_info_via_openai
+    )
+    monkeypatch.setattr("src.services.menu.attach_dish_image", slow_attach_dish_image)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 0, raising=False)
+
+    with request_deadline(0.05) as deadline:
+        result = await process_dip_results(
+            [_line("Latte")], "en", on_resolved=lambda _index, _dish: None
+        )
+
+    assert result[0]["text"] == "Latte"
+    assert result[0]["img_src"] is None
+    assert "pending" not in result[0]
+    assert deadline.exceeded
+
+
+@pytest.mark.asyncio
+async def test_speculative_pipeline_starts_dish_lookups_during_grouping(monkeypatch):
+    lines = [_line("Latte"), _line("Mocha"), _line("with oat milk")]
+    grouping_done = asyncio.Event()
+    started_during_grouping: list[str] = []
+    cancelled: list[str] = []
+
+    async def fake_run_dip(_image: bytes, *, preserve_raw_lines: bool = False):
+        return lines
+
+    async def fake_build_paragraph(_lines):
+        await asyncio.sleep(0.05)
+        grouping_done.set()
+        return [{"content": "Mocha with oat milk", "polygon": lines[1]["polygon"]}], [lines[0]]
+
+    async def fake_get_dish_data(dish_name: str, _accept_language: str, *, include_images=True):
+        if not grouping_done.is_set():
+            started_during_grouping.append(dish_name)
+        try:
+            await asyncio.sleep(0.01 if dish_name == "Latte" else 1)
+        except asyncio.CancelledError:
+            cancelled.append(dish_name)
+            raise
+        return _dish_payload(dish_name)
+
+    async def fake_get_paragraph_data(text: str, _accept_language: str):
+        return {"text": text, "text_translation": text}
+
+    monkeypatch.setattr("src.services.menu.run_dip", fake_run_dip)
+    monkeypatch.setattr("src.services.menu.build_paragraph", fake_build_paragraph)
+    monkeypatch.setattr(
+        "src.services.menu.speculative_title_lines", lambda _lines: [0, 1]
+    )
     monkeypatch.setattr("src.services.menu.get_dish_data", fake_get_dish_data)
-    monkeypatch.setattr("src.services.menu._gather_with_limit", fake_gather_with_limit)
-    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_CONCURRENCY", 12, raising=False)
-    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_ADAPTIVE", True, raising=False)
+    monkeypatch.setattr("src.services.menu.get_paragraph_data", fake_get_paragraph_data)
+    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_SPECULATIVE", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_MODE", "per_item", raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", False, raising=False)
+
+    counters_before = metrics.snapshot()["counters"]
+    result = await upload_pipeline_with_dip_auto_group_lines(b"img", 100, 100, "en")
+
+    assert started_during_grouping == ["Latte", "Mocha"]
+    assert cancelled == ["Mocha"]
+    assert [item["info"]["text"] for item in result["results"]] == ["Latte"]
+    snapshot = metrics.snapshot()
+    for event in ("adopted", "discarded"):
+        counter = f"menu.speculative.{event}"
+        assert snapshot["counters"][counter] - counters_before.get(counter, 0) == 1
+    assert "menu.pipeline.speculative.time_to_first_dish_seconds" in snapshot["summaries"]
+
+
+@pytest.mark.asyncio
+async def test_layout_overlap_runs_lookups_while_wash_runs(monkeypatch):
+    polygon = {"x_coords": [1.0, 2.0], "y_coords": [1.0, 2.0]}
+    individual_lines = [
+        {"content": "Latte", "polygon": polygon, "role_hint": "title"},
+        {"content": "Open daily", "polygon": polygon, "role_hint": "title"},
+    ]
+    paragraphs = [{"content": "Espresso with steamed milk", "polygon": polygon}]
+    wash_done = asyncio.Event()
+    started_during_wash: list[str] = []
+    cancelled: list[str] = []
+
+    async def fake_run_dip(_image: bytes, *, preserve_raw_lines: bool = False):
+        return []
+
+    async def fake_build_paragraph_layout_experiment(_lines):
+        return paragraphs, individual_lines, {"mode": "layout_llm"}
+
+    async def fake_wash_layout_lines(lines):
+        await asyncio.sleep(0.05)
+        wash_done.set()
+        return [lines[0]], [], [lines[2]], [lines[1]], {"mode": "wash_llm"}
+
+    async def fake_get_dish_data(dish_name: str, _accept_language: str, *, include_images=True):
+        if not wash_done.is_set():
+            started_during_wash.append(dish_name)
+        try:
+            await asyncio.sleep(0.01 if dish_name == "Latte" else 1)
+        except asyncio.CancelledError:
+            cancelled.append(dish_name)
+            raise
+        return _dish_payload(dish_name)
+
+    async def fake_get_paragraph_data(text: str, _accept_language: str):
+        if not wash_done.is_set():
+            started_during_wash.append(text)
+        return {"text": text, "text_translation": text}
+
+    monkeypatch.setattr("src.services.menu.run_dip", fake_run_dip)
     monkeypatch.setattr(
-        settings, "MENU_DISH_FANOUT_MAX_CONCURRENCY", 100, raising=False
+        "src.services.menu.build_paragraph_layout_experiment",
+        fake_build_paragraph_layout_experiment,
     )
-    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 999, raising=False)
+    monkeypatch.setattr("src.services.menu.wash_layout_lines", fake_wash_layout_lines)
+    monkeypatch.setattr("src.services.menu.get_dish_data", fake_get_dish_data)
+    monkeypatch.setattr("src.services.menu.get_paragraph_data", fake_get_paragraph_data)
+    monkeypatch.setattr(settings, "MENU_LAYOUT_WASH_OVERLAP", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_MODE", "per_item", raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", False, raising=False)
 
-    dip_results = [_line(f"Dish {idx}") for idx in range(150)]
-    await process_dip_results(dip_results, "en")
+    result = await upload_pipeline_with_dip_layout_grouping_experiment(
+        b"img", 100, 100, "en"
+    )
 
-    assert seen_concurrency == [100]
+    assert started_during_wash == ["Latte", "Open daily", "Espresso with steamed milk"]
+    assert cancelled == ["Open daily"]
+    assert [item["info"]["text"] for item in result["results"]] == ["Latte"]
+    assert "menu.pipeline.layout_overlap.wash_seconds" in metrics.snapshot()["summaries"]
+
+
+@pytest.mark.asyncio
+async def test_layout_overlap_leaves_batched_translation_to_the_fan_out(monkeypatch):
+    polygon = {"x_coords": [1.0, 2.0], "y_coords": [1.0, 2.0]}
+    individual_lines = [{"content": "Latte", "polygon": polygon, "role_hint": "title"}]
+    paragraphs = [{"content": "Espresso with steamed milk", "polygon": polygon}]
+    batch_calls: list[list[str]] = []
+
+    async def fake_run_dip(_image: bytes, *, preserve_raw_lines: bool = False):
+        return []
+
+    async def fake_build_paragraph_layout_experiment(_lines):
+        return paragraphs, individual_lines, {"mode": "layout_llm"}
+
+    async def fake_wash_layout_lines(lines):
+        await asyncio.sleep(0.01)
+        return [lines[0]], [], [lines[1]], [], {"mode": "wash_llm"}
+
+    async def fake_get_dish_data(dish_name: str, _accept_language: str, *, include_images=True):
+        return _dish_payload(dish_name)
+
+    async def fake_translate_batch(texts: list[str], _accept_language: str):
+        batch_calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    async def fail_get_paragraph_data(*_args, **_kwargs):
+        raise AssertionError("batched translation should not speculate per item")
+
+    monkeypatch.setattr("src.services.menu.run_dip", fake_run_dip)
+    monkeypatch.setattr(
+        "src.services.menu.build_paragraph_layout_experiment",
+        fake_build_paragraph_layout_experiment,
+    )
+    monkeypatch.setattr("src.services.menu.wash_layout_lines", fake_wash_layout_lines)
+    monkeypatch.setattr("src.services.menu.get_dish_data", fake_get_dish_data)
+    monkeypatch.setattr("src.services.menu.translate_batch", fake_translate_batch)
+    monkeypatch.setattr("src.services.menu.get_paragraph_data", fail_get_paragraph_data)
+    monkeypatch.setattr(settings, "MENU_LAYOUT_WASH_OVERLAP", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_MODE", "per_item", raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(settings, "MENU_TRANSLATION_MODE", "batched", raising=False)
+
+    result = await upload_pipeline_with_dip_layout_grouping_experiment(
+        b"img", 100, 100, "en"
+    )
+
+    assert batch_calls == [["Espresso with steamed milk"]]
+    assert [item["info"]["text"] for item in result["results"]] == ["Latte"]
 
 
 @pytest.mark.asyncio
@@ -153,29 +360,405 @@ async def test_run_dip_preserve_raw_lines_keeps_numeric_and_unknown(monkeypatch)
 
 
 @pytest.mark.asyncio
-async def test_process_dip_paragraph_results_uses_fixed_concurrency_when_adaptive_disabled(
+async def test_process_dip_paragraph_results_retries_throttled_translations(monkeypatch):
+    attempts: dict[str, int] = {}
+
+    class FakeRateLimitError(Exception):
+        status_code = 429
+
+    async def fake_translate(text: str, _accept_language: str) -> str:
+        attempts[text] = attempts.get(text, 0) + 1
+        if text == "desc 1" and attempts[text] == 1:
+            raise FakeRateLimitError()
+        return text.upper()
+
+    monkeypatch.setattr("src.services.menu.translate", fake_translate)
+    monkeypatch.setattr(settings, "LLM_LIMITER_BACKOFF_BASE_SECONDS", 0, raising=False)
+
+    paragraphs = [_line(f"desc {idx}") for idx in range(3)]
+    result = await process_dip_paragraph_results(paragraphs, "en")
+
+    assert [item["text"] for item in result] == ["DESC 0", "DESC 1", "DESC 2"]
+    assert attempts["desc 1"] == 2
+
+
+@pytest.mark.asyncio
+async def test_process_dip_paragraph_results_dedupes_and_reuses_translation_memory(
     monkeypatch,
 ):
-    seen_concurrency: list[int] = []
+    calls: list[str] = []
+
+    async def fake_translate(text: str, _accept_language: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    monkeypatch.setattr("src.services.menu.translate", fake_translate)
+
+    paragraphs = [_line("house  sauce"), _line("house sauce"), _line("fresh herbs")]
+    first = await process_dip_paragraph_results(paragraphs, "en")
+    second = await process_dip_paragraph_results([_line("fresh herbs")], "en")
+
+    assert [item["text"] for item in first] == ["HOUSE  SAUCE", "HOUSE  SAUCE", "FRESH HERBS"]
+    assert second[0]["text"] == "FRESH HERBS"
+    assert calls == ["house  sauce", "fresh herbs"]
+
+
+@pytest.mark.asyncio
+async def test_process_dip_paragraph_results_batches_with_per_item_fallback(monkeypatch):
+    batch_calls: list[list[str]] = []
+    single_calls: list[str] = []
+
+    async def fake_translate_batch(texts: list[str], _accept_language: str):
+        batch_calls.append(list(texts))
+        # The model skipped "c".
+        return [None if text == "c" else text.upper() for text in texts]
+
+    async def fake_translate(text: str, _accept_language: str) -> str:
+        single_calls.append(text)
+        return f"single:{text}"
 
-    async def fake_get_paragraph_data(dish_name: str, _accept_language: str):
+    monkeypatch.setattr("src.services.menu.translate_batch", fake_translate_batch)
+    monkeypatch.setattr("src.services.menu.translate", fake_translate)
+    monkeypatch.setattr(settings, "MENU_TRANSLATION_MODE", "batched", raising=False)
+    monkeypatch.setattr(settings, "MENU_TRANSLATION_BATCH_MAX_ITEMS", 2, raising=False)
+
+    paragraphs = [_line("a"), _line("b"), _line("a"), _line("c")]
+    result = await process_dip_paragraph_results(paragraphs, "en")
+
+    assert batch_calls == [["a", "b"], ["c"]]
+    assert single_calls == ["c"]
+    assert [item["text"] for item in result] == ["A", "B", "A", "single:c"]
+
+    # The fallback translation of "c" is served from the memory next time.
+    batch_calls.clear()
+    single_calls.clear()
+    second = await process_dip_paragraph_results(paragraphs, "en")
+
+    assert batch_calls == []
+    assert single_calls == []
+    assert [item["text"] for item in second] == ["A", "B", "A", "single:c"]
+
+
+@pytest.mark.asyncio
+async def test_translation_memory_keeps_batched_and_per_item_answers_apart(monkeypatch):
+    single_calls: list[str] = []
+
+    async def fake_translate_batch(texts: list[str], _accept_language: str):
+        return [f"batch:{text}" for text in texts]
+
+    async def fake_translate(text: str, _accept_language: str) -> str:
+        single_calls.append(text)
+        return f"single:{text}"
+
+    monkeypatch.setattr("src.services.menu.translate_batch", fake_translate_batch)
+    monkeypatch.setattr("src.services.menu.translate", fake_translate)
+    monkeypatch.setattr(settings, "MENU_TRANSLATION_MODE", "batched", raising=False)
+    batched = await process_dip_paragraph_results([_line("a")], "en")
+    monkeypatch.setattr(settings, "MENU_TRANSLATION_MODE", "per_item", raising=False)
+    per_item = await process_dip_paragraph_results([_line("a")], "en")
+
+    assert batched[0]["text"] == "batch:a"
+    assert per_item[0]["text"] == "single:a"
+    assert single_calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_run_dip_serves_repeat_uploads_from_cache(monkeypatch):
+    post_calls: list[bytes] = []
+
+    async def fake_post_dip_request(image: bytes) -> str:
+        post_calls.append(image)
+        return "https://fake-dip/result/cached"
+
+    async def fake_retrieve_dip_results(_url: str, timeout: int = 6):
+        return {
+            "status": "succeeded",
+            "analyzeResult": {
+                "pages": [
+                    {
+                        "lines": [
+                            {"content": "Dish Name", "polygon": [10, 10, 30, 10, 30, 20, 10, 20]},
+                        ]
+                    }
+                ]
+            },
+        }
+
+    monkeypatch.setattr(settings, "MENU_DIP_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_DIP_CACHE_BACKEND", "memory", raising=False)
+    monkeypatch.setattr("src.services.menu.post_dip_request", fake_post_dip_request)
+    monkeypatch.setattr("src.services.menu.retrieve_dip_results", fake_retrieve_dip_results)
+
+    first = await run_dip(b"same-image", preserve_raw_lines=True)
+    first[0]["index"] = 0
+    second = await run_dip(b"same-image", preserve_raw_lines=True)
+    await run_dip(b"same-image")
+
+    assert len(post_calls) == 2
+    assert second == [
+        {"content": "Dish Name", "polygon": {"x_coords": [10, 30, 30, 10], "y_coords": [10, 10, 20, 20]}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_dip_results_serves_cached_dish_info_without_fanout(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_get_dish_data(dish_name: str, _accept_language: str, *, include_images: bool = True):
+        calls.append(dish_name)
         return _dish_payload(dish_name)
 
-    async def fake_gather_with_limit(coroutines, concurrency_limit: int):
-        seen_concurrency.append(concurrency_limit)
-        return await asyncio.gather(*coroutines)
+    monkeypatch.setattr("src.services.menu.get_dish_data", fake_get_dish_data)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 0, raising=False)
+    await get_dish_info_cache().set(
+        dish_info_cache_key("Cappuccino", "zh-CN"),
+        {"description": "咖啡", "text": "Cappuccino", "text_translation": "卡布奇诺"},
+    )
+
+    result = await process_dip_results(
+        [_line("CAPPUCCINO - 4.5"), _line("Latte - 4")], "zh-CN"
+    )
+
+    assert calls == ["Latte"]
+    assert result[0]["text_translation"] == "卡布奇诺"
+    assert result[0]["price"] == "4.5"
+    assert result[0]["img_src"] is None
+
 
+@pytest.mark.asyncio
+async def test_get_dish_info_via_openai_caches_unknown_but_not_provider_errors(
+    monkeypatch,
+):
+    class FakeChain:
+        def __init__(self):
+            self.fail = True
+
+        async def ainvoke(self, _inputs):
+            if self.fail:
+                raise RuntimeError("rate limited")
+            return Dish(dish_name="Unknown")
+
+    fake_chain = FakeChain()
+    monkeypatch.setattr("src.services.menu.chain", fake_chain)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", True, raising=False)
     monkeypatch.setattr(
-        "src.services.menu.get_paragraph_data", fake_get_paragraph_data
+        settings, "MENU_DISH_INFO_CACHE_NEGATIVE_TTL_SECONDS", 60, raising=False
     )
-    monkeypatch.setattr("src.services.menu._gather_with_limit", fake_gather_with_limit)
-    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_CONCURRENCY", 7, raising=False)
-    monkeypatch.setattr(settings, "MENU_DISH_FANOUT_ADAPTIVE", False, raising=False)
+    cache_key = dish_info_cache_key("OPEN DAILY", "en")
+
+    failed = await get_dish_info_via_openai("OPEN DAILY", "en")
+    assert failed["text"] == "Unknown"
+    assert await get_dish_info_cache().get(cache_key) is None
+
+    fake_chain.fail = False
+    await get_dish_info_via_openai("OPEN DAILY", "en")
+    assert (await get_dish_info_cache().get(cache_key))["text"] == "Unknown"
+
+
+def test_dish_info_cache_key_ignores_case_but_not_language_or_model(monkeypatch):
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_LLM_MODEL", "model-a", raising=False)
+    base_key = dish_info_cache_key("Cappuccino", "zh-CN")
+
+    assert dish_info_cache_key("CAPPUCCINO", "zh-CN") == base_key
+    assert dish_info_cache_key("Cappuccino", "ja") != base_key
+
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_LLM_MODEL", "model-b", raising=False)
+    assert dish_info_cache_key("Cappuccino", "zh-CN") != base_key
+
+
+def test_plan_dish_info_batches_respects_token_budget_and_max_items():
+    names = ["Latte", "Mocha", "Espresso", "A" * 400, "Tea"]
+
+    assert plan_dish_info_batches(names, token_budget=10_000, max_items=2) == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    assert plan_dish_info_batches(names, token_budget=200, max_items=10) == [
+        [0, 1],
+        [2],
+        [3],
+        [4],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_dip_results_batched_mode_falls_back_for_missing_entries(
+    monkeypatch,
+):
+    batch_inputs: list[str] = []
+    fallback_calls: list[str] = []
+
+    class FakeBatchChain:
+        async def ainvoke(self, inputs):
+            batch_inputs.append(inputs["dish_items"])
+            return DishBatch(
+                dishes=[
+                    IndexedDish(index=0, dish_name="Latte", dish_translation="拿铁"),
+                    IndexedDish(index=0, dish_name="Duplicate"),
+                    IndexedDish(index=7, dish_name="Out of range"),
+                ]
+            )
+
+    class FakeChain:
+        async def ainvoke(self, inputs):
+            fallback_calls.append(inputs["dish_name"])
+            return Dish(dish_name=inputs["dish_name"])
+
+    async def fail_get_dish_data(*_args, **_kwargs):
+        raise AssertionError("batched mode should not use per-item dish data")
+
+    monkeypatch.setattr("src.services.menu.batch_chain", FakeBatchChain())
+    monkeypatch.setattr("src.services.menu.chain", FakeChain())
+    monkeypatch.setattr("src.services.menu.get_dish_data", fail_get_dish_data)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_MODE", "batched", raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 0, raising=False)
+
+    result = await process_dip_results([_line("Latte - 4"), _line("Mocha - 5")], "zh-CN")
+
+    assert len(batch_inputs) == 1
+    assert fallback_calls == ["Mocha"]
+    assert [item["text"] for item in result] == ["Latte", "Mocha"]
+    assert result[0]["text_translation"] == "拿铁"
+    assert result[1]["price"] == "5"
+    batch_key = dish_info_cache_key("Latte", "zh-CN", BATCH_DISH_INFO_PROMPT_VERSION)
+    cached = await get_dish_info_cache().get(batch_key)
+    assert cached["text_translation"] == "拿铁"
+    assert await get_dish_info_cache().get(dish_info_cache_key("Latte", "zh-CN")) is None
+
+    # The next upload is served from both keys: no batch call and no fallback.
+    batch_inputs.clear()
+    fallback_calls.clear()
+    second = await process_dip_results([_line("Latte - 4"), _line("Mocha - 5")], "zh-CN")
+
+    assert batch_inputs == []
+    assert fallback_calls == []
+    assert [item["text"] for item in second] == ["Latte", "Mocha"]
+
+
+class FakeDishQuery:
+    def __init__(self, rows: dict[str, list[str]], names: list[str]):
+        self.rows = rows
+        self.names = names
+
+    async def execute(self):
+        class Response:
+            data = [
+                {"dish_name": name, "img_urls": self.rows[name]}
+                for name in self.names
+                if name in self.rows
+            ]
+
+        return Response()
+
+
+class FakeDishTable:
+    def __init__(self, rows: dict[str, list[str]]):
+        self.rows = rows
+        self.in_queries: list[list[str]] = []
+        self.eq_queries: list[str] = []
+
+    def table(self, _name: str):
+        return self
+
+    def select(self, columns: str):
+        if "refreshed_at" in columns and getattr(self, "without_refreshed_at", False):
+            raise APIError({"code": "42703", "message": "column does not exist"})
+        return self
+
+    def in_(self, _column: str, names: list[str]):
+        self.in_queries.append(list(names))
+        return FakeDishQuery(self.rows, list(names))
+
+    def eq(self, _column: str, name: str):
+        self.eq_queries.append(name)
+        return FakeDishQuery(self.rows, [name])
+
+
+@pytest.mark.asyncio
+async def test_process_dip_results_prefetches_images_in_chunked_bulk_queries(monkeypatch):
+    fake_table = FakeDishTable({"latte": ["https://img/latte"], "green_tea": ["https://img/tea"]})
+    google_calls: list[str] = []
+
+    async def fake_get_client(cls):
+        return fake_table
+
+    async def fake_google(dish_name):
+        google_calls.append(dish_name)
+        return None
+
+    monkeypatch.setattr(
+        "src.services.menu.SupabaseClient.get_client", classmethod(fake_get_client)
+    )
+    monkeypatch.setattr("src.services.menu.query_dish_image_via_google", fake_google)
+    monkeypatch.setattr(settings, "MENU_DISH_INFO_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(settings, "MENU_IMAGE_ENRICH_MAX_ITEMS", 10, raising=False)
+    monkeypatch.setattr(settings, "MENU_DISH_IMAGE_PREFETCH_CHUNK_SIZE", 2, raising=False)
+    for name in ("Latte", "Green Tea", "Scone"):
+        await get_dish_info_cache().set(dish_info_cache_key(name, "en"), _dish_payload(name))
+
+    lines = [_line("Latte"), _line("Green Tea"), _line("Scone")]
+    result = await process_dip_results(lines, "en")
+
+    assert sorted(map(sorted, fake_table.in_queries)) == [["green_tea", "latte"], ["scone"]]
+    assert fake_table.eq_queries == []
+    assert google_calls == ["scone"]
+    assert [item["img_src"] for item in result] == [
+        ["https://img/latte"],
+        ["https://img/tea"],
+        None,
+    ]
+
+    fake_table.in_queries.clear()
+    await process_dip_results(lines, "en")
+
+    assert fake_table.in_queries == []
+    assert fake_table.eq_queries == []
+    assert google_calls == ["scone"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_dish_images_drops_missing_refreshed_at_column(monkeypatch):
+    fake_table = FakeDishTable({"latte": ["https://img/latte"]})
+    fake_table.without_refreshed_at = True
+
+    async def fake_get_client(cls):
+        return fake_table
+
     monkeypatch.setattr(
-        settings, "MENU_DISH_FANOUT_MAX_CONCURRENCY", 100, raising=False
+        "src.services.menu.SupabaseClient.get_client", classmethod(fake_get_client)
     )
 
-    paragraphs = [_line(f"desc {idx}") for idx in range(20)]
-    await process_dip_paragraph_results(paragraphs, "en")
+    assert await prefetch_dish_images(["Latte"]) == {}
+    assert await prefetch_dish_images(["Latte"]) == {"latte": ("https://img/latte",)}
+
+
+@pytest.mark.asyncio
+async def test_get_dish_image_serves_prefetched_urls_after_lookup_cache_eviction(monkeypatch):
+    fake_table = FakeDishTable({})
+    google_calls: list[str] = []
+
+    async def fake_get_client(cls):
+        return fake_table
+
+    async def fake_google(dish_name):
+        google_calls.append(dish_name)
+        return ["https://img/google"]
+
+    monkeypatch.setattr(
+        "src.services.menu.SupabaseClient.get_client", classmethod(fake_get_client)
+    )
+    monkeypatch.setattr("src.services.menu.query_dish_image_via_google", fake_google)
+    get_dish_image_lookup_cache().clear()
+
+    images = await get_dish_image(
+        "Latte",
+        enable_cache=True,
+        prefetched={"latte": ("https://img/a", "https://img/b")},
+    )
 
-    assert seen_concurrency == [7]
+    assert images == ["https://img/a", "https://img/b"]
+    assert google_calls == []
+    assert fake_table.eq_queries == []
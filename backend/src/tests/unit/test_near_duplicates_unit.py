@@ -0,0 +1,77 @@
+import random
+
+import cv2
+import numpy as np
+
+from src.menu_engine.near_duplicates import BKTree, NearDuplicateIndex, hamming_distance
+from src.services.image_preprocessing import perceptual_hash
+
+
+def _menu_like_image(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    image = np.full((480, 360, 3), 245, dtype=np.uint8)
+    for row in range(12):
+        width = int(rng.integers(120, 320))
+        top = 20 + row * 36
+        cv2.rectangle(image, (20, top), (20 + width, top + 14), (30, 30, 30), -1)
+    return image
+
+
+def _encode(image: np.ndarray, quality: int = 90) -> bytes:
+    return cv2.imencode(".jpeg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])[
+        1
+    ].tobytes()
+
+
+def test_bk_tree_search_matches_brute_force():
+    rng = random.Random(3)
+    values = [rng.getrandbits(64) for _ in range(300)]
+    tree = BKTree()
+    for value in values:
+        tree.add(value)
+    query = values[17] ^ 0b1011
+
+    expected = sorted(
+        (hamming_distance(query, value), value)
+        for value in set(values)
+        if hamming_distance(query, value) <= 12
+    )
+    assert tree.search(query, 12) == expected
+    assert tree.search(query, 12)[0] == (3, values[17])
+
+
+def test_near_duplicate_index_isolates_namespaces_and_evicts_lru():
+    index = NearDuplicateIndex(max_entries=2, max_distance=4, ttl_seconds=60)
+    index.put("flow-a", 0b1111, "first")
+    index.put("flow-a", 0xFFFF0000, "second")
+
+    assert index.get("flow-a", 0b1110).value == "first"
+    assert index.get("flow-b", 0b1111) is None
+
+    index.put("flow-a", 0x0F0F0F0F00, "third")
+    assert index.get("flow-a", 0xFFFF0000) is None
+    assert index.get("flow-a", 0b1111).distance == 0
+    assert len(index) == 2
+
+
+def test_near_duplicate_index_honors_ttl():
+    index = NearDuplicateIndex(max_entries=10, max_distance=4, ttl_seconds=0)
+    index.put("flow-a", 0b1111, "stale")
+
+    assert index.get("flow-a", 0b1111) is None
+    assert len(index) == 0
+
+
+def test_perceptual_hash_tolerates_recompression_and_rescaling():
+    image = _menu_like_image(seed=1)
+    original = perceptual_hash(_encode(image))
+    recompressed = perceptual_hash(_encode(image, quality=45))
+    rescaled = perceptual_hash(
+        _encode(cv2.resize(image, (270, 360), interpolation=cv2.INTER_AREA))
+    )
+    other_menu = perceptual_hash(_encode(_menu_like_image(seed=2)))
+
+    assert hamming_distance(original, recompressed) <= 4
+    assert hamming_distance(original, rescaled) <= 6
+    assert hamming_distance(original, other_menu) > 10
+    assert perceptual_hash(b"not an image") is None
@@ -0,0 +1,47 @@
+from src.services.ocr.tokenizer import is_price_only, tokenize_line
+from src.services.utils import clean_dish_name
+
+
+def _segment_texts(text: str) -> list[str]:
+    return [text[start:end] for start, end in tokenize_line(text).segments]
+
+
+def test_tokenize_line_extracts_trailing_price_and_clean_name():
+    tokens = tokenize_line("Pad Thai (vg) - $12.50")
+
+    assert tokens.price_token == "$12.50"
+    assert tokens.cleaned_name == "Pad Thai"
+    assert tokens.has_price_like_pattern is True
+    assert tokens.is_price_only is False
+    assert _segment_texts("Pad Thai (vg) - $12.50") == ["Pad Thai (vg)", "$12.50"]
+
+
+def test_tokenize_line_flags_price_only_and_numeric_only_lines():
+    price = tokenize_line(" 1,200円 ")
+    numeric = tokenize_line("12.5")
+    plain = tokenize_line("Fresh basil and tomato sauce")
+
+    assert price.is_price_only is True
+    assert price.price_token == "1,200円"
+    assert numeric.is_numeric_only is True
+    assert plain.price_token is None
+    assert plain.has_price_like_pattern is False
+    assert plain.cleaned_name == "Fresh basil and tomato sauce"
+
+
+def test_tokenize_line_splits_delimiters_and_repeated_prices():
+    assert _segment_texts("Latte 4.50 Mocha 5.00 | Tea; Juice") == [
+        "Latte",
+        "4.50",
+        "Mocha",
+        "5.00",
+        "Tea",
+        "Juice",
+    ]
+    assert tokenize_line("   ").segments == ()
+
+
+def test_clean_dish_name_and_is_price_only_use_the_tokenizer():
+    assert clean_dish_name("Ramen : 1,200円") == "Ramen"
+    assert is_price_only("$ 7")
+    assert not is_price_only("Ramen 7")